@@ -14,16 +14,22 @@ setuptools.setup(
     url="https://github.com/tommz9/pylinerating",
     packages=setuptools.find_packages("src"),
     package_dir={"": "src"},
+    package_data={"pylinerating": ["data/*.csv"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: Apache Software License",
         "Operating System :: OS Independent",
         "Topic :: Scientific/Engineering",
     ],
-    python_requires=">=3.6",
+    entry_points={"console_scripts": ["pylinerating = pylinerating.cli:main"]},
+    python_requires=">=3.8",
     install_requires=[
         "numpy >= 1.15",
         "pytest",
     ],
+    extras_require={
+        "spatial": ["scipy"],
+        "xarray": ["xarray", "dask[array]"],
+    },
     setup_requires=["pytest > 3", "black > 18"],
 )
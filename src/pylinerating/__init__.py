@@ -2,6 +2,7 @@ __version__ = "1.0.0"
 
 from . import cigre601
 from . import ieee738
+from . import engine
 
 
 def thermal_rating(*args, standard="cigre", **kwargs):
@@ -10,17 +11,18 @@ def thermal_rating(*args, standard="cigre", **kwargs):
     ambient_temperature:   temperature of air in [°C]
     wind_speed:            in [m/s]
     angle_of_attack:       the angle between the wind and the conductor in [°]. 0° is parallel wind, 90° is perpendicular
+                           or a `pylinerating.wind.WindAngle` from the wind direction
     solar_irradiation:     in [W/m^2]
     conductor:             the conductor structure with details about the material. from pylinerating.conductor
     conductor_temperature: the target conductor temperature [°C]
     horizontal_angle:      not used
     elevation:             the see level elevation in [m]
-    standard:              either `cigre` of `ieee`
+    standard:              either `cigre` of `ieee`, or a name registered with `engine.register_engine`
+    precipitation_rate:    rain or wet snow in [mm/h] of water, adds the evaporative cooling. Only with `cigre`
+    relative_humidity:     of the air in [1], for the evaporative cooling
+    out:                   array for the result, without a workspace the intermediates go to a temporary one
+    workspace:             `pylinerating.workspace.Workspace`, reuses the buffers of the intermediates
+    cache:                 `pylinerating.cache.RatingCache`, loads the ratings of unchanged inputs from the disk
     """
 
-    if standard == "cigre":
-        return cigre601.thermal_rating(*args, **kwargs)
-    elif standard == "ieee":
-        return ieee738.thermal_rating(*args, **kwargs)
-
-    raise ValueError("Invalid argument: standard must be cigre or ieee.")
+    return engine.thermal_rating(*args, standard=standard, **kwargs)
@@ -0,0 +1,401 @@
+"""Micro-benchmarks of the rating functions and a guard against regressions.
+
+    python -m pylinerating.benchmark record baseline.json
+    python -m pylinerating.benchmark check baseline.json --tolerance 0.5
+
+`record` measures every function of `BENCHMARKS` on the fixed inputs of
+`benchmark_inputs` and writes the results to a JSON baseline. `check` measures
+them again with the size of the baseline and fails (exit status 1) when a
+function got slower than the tolerance allows or needs more memory.
+
+A benchmark is a function of the inputs and of a `Workspace`, which is created
+for every benchmark by `measure`, so no state is shared between the benchmarks
+or the runs. The functions without a workspace ignore it.
+
+The time is the best of at least `repeat` calls. The memory is the peak of the memory
+traced by `tracemalloc` during one call, numpy reports the memory of its arrays
+to it. `peak_arrays` is the peak in arrays of the input size, the number of the
+temporaries alive at once. The allocations of one call are counted too:
+`allocations` is the number of buffers the workspace allocated and `blocks` the
+number of the array buffers in the `tracemalloc` snapshot after the call that
+were not there before, e.g. the result and anything cached. These do not depend
+on the machine, unlike the time: record the baseline on the machine that
+checks it. The baseline of tests/benchmark_baseline.json is checked by the
+unit tests without the time, record it again when a change is meant to
+allocate more:
+
+    python -m pylinerating.benchmark record tests/benchmark_baseline.json --size 20000
+
+`check` also fails when a function of `SPEEDUPS` is not the given factor faster
+than the function it replaces, e.g. `comparison.compare_standards` against
+two `thermal_rating` calls. The speedups are only checked from the size they
+are claimed for. The time is only checked by tests/test_benchmark.py against a
+baseline recorded on the machine, given in the environment variable
+PYLINERATING_BENCHMARK_BASELINE.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+
+import numpy as np
+
+from . import cigre601
+from . import comparison
+from . import ieee738
+from .conductor import drake_constants
+from .workspace import Workspace
+
+BenchmarkInputs = namedtuple(
+    "BenchmarkInputs",
+    [
+        "ambient_temperature",
+        "wind_speed",
+        "angle_of_attack",
+        "solar_irradiation",
+        "conductor",
+        "conductor_temperature",
+        "horizontal_angle",
+        "elevation",
+    ],
+)
+
+Measurement = namedtuple(
+    "Measurement", ["seconds", "peak_bytes", "peak_arrays", "allocations", "blocks"]
+)
+
+Regression = namedtuple("Regression", ["name", "quantity", "baseline", "current"])
+
+
+def benchmark_inputs(size=100000, seed=0):
+    """The weather of `size` elements, the same for the same seed."""
+
+    rng = np.random.default_rng(seed)
+
+    return BenchmarkInputs(
+        ambient_temperature=rng.uniform(-20, 45, size),
+        wind_speed=rng.uniform(0, 20, size),
+        angle_of_attack=rng.uniform(0, 90, size),
+        solar_irradiation=rng.uniform(0, 1200, size),
+        conductor=drake_constants,
+        conductor_temperature=80.0,
+        horizontal_angle=0,
+        elevation=500,
+    )
+
+
+def _rating(module, in_place=False):
+    def rate(inputs, workspace):
+        return module.thermal_rating(*inputs, workspace=workspace if in_place else None)
+
+    return rate
+
+
+def _cigre_convection(inputs, workspace):
+    return cigre601.power_convective(
+        inputs.ambient_temperature,
+        inputs.wind_speed,
+        inputs.angle_of_attack,
+        inputs.conductor,
+        inputs.conductor_temperature,
+        inputs.horizontal_angle,
+        inputs.elevation,
+    )
+
+
+def _ieee_convection(inputs, workspace):
+    return ieee738.convective_heat_loss(
+        inputs.ambient_temperature,
+        inputs.wind_speed,
+        inputs.angle_of_attack / 180 * np.pi,
+        inputs.conductor,
+        inputs.conductor_temperature,
+        inputs.elevation,
+    )
+
+
+def _separate_standards(inputs, workspace):
+    return cigre601.thermal_rating(*inputs), ieee738.thermal_rating(*inputs)
+
+
+def _radiation(function):
+    def radiate(inputs, workspace):
+        return function(
+            inputs.ambient_temperature, inputs.conductor, inputs.conductor_temperature
+        )
+
+    return radiate
+
+
+# name -> function of `BenchmarkInputs` and a `Workspace`
+BENCHMARKS = {
+    "cigre601.thermal_rating": _rating(cigre601),
+    "cigre601.thermal_rating(workspace)": _rating(cigre601, in_place=True),
+    "cigre601.power_convective": _cigre_convection,
+    "cigre601.power_radiation": _radiation(cigre601.power_radiation),
+    "ieee738.thermal_rating": _rating(ieee738),
+    "ieee738.thermal_rating(workspace)": _rating(ieee738, in_place=True),
+    "ieee738.convective_heat_loss": _ieee_convection,
+    "ieee738.radiated_heat_loss": _radiation(ieee738.radiated_heat_loss),
+    "cigre601+ieee738.thermal_rating": _separate_standards,
+    "comparison.compare_standards": lambda inputs, workspace: (
+        comparison.compare_standards(*inputs)
+    ),
+}
+
+# name -> (the benchmark it replaces, the minimum speedup, from inputs of this size)
+SPEEDUPS = {
+    "comparison.compare_standards": ("cigre601+ieee738.thermal_rating", 1.5, 100000),
+}
+
+
+def measure(function, inputs, repeat=5, min_time=0.2):
+    """The best time of the calls and the memory and allocations of one call.
+
+    The function is called with the inputs and a new `Workspace`, `repeat` times
+    and then until `min_time` seconds passed, the best of many calls of a fast
+    function is stable. The first call is not measured, it fills the caches and
+    the workspace.
+    """
+
+    workspace = Workspace()
+    function(inputs, workspace)
+
+    seconds = np.inf
+    calls = 0
+    end = time.perf_counter() + min_time
+    while calls < repeat or time.perf_counter() < end:
+        start = time.perf_counter()
+        function(inputs, workspace)
+        seconds = min(seconds, time.perf_counter() - start)
+        calls += 1
+
+    allocations = workspace.allocations
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = function(inputs, workspace)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # The data of the arrays, numpy traces it in its own domain
+    arrays = [tracemalloc.DomainFilter(True, np.lib.tracemalloc_domain)]
+    blocks = sum(
+        max(difference.count_diff, 0)
+        for difference in after.filter_traces(arrays).compare_to(
+            before.filter_traces(arrays), "traceback"
+        )
+    )
+    del result
+
+    return Measurement(
+        seconds,
+        peak,
+        peak / inputs.ambient_temperature.nbytes,
+        workspace.allocations - allocations,
+        blocks,
+    )
+
+
+def run(size=100000, repeat=5, seed=0, benchmarks=None, min_time=0.2):
+    """Measure the benchmarks, returns a dict name -> `Measurement`."""
+
+    inputs = benchmark_inputs(size, seed)
+
+    return {
+        name: measure(function, inputs, repeat, min_time)
+        for name, function in (benchmarks or BENCHMARKS).items()
+    }
+
+
+def record(path, size=100000, repeat=5, seed=0, benchmarks=None, min_time=0.2):
+    """Measure the benchmarks and write the baseline, returns the measurements."""
+
+    measurements = run(size, repeat, seed, benchmarks, min_time)
+
+    baseline = {
+        "size": size,
+        "repeat": repeat,
+        "seed": seed,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "functions": {
+            name: measurement._asdict() for name, measurement in measurements.items()
+        },
+    }
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+
+    return measurements
+
+
+def check(
+    path,
+    tolerance=0.5,
+    memory_tolerance=0.05,
+    repeat=None,
+    benchmarks=None,
+    min_time=0.2,
+    speedups=None,
+    timing=True,
+):
+    """Measure the benchmarks of the baseline again, returns the regressions.
+
+    tolerance:        the allowed relative increase of the time
+    memory_tolerance: the allowed relative increase of the peak memory, at least
+                      64 KiB are allowed for the buffers of numpy
+    speedups:         see `SPEEDUPS`, a speedup below the minimum is a regression
+    timing:           False checks only the memory and the allocations, which
+                      do not depend on the machine
+    Any increase of the allocations is a regression. Functions missing in the
+    baseline or in the benchmarks are not checked.
+    """
+
+    with open(path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    benchmarks = benchmarks or BENCHMARKS
+    measurements = run(
+        baseline["size"],
+        repeat or baseline["repeat"],
+        baseline["seed"],
+        # In the order of the benchmarks, the allocations of a function can
+        # depend on the functions before it
+        {
+            name: function
+            for name, function in benchmarks.items()
+            if name in baseline["functions"]
+        },
+        min_time,
+    )
+
+    regressions = []
+    for name, current in measurements.items():
+        recorded = baseline["functions"][name]
+
+        if timing and current.seconds > recorded["seconds"] * (1 + tolerance):
+            regressions.append(
+                Regression(name, "seconds", recorded["seconds"], current.seconds)
+            )
+
+        allowed = recorded["peak_bytes"] + max(
+            recorded["peak_bytes"] * memory_tolerance, 65536
+        )
+        if current.peak_bytes > allowed:
+            regressions.append(
+                Regression(
+                    name, "peak_bytes", recorded["peak_bytes"], current.peak_bytes
+                )
+            )
+
+        for quantity in ["allocations", "blocks"]:
+            # Not in the baselines recorded before they were counted
+            if getattr(current, quantity) > recorded.get(quantity, np.inf):
+                regressions.append(
+                    Regression(
+                        name, quantity, recorded[quantity], getattr(current, quantity)
+                    )
+                )
+
+    speedups = SPEEDUPS if speedups is None else speedups if timing else {}
+    for name, (replaced, minimum, size) in speedups.items():
+        if (
+            name in measurements
+            and replaced in measurements
+            and baseline["size"] >= size
+        ):
+            speedup = measurements[replaced].seconds / measurements[name].seconds
+
+            if speedup < minimum:
+                regressions.append(Regression(name, "speedup", minimum, speedup))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m pylinerating.benchmark",
+        description="Record or check the baseline of the rating benchmarks.",
+    )
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    record_parser = commands.add_parser("record", help="write a new baseline")
+    record_parser.add_argument("baseline")
+    record_parser.add_argument("--size", type=int, default=100000)
+    record_parser.add_argument("--repeat", type=int, default=5)
+
+    check_parser = commands.add_parser("check", help="compare with a baseline")
+    check_parser.add_argument("baseline")
+    check_parser.add_argument("--tolerance", type=float, default=0.5)
+    check_parser.add_argument("--memory-tolerance", type=float, default=0.05)
+
+    for command in [record_parser, check_parser]:
+        command.add_argument(
+            "--min-time",
+            type=float,
+            default=0.2,
+            help="the time of the calls of every function in [s]",
+        )
+
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == "record":
+        measurements = record(
+            arguments.baseline,
+            arguments.size,
+            arguments.repeat,
+            min_time=arguments.min_time,
+        )
+
+        for name, measurement in measurements.items():
+            print(
+                "{:40} {:10.3f} ms {:8.1f} arrays {:4d} allocations {:4d} blocks".format(
+                    name,
+                    measurement.seconds * 1e3,
+                    measurement.peak_arrays,
+                    measurement.allocations,
+                    measurement.blocks,
+                )
+            )
+
+        for name, (replaced, _, size) in SPEEDUPS.items():
+            if arguments.size < size:
+                continue
+
+            print(
+                "{} is {:.2f} times faster than {}".format(
+                    name,
+                    measurements[replaced].seconds / measurements[name].seconds,
+                    replaced,
+                )
+            )
+
+        return 0
+
+    regressions = check(
+        arguments.baseline,
+        arguments.tolerance,
+        arguments.memory_tolerance,
+        min_time=arguments.min_time,
+    )
+
+    for regression in regressions:
+        print(
+            "{}: {} {:.4g} -> {:.4g}".format(*regression),
+            file=sys.stderr,
+        )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
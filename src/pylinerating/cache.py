@@ -0,0 +1,244 @@
+"""A persistent cache of the ratings, keyed by a hash of the inputs.
+
+    cache = RatingCache("~/.cache/pylinerating", max_bytes=2 ** 30)
+    rating = thermal_rating(..., cache=cache)
+
+The key is a hash of the input arrays (their dtypes, shapes and bytes), of the
+conductor including the resistance model, of the other arguments, of the
+standard and of the version of the package. A rating of an unchanged dataset
+is loaded from the directory instead of being calculated again, by another
+process or after a restart too.
+
+Every rating is an `.npy` file. A loaded rating is a new writable array, the
+same as a calculated one. With `mmap=True` it is instead a read only memory map
+of the file and the data is read from the disk only when used. The files are written to a temporary name
+and renamed, readers never see a partial file. When the files exceed
+`max_bytes` the least recently used ones are removed; the modification time
+of a file is its last use.
+
+Resistance models are hashed by value: namedtuples (`LinearResistance`,
+`ACResistance`) by their fields, functions by their bytecode, constants,
+defaults and closures. A function that reads a global that changed between
+runs is not detected, the cache should then be cleared. Other types of the
+inputs raise TypeError.
+"""
+
+import hashlib
+import os
+import tempfile
+import types
+
+import numpy as np
+
+_ignored = ("out", "workspace", "cache")
+
+
+def _update(digest, value):
+    """Feed the value into the hash, recursively."""
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        # A number is the same as an array of it
+        value = np.asarray(value)
+
+    if isinstance(value, (np.ndarray, np.generic)):
+        value = np.ascontiguousarray(value)
+        digest.update(
+            "array {} {};".format(value.dtype.str, value.shape).encode("utf-8")
+        )
+        digest.update(value.view(np.uint8).reshape(-1).data)
+    elif value is None or isinstance(value, (bool, complex, str, bytes)):
+        digest.update("{} {!r};".format(type(value).__name__, value).encode("utf-8"))
+    elif isinstance(value, (tuple, list)):
+        # Namedtuples are hashed with the name of the type
+        digest.update("{} {};".format(type(value).__name__, len(value)).encode("utf-8"))
+        for item in value:
+            _update(digest, item)
+    elif isinstance(value, dict):
+        digest.update("dict {};".format(len(value)).encode("utf-8"))
+        for key in sorted(value):
+            _update(digest, key)
+            _update(digest, value[key])
+    elif isinstance(value, types.FunctionType):
+        _update(
+            digest,
+            (
+                value.__module__,
+                value.__qualname__,
+                value.__defaults__,
+                value.__kwdefaults__,
+                [cell.cell_contents for cell in value.__closure__ or ()],
+            ),
+        )
+        _update_code(digest, value.__code__)
+    elif isinstance(value, types.MethodType):
+        _update(digest, (value.__func__, value.__self__))
+    else:
+        raise TypeError(
+            "Invalid argument: can not hash {}.".format(type(value).__name__)
+        )
+
+
+def _update_code(digest, code):
+    digest.update(code.co_code)
+
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            _update_code(digest, constant)
+        else:
+            _update(digest, constant)
+
+    _update(digest, code.co_names)
+
+
+def input_key(*args, standard="cigre", **kwargs):
+    """The key of a rating, a hex digest of the arguments of `thermal_rating`."""
+
+    from . import __version__
+
+    digest = hashlib.blake2b(digest_size=20)
+    _update(digest, (__version__, standard, list(args)))
+    _update(
+        digest, {key: value for key, value in kwargs.items() if key not in _ignored}
+    )
+
+    return digest.hexdigest()
+
+
+class RatingCache:
+    """Ratings stored as `.npy` files in a directory.
+
+    directory: created if missing
+    max_bytes: the size of the files kept, the least recently used are removed
+    mmap:      load the ratings as read only memory maps instead of copies
+
+    hits, misses: the number of the loaded and of the calculated ratings
+    """
+
+    def __init__(self, directory, max_bytes=2 ** 30, mmap=False):
+        if max_bytes <= 0:
+            raise ValueError("Invalid argument: max_bytes must be positive.")
+
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self.mmap = mmap
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".npy")
+
+    def _entries(self):
+        """(last use, size, path) of the files of the cache."""
+
+        entries = []
+
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npy") and entry.is_file():
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # Removed by another process
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        return entries
+
+    @property
+    def nbytes(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _load(self, key):
+        """The memory map of the rating stored under the key, or None."""
+
+        path = self._path(key)
+
+        try:
+            rating = np.load(path, mmap_mode="r")
+            os.utime(path)
+        except (FileNotFoundError, ValueError):
+            # Missing, evicted meanwhile or unreadable
+            return None
+
+        return rating
+
+    def get(self, key):
+        """The rating stored under the key or None, see `mmap`."""
+
+        rating = self._load(key)
+
+        if rating is None or self.mmap:
+            return rating
+
+        return np.array(rating)
+
+    def put(self, key, rating):
+        """Store the rating under the key and evict the least recently used."""
+
+        rating = np.asarray(rating)
+
+        if rating.nbytes > self.max_bytes:
+            return
+
+        handle, temporary = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        try:
+            with os.fdopen(handle, "wb") as stream:
+                np.save(stream, rating)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used files above `max_bytes`."""
+
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        for _, _, path in self._entries():
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+    def thermal_rating(self, *args, standard="cigre", out=None, **kwargs):
+        """`pylinerating.thermal_rating`, loaded from the cache if stored.
+
+        A loaded rating is copied into `out` if given, see `mmap` otherwise.
+        """
+
+        from . import engine
+        from .workspace import store
+
+        key = input_key(*args, standard=standard, **kwargs)
+        # Copied into `out` straight from the memory map
+        rating = self.get(key) if out is None else self._load(key)
+
+        if rating is not None:
+            self.hits += 1
+
+            if out is None:
+                return rating
+
+            out[...] = rating
+            return out
+
+        self.misses += 1
+        rating = engine.thermal_rating(*args, standard=standard, **kwargs)
+        self.put(key, rating)
+
+        return store(rating, out)
@@ -0,0 +1,248 @@
+"""Calibration of the conductor parameters against line monitor data.
+
+Monitors report the conductor temperature Tc and the current I. In the steady
+state the heat balance of every sample is
+
+    r = I^2 R(Tc) + absortivity * Ps1 - emmisivity * Pr1 - Pc(wind_factor * V)
+
+with the solar heating Ps1 and the radiation Pr1 of a conductor with the
+absorptivity and the emissivity 1, and the convection Pc at the effective wind
+speed. `calibrate` finds the absorptivity, the emissivity and the wind factor
+of every span that minimise the sum of r^2 over the samples of the span.
+
+The residual is linear in the absorptivity and the emissivity, their
+derivatives are Ps1 and -Pr1. The derivative of the convection with respect to
+the wind speed is computed with `sensitivity.Dual` in the same evaluation. All
+spans are solved together by damped Gauss-Newton (Levenberg-Marquardt) steps
+with one 3x3 system per span; converged spans are left out of the next
+iterations.
+
+The samples should be close to the steady state, e.g. averages over 10-15 min
+with a stable current. Missing samples are NaN.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from . import cigre601
+from . import ieee738
+from .conductor import map_arrays
+from .sensitivity import seed
+from .wind import fold_angle
+
+PARAMETERS = ("absortivity", "emmisivity", "wind_factor")
+
+Calibration = namedtuple(
+    "Calibration",
+    ["absortivity", "emmisivity", "wind_factor", "rms_residual", "iterations"],
+)
+
+# The allowed ranges of the parameters
+_bounds = {
+    "absortivity": (0.0, 1.0),
+    "emmisivity": (0.0, 1.0),
+    "wind_factor": (0.0, 10.0),
+}
+
+
+def _cigre_terms(Ta, wind, angle, conductor, Tc, horizontal_angle, elevation):
+    return (
+        cigre601.power_convective(
+            Ta, wind, fold_angle(angle), conductor, Tc, horizontal_angle, elevation
+        ),
+        cigre601.power_radiation(Ta, conductor._replace(emmisivity=1.0), Tc),
+    )
+
+
+def _ieee_terms(Ta, wind, angle, conductor, Tc, horizontal_angle, elevation):
+    return (
+        ieee738.convective_heat_loss(
+            Ta, wind, fold_angle(angle) / 180.0 * np.pi, conductor, Tc, elevation
+        ),
+        ieee738.radiated_heat_loss(Ta, conductor._replace(emmisivity=1.0), Tc),
+    )
+
+
+_terms = {"cigre": _cigre_terms, "ieee": _ieee_terms}
+
+
+def _rows(value, index):
+    """The spans `index` of an input broadcastable to (span, sample)."""
+
+    value = np.asarray(value)
+
+    if value.ndim == 2 and value.shape[0] != 1:
+        return value[index]
+
+    return value
+
+
+def _residuals(parameters, inputs, conductor, standard):
+    """The residuals (span, sample) in [W/m], their jacobian (span, sample, 3)
+    and the mask of the valid samples."""
+
+    Tc, current, Ta, wind, angle, solar, horizontal_angle, elevation = inputs
+    absortivity, emmisivity, wind_factor = [
+        parameters[:, i, np.newaxis] for i in range(3)
+    ]
+
+    (effective_wind,) = seed([wind_factor * wind])
+
+    # The branches not selected by np.maximum can have infinite slopes
+    with np.errstate(divide="ignore", invalid="ignore"):
+        convective, radiation = _terms[standard](
+            Ta, effective_wind, angle, conductor, Tc, horizontal_angle, elevation
+        )
+
+    solar_heating = solar * conductor.diameter
+    joule = current ** 2 * conductor.resistance(Tc)
+
+    residual = (
+        joule + absortivity * solar_heating - emmisivity * radiation - convective.value
+    )
+
+    shape = np.shape(residual)
+    jacobian = np.stack(
+        [
+            np.broadcast_to(solar_heating, shape),
+            np.broadcast_to(-radiation, shape),
+            np.broadcast_to(-convective.derivative[..., 0] * wind, shape),
+        ],
+        axis=-1,
+    )
+
+    # Missing samples do not count
+    valid = np.isfinite(residual) & np.isfinite(jacobian).all(axis=-1)
+
+    return (
+        np.where(valid, residual, 0.0),
+        np.where(valid[..., None], jacobian, 0.0),
+        valid,
+    )
+
+
+def calibrate(
+    conductor_temperature,
+    current,
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    horizontal_angle=0,
+    elevation=500,
+    standard="cigre",
+    parameters=PARAMETERS,
+    max_iterations=30,
+    tolerance=1e-6,
+):
+    """Fit the absorptivity, the emissivity and the wind factor of every span.
+
+    conductor_temperature: the measured conductor temperature in [°C]
+    current:               the measured current in [A]
+    The weather arguments are the same as for `pylinerating.thermal_rating`.
+    All the arrays are broadcastable to (span, sample), per span arguments
+    (e.g. the elevation) have the shape (span, 1).
+
+    parameters: the names of the fitted parameters, a subset of `PARAMETERS`.
+                The others keep the values of the conductor (wind factor 1).
+                The absorptivity and the emissivity of the conductor can be
+                arrays of the shape (span,) or (span, 1), they are also the
+                first guess. The other constants of the conductor can be
+                arrays of the shape (span, 1), e.g. from
+                `ConductorCatalog.conductors(ids[:, None])`.
+    tolerance:  of the change of the parameters
+
+    Returns Calibration with arrays of the shape (span,): the parameters, the
+    root mean square of the residuals in [W/m] and the number of iterations of
+    every span.
+    """
+
+    if standard not in _terms:
+        raise ValueError("Invalid argument: standard must be cigre or ieee.")
+
+    unknown = set(parameters) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(
+            "Invalid argument: unknown parameters {}.".format(
+                ", ".join(sorted(unknown))
+            )
+        )
+
+    inputs = [
+        np.asarray(value, dtype=float)
+        for value in [
+            conductor_temperature,
+            current,
+            ambient_temperature,
+            wind_speed,
+            angle_of_attack,
+            solar_irradiation,
+            horizontal_angle,
+            elevation,
+        ]
+    ]
+    shape = np.broadcast(*inputs).shape
+
+    if len(shape) != 2:
+        raise ValueError("Invalid argument: the data must have 2 dimensions.")
+
+    spans = shape[0]
+    fitted = np.array([name in parameters for name in PARAMETERS])
+    lower, upper = np.array([_bounds[name] for name in PARAMETERS]).T
+
+    result = np.empty((spans, 3))
+    result[:, 0] = np.reshape(conductor.absortivity, -1)
+    result[:, 1] = np.reshape(conductor.emmisivity, -1)
+    result[:, 2] = 1.0
+
+    iterations = np.zeros(spans, dtype=int)
+    damping = np.full(spans, 1e-3)
+
+    active = np.arange(spans)
+    residual, jacobian, _ = _residuals(result, inputs, conductor, standard)
+    cost = np.sum(residual ** 2, axis=-1)
+
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+
+        # The fixed parameters have no column
+        J = jacobian * fitted
+        A = np.einsum("ski,skj->sij", J, J)
+        g = np.einsum("ski,sk->si", J, residual)
+
+        # Levenberg-Marquardt, the pseudo-inverse for the parameters without data
+        A[:, np.arange(3), np.arange(3)] *= 1 + damping[active, None]
+        step = -np.einsum("sij,sj->si", np.linalg.pinv(A), g)
+
+        trial = np.clip(result[active] + step, lower, upper)
+        subset = [_rows(value, active) for value in inputs]
+        subset_conductor = map_arrays(conductor, lambda value: _rows(value, active))
+        trial_residual, trial_jacobian, _ = _residuals(
+            trial, subset, subset_conductor, standard
+        )
+        trial_cost = np.sum(trial_residual ** 2, axis=-1)
+
+        better = trial_cost <= cost
+        change = np.max(np.abs(trial - result[active]), axis=-1)
+
+        result[active[better]] = trial[better]
+        iterations[active] += 1
+        damping[active] = np.where(better, damping[active] / 10, damping[active] * 10)
+
+        residual = np.where(better[:, None], trial_residual, residual)
+        jacobian = np.where(better[:, None, None], trial_jacobian, jacobian)
+        cost = np.where(better, trial_cost, cost)
+
+        # Done when an accepted step is small, or the damping left no step
+        done = (better & (change < tolerance)) | (damping[active] > 1e10)
+        active = active[~done]
+        residual, jacobian, cost = residual[~done], jacobian[~done], cost[~done]
+
+    residual, _, valid = _residuals(result, inputs, conductor, standard)
+    samples = np.maximum(np.sum(valid, axis=-1), 1)
+    rms = np.sqrt(np.sum(residual ** 2, axis=-1) / samples)
+
+    return Calibration(result[:, 0], result[:, 1], result[:, 2], rms, iterations)
@@ -0,0 +1,233 @@
+"""Catalog of standard bare overhead conductors (ACSR, AAAC, ACCC).
+
+The table is read from the packaged `data/conductors.csv` the first time
+`load_catalog` is called and kept for the rest of the session. The entries are
+indexed by the code name and by an integer id:
+
+    catalog = load_catalog()
+    drake = catalog["Drake"]
+
+For a network the conductor of every span is stored as an id. `conductors`
+gathers the constants of all the spans with one fancy-index per column and
+returns a `ConductorConstants` whose fields are arrays, which can be passed to
+`thermal_rating` like a single conductor:
+
+    ids = catalog.ids(span_codes)
+    rating = thermal_rating(ambient, wind, angle, solar, catalog.conductors(ids))
+
+The values in the table are nominal, the resistances are the AC resistances at
+25 °C and 75 °C.
+"""
+
+import csv
+import functools
+import os
+from collections import namedtuple
+
+import numpy as np
+
+from .conductor import ConductorConstants, HeatMaterial, LinearResistance
+
+# Specific heat at 20 °C in [J/(kg K)] and its temperature coefficient in [1/K]
+MATERIALS = {
+    "steel": (481.0, 1.00e-4),
+    "aluminum": (897.0, 3.80e-4),
+    "composite": (1000.0, 0.0),
+    "none": (0.0, 0.0),
+}
+
+ConductorTable = namedtuple(
+    "ConductorTable",
+    [
+        "code",
+        "type",
+        "stranded",
+        "high_rs",
+        "diameter",
+        "resistance_25",
+        "resistance_75",
+        "core_material",
+        "core_mass",
+        "aluminum_mass",
+        "absortivity",
+        "emmisivity",
+    ],
+)
+
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "data", "conductors.csv")
+
+
+def read_table(path):
+    """Parse a conductor table, returns `ConductorTable` of arrays in SI units.
+
+    Lines starting with `#` are comments. The ids must be the row numbers.
+    """
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(line for line in f if not line.startswith("#")))
+
+    if [int(row["id"]) for row in rows] != list(range(len(rows))):
+        raise ValueError("Invalid argument: the ids must be 0, 1, 2, ...")
+
+    def column(name, dtype=float, scale=1.0):
+        values = np.array([row[name] for row in rows], dtype=dtype)
+        return values * scale if dtype is float else values
+
+    for row in rows:
+        if row["core_material"] not in MATERIALS:
+            raise ValueError(
+                "Invalid argument: unknown material {}.".format(row["core_material"])
+            )
+
+    return ConductorTable(
+        code=column("code", dtype=object),
+        type=column("type", dtype=object),
+        stranded=column("stranded", dtype=int).astype(bool),
+        high_rs=column("high_rs", dtype=int).astype(bool),
+        diameter=column("diameter_mm", scale=1e-3),
+        resistance_25=column("resistance_25", scale=1e-3),
+        resistance_75=column("resistance_75", scale=1e-3),
+        core_material=column("core_material", dtype=object),
+        core_mass=column("core_mass"),
+        aluminum_mass=column("aluminum_mass"),
+        absortivity=column("absortivity"),
+        emmisivity=column("emmisivity"),
+    )
+
+
+class ConductorCatalog:
+    """Conductors indexed by the code name and by the integer id."""
+
+    def __init__(self, table):
+        self.table = table
+        self._ids = {code: i for i, code in enumerate(table.code)}
+
+        if len(self._ids) != len(table.code):
+            raise ValueError("Invalid argument: the codes must be unique.")
+
+        core = [MATERIALS[name] for name in table.core_material]
+        self._core_specific_heat = np.array([c for c, _ in core])
+        self._core_beta = np.array([beta for _, beta in core])
+
+    @classmethod
+    def from_csv(cls, path):
+        return cls(read_table(path))
+
+    def __len__(self):
+        return len(self.table.code)
+
+    def __contains__(self, code):
+        return code in self._ids
+
+    @property
+    def codes(self):
+        return list(self.table.code)
+
+    def ids(self, codes):
+        """The ids of an array of code names."""
+
+        try:
+            lookup = [self._ids[code] for code in np.ravel(codes)]
+        except KeyError as e:
+            raise ValueError("Invalid argument: unknown conductor {}.".format(e))
+
+        return np.array(lookup, dtype=np.intp).reshape(np.shape(codes))
+
+    def _id(self, key):
+        if isinstance(key, str):
+            return int(self.ids(key))
+
+        if not 0 <= key < len(self):
+            raise ValueError("Invalid argument: unknown conductor id {}.".format(key))
+
+        return int(key)
+
+    def __getitem__(self, key):
+        """The `ConductorConstants` of one conductor, by code name or id."""
+
+        i = self._id(key)
+        t = self.table
+
+        materials_heat = [
+            HeatMaterial("aluminum", t.aluminum_mass[i], *MATERIALS["aluminum"])
+        ]
+
+        if t.core_mass[i] > 0:
+            materials_heat.insert(
+                0,
+                HeatMaterial(
+                    t.core_material[i],
+                    t.core_mass[i],
+                    self._core_specific_heat[i],
+                    self._core_beta[i],
+                ),
+            )
+
+        return ConductorConstants(
+            stranded=bool(t.stranded[i]),
+            high_rs=bool(t.high_rs[i]),
+            diameter=t.diameter[i],
+            cross_section=None,
+            absortivity=t.absortivity[i],
+            emmisivity=t.emmisivity[i],
+            materials_heat=materials_heat,
+            resistance=LinearResistance(
+                25.0, t.resistance_25[i], 75.0, t.resistance_75[i]
+            ),
+        )
+
+    def columns(self, ids):
+        """`ConductorTable` with every column gathered at `ids`."""
+
+        ids = np.asarray(ids, dtype=np.intp)
+
+        if ids.size and (ids.min() < 0 or ids.max() >= len(self)):
+            raise ValueError("Invalid argument: unknown conductor id.")
+
+        return ConductorTable(*[column[ids] for column in self.table])
+
+    def conductors(self, ids):
+        """`ConductorConstants` with one value per element of `ids` in every field.
+
+        The shape of the fields is the shape of `ids`, use e.g. `ids[:, None]`
+        to broadcast against (span, time) weather. The convection correlations
+        depend on the surface of the conductor, so all the conductors must have
+        the same `stranded` and `high_rs` flags.
+        """
+
+        ids = np.asarray(ids, dtype=np.intp)
+        t = self.columns(ids)
+
+        if t.stranded.size == 0 or (
+            t.stranded.min() != t.stranded.max() or t.high_rs.min() != t.high_rs.max()
+        ):
+            raise ValueError(
+                "Invalid argument: the conductors must have the same surface."
+            )
+
+        c, beta = MATERIALS["aluminum"]
+
+        return ConductorConstants(
+            stranded=bool(t.stranded.flat[0]),
+            high_rs=bool(t.high_rs.flat[0]),
+            diameter=t.diameter,
+            cross_section=None,
+            absortivity=t.absortivity,
+            emmisivity=t.emmisivity,
+            materials_heat=[
+                HeatMaterial(
+                    "core",
+                    t.core_mass,
+                    self._core_specific_heat[ids],
+                    self._core_beta[ids],
+                ),
+                HeatMaterial("aluminum", t.aluminum_mass, c, beta),
+            ],
+            resistance=LinearResistance(25.0, t.resistance_25, 75.0, t.resistance_75),
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def load_catalog(path=DEFAULT_PATH):
+    """The catalog in `path`, parsed once and cached."""
+    return ConductorCatalog.from_csv(path)
@@ -1,13 +1,28 @@
 import numpy as np
 from . import nusselt
-
-
-def horizontal_correction(conductor, angle):
+from .wind import WindAngle, fold_angle, sine
+from .workspace import (
+    buffers,
+    minimal_shape,
+    no_buffers,
+    polynomial,
+    select_regimes,
+    store,
+    workspace_for,
+)
+
+
+def horizontal_correction(conductor, angle, out=None):
     """Equation 24, page 28"""
     if conductor.stranded:
-        return 1 - 1.76e-6 * angle ** 2.5
+        factor, exponent = 1.76e-6, 2.5
     else:
-        return 1 - 1.58e-4 * angle ** 1.5
+        factor, exponent = 1.58e-4, 1.5
+
+    correction = np.power(angle, exponent, out=out)
+    correction = np.multiply(correction, -factor, out=out)
+
+    return np.add(correction, 1, out=out)
 
 
 def specific_heat(conductor, temperature):
@@ -27,34 +42,67 @@ def specific_heat(conductor, temperature):
     return total_heat / total_mass
 
 
-def temperature_film(conductor_temperature, ambient_temperature):
-    return 0.5 * (conductor_temperature + ambient_temperature)
+def temperature_film(conductor_temperature, ambient_temperature, out=None):
+    t_f = np.add(conductor_temperature, ambient_temperature, out=out)
+    return np.multiply(t_f, 0.5, out=out)
 
 
-def thermal_conductivity_of_air(t_f):
+def thermal_conductivity_of_air(t_f, out=None):
     """Section 3.5, eq 18, page 24."""
-    return 2.368e-2 + 7.23e-5 * t_f - 2.763e-8 * t_f ** 2
+    return polynomial(t_f, [2.368e-2, 7.23e-5, -2.763e-8], out)
 
 
-def dynamic_viscosity(t_f):
+def dynamic_viscosity(t_f, out=None):
     """Eq 19, page 25"""
-    return (17.239 + 4.635e-2 * t_f - 2.03e-5 * t_f ** 2) * 1e-6
+    viscosity = polynomial(t_f, [17.239, 4.635e-2, -2.03e-5], out)
+    return np.multiply(viscosity, 1e-6, out=out)
 
 
-def air_density(t_f, elevation):
-    """Eq 20, page 25"""
-    return (1.293 - 1.525e-4 * elevation + 6.379e-9 * elevation ** 2) / (
-        1 + 0.00367 * t_f
-    )
+def air_density(t_f, elevation, out=None, numerator=None):
+    """Eq 20, page 25
+
+    numerator: buffer for the term of the elevation, with its shape
+    """
+
+    numerator = polynomial(elevation, [1.293, -1.525e-4, 6.379e-9], numerator)
 
+    density = np.multiply(t_f, 0.00367, out=out)
+    density = np.add(density, 1, out=out)
 
-def kinematic_viscosity(t_f, elevation):
-    return dynamic_viscosity(t_f) / air_density(t_f, elevation)
+    return np.divide(numerator, density, out=out)
 
 
-def reynolds_number(wind_speed, conductor, t_f, elevation):
+def kinematic_viscosity(t_f, elevation, out=None, buffer=no_buffers, viscosity=None):
+    """The dynamic viscosity over the air density, the first can be passed."""
+
+    if viscosity is None:
+        viscosity = dynamic_viscosity(t_f)
+
+    density = air_density(
+        t_f, elevation, out=out, numerator=buffer("density_numerator", elevation)
+    )
+
+    return np.divide(viscosity, density, out=out)
+
+
+def reynolds_number(wind_speed, conductor, t_f, elevation, out=None, kinematic=None):
     """Page 25, in text."""
-    return wind_speed * conductor.diameter / kinematic_viscosity(t_f, elevation)
+
+    if kinematic is None:
+        kinematic = kinematic_viscosity(t_f, elevation)
+
+    Re = np.multiply(wind_speed, conductor.diameter, out=out)
+
+    return np.divide(Re, kinematic, out=out)
+
+
+def _convection(nusselt_number, conductivity, delta, out=None):
+    """Eq 17, page 24, pi lambda_f (Ts - Ta) Nu."""
+
+    convection = np.multiply(nusselt_number, conductivity, out=out)
+    convection = np.multiply(convection, delta, out=out)
+
+    return np.multiply(convection, np.pi, out=out)
 
 
 def forced_convection(
@@ -64,78 +112,127 @@ def forced_convection(
     conductor,
     conductor_temperature,
     elevation,
+    sin_angle=None,
 ):
+    """Eq 17, the sine of the angle of attack can be passed in `sin_angle`."""
 
     t_f = temperature_film(conductor_temperature, ambient_temperature)
 
     # Page 25, in text
     Re = reynolds_number(wind_speed, conductor, t_f, elevation)
 
-    nusselt_number = nusselt.get_nusselt_function(conductor)(Re, angle_of_attack)
+    nusselt_number = nusselt.get_nusselt_function(conductor)(
+        Re, angle_of_attack, sin_angle
+    )
 
-    # Eq 17, page 24
-    forced_convection = (
-        np.pi
-        * thermal_conductivity_of_air(t_f)
-        * (conductor_temperature - ambient_temperature)
-        * nusselt_number
+    return _convection(
+        nusselt_number,
+        thermal_conductivity_of_air(t_f),
+        np.subtract(conductor_temperature, ambient_temperature),
     )
 
-    return forced_convection
 
+def grashof(
+    conductor,
+    conductor_temperature,
+    ambient_temperature,
+    t_f,
+    elevation,
+    out=None,
+    kinematic=None,
+    delta=None,
+):
+    """From List of Symbols on page 7.
 
-def grashof(conductor, conductor_temperature, ambient_temperature, t_f, elevation):
-    return (
-        conductor.diameter ** 3
-        * (conductor_temperature - ambient_temperature)
-        * 9.807
-        / ((t_f + 273) * kinematic_viscosity(t_f, elevation) ** 2)
-    )
+    kinematic, delta: the kinematic viscosity and Tc - Ta, if already known
+    """
 
+    if kinematic is None:
+        kinematic = kinematic_viscosity(t_f, elevation)
+    if delta is None:
+        delta = np.subtract(conductor_temperature, ambient_temperature)
 
-def prandtl(conductor, conductor_temperature, t_f):
-    return (
-        # TODO: Veruify this assumption
-        1005.0  # specific_heat(conductor, conductor_temperature)  # This should be the specific heat of air?, not the metal
-        * dynamic_viscosity(t_f)
-        / thermal_conductivity_of_air(t_f)
-    )
+    gr = np.add(t_f, 273, out=out)
+    gr = np.multiply(gr, kinematic, out=out)
+    gr = np.multiply(gr, kinematic, out=out)
+    gr = np.divide(delta, gr, out=out)
 
+    return np.multiply(gr, 9.807 * conductor.diameter ** 3, out=out)
 
-def natural_convection(
-    ambient_temperature, conductor, conductor_temperature, horizontal_angle, elevation
+
+def prandtl(
+    conductor, conductor_temperature, t_f, out=None, viscosity=None, conductivity=None
 ):
+    """From List of Symbols on page 7.
 
-    t_f = temperature_film(conductor_temperature, ambient_temperature)
+    viscosity, conductivity: of the air, if already known
+    """
 
-    # From List of Symbols on page 7
-    gr = grashof(conductor, conductor_temperature, ambient_temperature, t_f, elevation)
+    if viscosity is None:
+        viscosity = dynamic_viscosity(t_f)
+    if conductivity is None:
+        conductivity = thermal_conductivity_of_air(t_f)
 
-    # From List of Symbols on page 7
-    pr = prandtl(conductor, conductor_temperature, t_f)
+    # TODO: Veruify this assumption
+    # specific_heat(conductor, conductor_temperature)  # This should be the specific heat of air?, not the metal
+    pr = np.multiply(viscosity, 1005.0, out=out)
 
-    gp = gr * pr
+    return np.divide(pr, conductivity, out=out)
 
-    condition = [gp < 1e2, gp < 1e4, gp < 1e7, gp < 1e12]
 
-    A_choices = [1.02, 0.850, 0.480, 0.125]
-    m_choices = [0.148, 0.188, 0.250, 0.333]
+# The upper bounds of Gr * Pr and the constants A and m of the regimes of the
+# natural convection
+NATURAL_REGIMES = (
+    [1e2, 1e4, 1e7, 1e12],
+    [1.02, 0.850, 0.480, 0.125],
+    [0.148, 0.188, 0.250, 0.333],
+)
 
-    A = np.select(condition, A_choices)
-    m = np.select(condition, m_choices)
 
-    nusselt_number_natural = (
-        A * gp ** m * horizontal_correction(conductor, horizontal_angle)
+def nusselt_natural(gp, conductor, horizontal_angle, out=None, buffer=no_buffers):
+    """Nusselt number for natural convection from the product Gr * Pr.
+
+    Natural convection in section 3.5, with the correction of eq 24.
+    out, buffer: see `pylinerating.workspace`
+    """
+
+    bounds, A_options, m_options = NATURAL_REGIMES
+    A, m = select_regimes(
+        gp,
+        bounds,
+        [A_options, m_options],
+        [buffer("regime_factor"), buffer("regime_exponent")],
+        buffer("regime_mask", dtype=bool),
     )
 
-    natural_convection = (
-        np.pi
-        * thermal_conductivity_of_air(t_f)
-        * (conductor_temperature - ambient_temperature)
-        * nusselt_number_natural
+    nusselt_number = np.power(gp, m, out=out)
+    nusselt_number = np.multiply(nusselt_number, A, out=out)
+
+    correction = horizontal_correction(
+        conductor,
+        horizontal_angle,
+        out=buffer("horizontal_correction", horizontal_angle),
     )
 
-    return natural_convection
+    return np.multiply(nusselt_number, correction, out=out)
+
+
+def natural_convection(
+    ambient_temperature, conductor, conductor_temperature, horizontal_angle, elevation
+):
+
+    t_f = temperature_film(conductor_temperature, ambient_temperature)
+
+    gr = grashof(conductor, conductor_temperature, ambient_temperature, t_f, elevation)
+    pr = prandtl(conductor, conductor_temperature, t_f)
+
+    nusselt_number_natural = nusselt_natural(gr * pr, conductor, horizontal_angle)
+
+    return _convection(
+        nusselt_number_natural,
+        thermal_conductivity_of_air(t_f),
+        np.subtract(conductor_temperature, ambient_temperature),
+    )
 
 
 def power_convective(
@@ -146,53 +243,405 @@ def power_convective(
     conductor_temperature,
     horizontal_angle,
     elevation,
+    out=None,
+    workspace=None,
+    sin_angle=None,
 ):
     """Convective cooling is the higher of forced and natural convection.
 
-    Based on text in "Low wind speeds" on page 28.
+    Based on text in "Low wind speeds" on page 28. The Nusselt numbers are
+    compared, both are multiplied by the same pi lambda_f (Ts - Ta) of eq 17.
+    out, workspace: see `pylinerating.workspace`
+    sin_angle:      the sine of the angle of attack, if it is already known
     """
 
-    forced = forced_convection(
-        ambient_temperature,
-        wind_speed,
-        angle_of_attack,
-        conductor,
-        conductor_temperature,
+    Ta, Tc = ambient_temperature, conductor_temperature
+
+    workspace = workspace_for(out, workspace)
+    if workspace is not None and out is None:
+        out = np.empty(
+            np.broadcast(
+                Ta,
+                wind_speed,
+                angle_of_attack,
+                Tc,
+                horizontal_angle,
+                elevation,
+                conductor.diameter,
+            ).shape
+        )
+
+    # The terms of some inputs only are computed at the shape of these inputs
+    buffer = buffers(workspace, "cigre601.", None if out is None else out.shape)
+
+    t_f = temperature_film(Tc, Ta, out=buffer("film_temperature"))
+    delta = np.subtract(Tc, Ta, out=buffer("temperature_difference"))
+    conductivity = thermal_conductivity_of_air(t_f, out=buffer("conductivity"))
+    viscosity = dynamic_viscosity(t_f, out=buffer("viscosity"))
+    kinematic = kinematic_viscosity(
+        t_f,
         elevation,
+        out=buffer("kinematic_viscosity"),
+        buffer=buffer,
+        viscosity=viscosity,
+    )
+
+    Re = reynolds_number(
+        wind_speed, conductor, t_f, elevation, buffer("reynolds"), kinematic
+    )
+    forced = nusselt.get_nusselt_function(conductor)(
+        Re, angle_of_attack, sin_angle, out=buffer("forced"), buffer=buffer
+    )
+
+    natural = buffer("natural")
+    gp = grashof(
+        conductor, Tc, Ta, t_f, elevation, natural, kinematic=kinematic, delta=delta
+    )
+    pr = prandtl(
+        conductor,
+        Tc,
+        t_f,
+        out=buffer("prandtl"),
+        viscosity=viscosity,
+        conductivity=conductivity,
+    )
+    gp = np.multiply(gp, pr, out=natural)
+    natural = nusselt_natural(gp, conductor, horizontal_angle, natural, buffer)
+
+    nusselt_number = np.maximum(forced, natural, out=out)
+
+    return _convection(nusselt_number, conductivity, delta, out)
+
+
+def _fourth_power(temperature, out=None):
+    """(T + 273) ** 4, the temperature in [°C]."""
+
+    power = np.add(temperature, 273, out=out)
+    power = np.multiply(power, power, out=out)
+
+    return np.multiply(power, power, out=out)
+
+
+def power_radiation(
+    ambient_temperature, conductor, conductor_temperature, out=None, workspace=None
+):
+    """Eq 27, page 30"""
+
+    workspace = workspace_for(out, workspace)
+    if workspace is not None and out is None:
+        out = np.empty(
+            np.broadcast(
+                ambient_temperature, conductor_temperature, conductor.diameter
+            ).shape
+        )
+
+    # The fourth powers at the shapes of the temperatures
+    buffer = buffers(workspace, "cigre601.radiation_", None)
+
+    ambient = _fourth_power(ambient_temperature, buffer("ambient", ambient_temperature))
+    conductor_term = _fourth_power(
+        conductor_temperature, buffer("conductor", conductor_temperature)
+    )
+
+    radiation = np.subtract(conductor_term, ambient, out=out)
+
+    # Stefan-Boltzmann
+    return np.multiply(
+        radiation,
+        np.pi * 5.6697e-8 * conductor.diameter * conductor.emmisivity,
+        out=out,
+    )
+
+
+def power_solar(solar_irradiation, conductor, out=None):
+    """Section 3.3, Eq 8, page 18."""
+
+    solar = np.multiply(solar_irradiation, conductor.absortivity, out=out)
+
+    return np.multiply(solar, conductor.diameter, out=out)
+
+
+def saturation_humidity(temperature, pressure):
+    """The humidity ratio of saturated air in [kg water / kg dry air].
+
+    The vapour pressure by the Magnus formula, the pressure in [Pa].
+    """
+
+    vapour = 610.94 * np.exp(17.625 * temperature / (temperature + 243.04))
+
+    # Above the boiling point the air can take any amount of water
+    return 0.622 * vapour / np.maximum(pressure - vapour, 1e-3 * pressure)
+
+
+def power_precipitation(
+    ambient_temperature,
+    conductor,
+    conductor_temperature,
+    precipitation_rate,
+    convective,
+    elevation=500,
+    relative_humidity=1.0,
+):
+    """Evaporative cooling by rain or wet snow, Pw in [W/m].
+
+    CIGRE-601 leaves the evaporative cooling out of the rating as it is usually
+    small, but mentions it for wet conductors. The water that falls on the
+    conductor, precipitation_rate * D, is heated to the conductor temperature
+    and evaporates as far as the air takes it. The evaporation is limited by the
+    mass transfer, from the convective cooling by the Chilton-Colburn analogy
+    (Lewis number 0.85):
+
+        Pw = m c_w (Ts - Ta) + L_v min(m, Pc / (c_p Le^2/3 (Ts - Ta)) (x_s - x_a))
+
+    precipitation_rate: in [mm/h] of water, falling vertically
+    convective:         Pc in [W/m], from `power_convective`
+    relative_humidity:  of the ambient air, 1 during the precipitation
+    """
+
+    # 1 mm/h is 1 kg of water per m^2 and hour
+    water = precipitation_rate * conductor.diameter / 3600.0
+    delta = conductor_temperature - ambient_temperature
+
+    # The barometric formula, the pressure in [Pa]
+    pressure = 101325.0 * (1 - 2.25577e-5 * elevation) ** 5.25588
+    ambient_humidity = relative_humidity * saturation_humidity(
+        ambient_temperature, pressure
+    )
+    evaporation = (
+        convective
+        / (1005.0 * 0.85 ** (2 / 3) * delta)
+        * (saturation_humidity(conductor_temperature, pressure) - ambient_humidity)
+    )
+
+    # The latent heat at the film temperature
+    latent_heat = 2.501e6 - 2370.0 * temperature_film(
+        conductor_temperature, ambient_temperature
+    )
+
+    # No condensation on the conductor, it is warmer than the air
+    evaporation = np.clip(evaporation, 0.0, water)
+
+    return water * 4186.0 * delta + latent_heat * evaporation
+
+
+def _add_precipitation(
+    balance,
+    convective,
+    ambient_temperature,
+    conductor,
+    conductor_temperature,
+    precipitation_rate,
+    elevation,
+    relative_humidity,
+):
+    """Add the evaporative cooling to the elements of the balance that are wet.
+
+    The balance has the broadcast shape of the inputs and is changed in place.
+    The convective cooling is read at the wet elements only, so `balance` can
+    be the same array as `convective`.
+    """
+
+    wet = np.broadcast_to(precipitation_rate, balance.shape) > 0
+
+    def at_wet(value):
+        if np.ndim(value) == 0:
+            return value
+
+        return np.broadcast_to(value, balance.shape)[wet]
+
+    balance[wet] += power_precipitation(
+        at_wet(ambient_temperature),
+        conductor._replace(diameter=at_wet(conductor.diameter)),
+        at_wet(conductor_temperature),
+        at_wet(precipitation_rate),
+        at_wet(convective),
+        at_wet(elevation),
+        at_wet(relative_humidity),
+    )
+
+    return balance
+
+
+def _is_wet(precipitation_rate):
+    """False without precipitation, the balance is then computed as without it."""
+    return precipitation_rate is not None and bool(
+        np.any(np.asarray(precipitation_rate) > 0)
     )
 
-    natural = natural_convection(
+
+def heat_balance(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    conductor_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    out=None,
+    workspace=None,
+    precipitation_rate=None,
+    relative_humidity=1.0,
+):
+    """The heat that can be removed by the joule heating, Pc + Pr - Ps in [W/m].
+
+    The arguments are the same as for `thermal_rating`. The balance is negative
+    when the solar heating is bigger than the cooling. With a precipitation
+    rate the evaporative cooling Pw of `power_precipitation` is added to the
+    elements where it is positive.
+    """
+
+    # angle_of_attack = np.where(
+    #     angle_of_attack >= 180.0, angle_of_attack - 180, angle_of_attack
+    # )
+
+    if isinstance(angle_of_attack, WindAngle):
+        angle_of_attack, sin_angle, _ = angle_of_attack
+    else:
+        sin_angle = None
+
+    workspace = workspace_for(out, workspace)
+    if workspace is not None:
+        return _heat_balance_into(
+            ambient_temperature,
+            wind_speed,
+            angle_of_attack,
+            solar_irradiation,
+            conductor,
+            conductor_temperature,
+            horizontal_angle,
+            elevation,
+            out,
+            workspace,
+            sin_angle,
+            precipitation_rate,
+            relative_humidity,
+        )
+
+    if sin_angle is None:
+        angle_of_attack = fold_angle(angle_of_attack)
+        sin_angle = sine(angle_of_attack)
+
+    Pc = power_convective(
         ambient_temperature,
+        wind_speed,
+        angle_of_attack,
         conductor,
         conductor_temperature,
         horizontal_angle,
         elevation,
+        sin_angle=sin_angle,
     )
+    Pr = power_radiation(ambient_temperature, conductor, conductor_temperature)
+    Ps = power_solar(solar_irradiation, conductor)
 
-    P = np.maximum(forced, natural)
+    balance = Pr + Pc - Ps
 
-    return P
+    if precipitation_rate is not None:
+        shape = np.broadcast(balance, precipitation_rate, relative_humidity).shape
 
+        # The balance is a new array, copied only to broadcast it
+        if not isinstance(balance, np.ndarray) or balance.shape != shape:
+            balance = np.array(np.broadcast_to(balance, shape), dtype=float)
 
-def power_radiation(ambient_temperature, conductor, conductor_temperature):
-    """Eq 27, page 30"""
-    return (
-        np.pi
-        * conductor.diameter
-        * 5.6697e-8  # Stefan-Boltzmann
-        * conductor.emmisivity
-        * ((conductor_temperature + 273) ** 4 - (ambient_temperature + 273) ** 4)
-    )
+    if _is_wet(precipitation_rate):
+        _add_precipitation(
+            balance,
+            Pc,
+            ambient_temperature,
+            conductor,
+            conductor_temperature,
+            precipitation_rate,
+            elevation,
+            relative_humidity,
+        )
 
+    return store(balance, out)
 
-# def power_joule(self, current):
-#    # TODO: Account for Skin Effect
-#    return current ** 2 * self.material.resistance(self.temperature)
 
+def _heat_balance_into(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    conductor_temperature,
+    horizontal_angle,
+    elevation,
+    out,
+    workspace,
+    sin_angle=None,
+    precipitation_rate=None,
+    relative_humidity=1.0,
+):
+    if out is None:
+        out = np.empty(
+            np.broadcast(
+                ambient_temperature,
+                wind_speed,
+                angle_of_attack,
+                solar_irradiation,
+                conductor_temperature,
+                horizontal_angle,
+                elevation,
+                conductor.diameter,
+                0.0 if precipitation_rate is None else precipitation_rate,
+                relative_humidity,
+            ).shape
+        )
+
+    def buffer(name, *inputs):
+        shape = minimal_shape(*inputs) if inputs else out.shape
+        return workspace.buffer("cigre601." + name, shape)
+
+    if sin_angle is None:
+        angle = fold_angle(
+            angle_of_attack, out=buffer("angle_of_attack", angle_of_attack)
+        )
+        sin_angle = sine(angle, out=buffer("wind_sin", angle_of_attack))
+    else:
+        angle = angle_of_attack
 
-def power_solar(solar_irradiation, conductor):
-    """Section 3.3, Eq 8, page 18."""
-    return conductor.absortivity * solar_irradiation * conductor.diameter
+    power_convective(
+        ambient_temperature,
+        wind_speed,
+        angle,
+        conductor,
+        conductor_temperature,
+        horizontal_angle,
+        elevation,
+        out=out,
+        workspace=workspace,
+        sin_angle=sin_angle,
+    )
+    if _is_wet(precipitation_rate):
+        # out is the convective cooling so far
+        _add_precipitation(
+            out,
+            out,
+            ambient_temperature,
+            conductor,
+            conductor_temperature,
+            precipitation_rate,
+            elevation,
+            relative_humidity,
+        )
+    out += power_radiation(
+        ambient_temperature,
+        conductor,
+        conductor_temperature,
+        out=buffer("radiation"),
+        workspace=workspace,
+    )
+    out -= power_solar(
+        solar_irradiation,
+        conductor,
+        out=buffer(
+            "solar", solar_irradiation, conductor.absortivity, conductor.diameter
+        ),
+    )
+
+    return out
 
 
 def thermal_rating(
@@ -204,26 +653,204 @@ def thermal_rating(
     conductor_temperature=80.0,
     horizontal_angle=0,
     elevation=500,
+    out=None,
+    workspace=None,
+    precipitation_rate=None,
+    relative_humidity=1.0,
 ):
     """Calculate the rating using CIGRE-601.
 
     ambient_temperature:   temperature of air in [°C]
     wind_speed:            in [m/s]
     angle_of_attack:       the angle between the wind and the conductor in [°]. 0° is parallel wind, 90° is perpendicular
+                           or a `pylinerating.wind.WindAngle` from the wind direction
     solar_irradiation:     in [W/m^2]
     conductor:             the conductor structure with details about the material. from pylinerating.conductor
     conductor_temperature: the target conductor temperature [°C]
     horizontal_angle:      not used
     elevation:             the see level elevation in [m]
+    out:                   array for the result, without a workspace the
+                           intermediates go to a temporary one
+    workspace:             `pylinerating.workspace.Workspace` for the intermediates
+    precipitation_rate:    rain or wet snow in [mm/h] of water, adds the
+                           evaporative cooling of `power_precipitation`
+    relative_humidity:     of the air in [1], for the evaporative cooling
     """
 
-    # angle_of_attack = np.where(
-    #     angle_of_attack >= 180.0, angle_of_attack - 180, angle_of_attack
-    # )
+    workspace = workspace_for(out, workspace)
+    if workspace is not None:
+        balance = heat_balance(
+            ambient_temperature,
+            wind_speed,
+            angle_of_attack,
+            solar_irradiation,
+            conductor,
+            conductor_temperature,
+            horizontal_angle,
+            elevation,
+            out=out,
+            workspace=workspace,
+            precipitation_rate=precipitation_rate,
+            relative_humidity=relative_humidity,
+        )
+        balance /= conductor.resistance(conductor_temperature)
+
+        return np.sqrt(balance, out=balance)
+
+    balance = heat_balance(
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor,
+        conductor_temperature,
+        horizontal_angle,
+        elevation,
+        precipitation_rate=precipitation_rate,
+        relative_humidity=relative_humidity,
+    )
 
-    angle_of_attack = 90 - np.abs((angle_of_attack % 180) - 90)
+    current = np.sqrt(balance / conductor.resistance(conductor_temperature))
 
-    Pc = power_convective(
+    return store(current, out)
+
+
+def radial_temperature_difference(
+    total_heat, conductor, core_diameter=0.0, radial_conductivity=2.0
+):
+    """Difference of the core and the surface temperature in [K].
+
+    Radial temperature distribution in CIGRE-601, for a conductor with a core
+    that does not carry current (D1 > 0) and for a solid one (D1 = 0):
+
+        Tc - Ts = P_T / (2 pi lambda) * (1/2 - D1^2 / (D^2 - D1^2) * ln(D / D1))
+        Tc - Ts = P_T / (4 pi lambda)
+
+    total_heat:          the heat gain per unit length P_T in [W/m]
+    core_diameter:       D1 in [m]
+    radial_conductivity: the effective radial thermal conductivity in [W/(m K)],
+                         about 2 for stranded conductors under tension
+    """
+
+    D = conductor.diameter
+    D1 = np.asarray(core_diameter, dtype=float)
+
+    # log(D / D1) * D1^2 goes to 0 with D1, the placeholder only avoids log(0)
+    core_term = D1 ** 2 / (D ** 2 - D1 ** 2) * np.log(D / np.where(D1 > 0, D1, D))
+
+    return total_heat / (2 * np.pi * radial_conductivity) * (0.5 - core_term)
+
+
+def _elementwise(value, shape, index):
+    """The elements of a broadcast input at the flat `index`."""
+
+    if np.ndim(value) == 0:
+        return value
+
+    return np.broadcast_to(value, shape).reshape(-1)[index]
+
+
+def surface_temperature(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    conductor,
+    core_temperature,
+    horizontal_angle=0,
+    elevation=500,
+    core_diameter=0.0,
+    radial_conductivity=2.0,
+    max_iterations=10,
+    tolerance=1e-3,
+):
+    """The surface temperature consistent with the core temperature in [°C].
+
+    In the steady state the heat gain equals the cooling of the surface, so the
+    surface temperature solves Ts = Tc - dT(Pc(Ts) + Pr(Ts)). The iteration
+    starts from Ts = Tc and linearises the cooling around the last Ts. Every
+    element is iterated until it changes by less than `tolerance` [K] and is
+    then left out of the next iterations.
+    """
+
+    angle_of_attack = fold_angle(angle_of_attack)
+
+    inputs = [
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        core_temperature,
+        horizontal_angle,
+        elevation,
+        core_diameter,
+    ]
+    shape = np.broadcast(*inputs, conductor.diameter, conductor.emmisivity).shape
+
+    result = np.array(np.broadcast_to(core_temperature, shape), dtype=float).reshape(-1)
+    active = np.arange(result.size)
+
+    for _ in range(max_iterations):
+        Ta, wind, angle, Tc, horizontal, elevation_, D1 = [
+            _elementwise(value, shape, active) for value in inputs
+        ]
+        subset = conductor._replace(
+            diameter=_elementwise(conductor.diameter, shape, active),
+            emmisivity=_elementwise(conductor.emmisivity, shape, active),
+        )
+
+        Ts = result[active]
+        delta = Ts - Ta
+
+        # The ambient above the core has no natural convection (NaN)
+        with np.errstate(invalid="ignore"):
+            cooling = power_convective(
+                Ta, wind, angle, subset, Ts, horizontal, elevation_
+            ) + power_radiation(Ta, subset, Ts)
+
+        # With the cooling linearised as h (Ts - Ta) the fixed point is explicit,
+        # the plain iteration Ts = Tc - dT(cooling) oscillates at high winds. A
+        # surface at the ambient temperature has no cooling, h = 0.
+        k = radial_temperature_difference(1.0, subset, D1, radial_conductivity)
+        kh = np.divide(
+            k * cooling, delta, out=np.zeros(np.shape(delta)), where=delta != 0
+        )
+        updated = (Tc + kh * Ta) / (1 + kh)
+        result[active] = updated
+
+        # NaN (e.g. the ambient above the core) never converges and runs out
+        active = active[~(np.abs(updated - Ts) < tolerance)]
+
+        if active.size == 0:
+            break
+
+    return result.reshape(shape)
+
+
+def thermal_rating_radial(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    conductor_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    core_diameter=0.0,
+    radial_conductivity=2.0,
+    max_iterations=10,
+    tolerance=1e-3,
+):
+    """Calculate the rating with the radial temperature gradient using CIGRE-601.
+
+    The arguments are the same as for `thermal_rating`, but the
+    `conductor_temperature` is the maximum (core) temperature. The cooling is
+    evaluated at the surface temperature and the resistance at the average of
+    the core and the surface temperature.
+
+    core_diameter, radial_conductivity: see `radial_temperature_difference`
+    max_iterations, tolerance:          see `surface_temperature`
+    """
+
+    Ts = surface_temperature(
         ambient_temperature,
         wind_speed,
         angle_of_attack,
@@ -231,10 +858,24 @@ def thermal_rating(
         conductor_temperature,
         horizontal_angle,
         elevation,
+        core_diameter,
+        radial_conductivity,
+        max_iterations,
+        tolerance,
     )
-    Pr = power_radiation(ambient_temperature, conductor, conductor_temperature)
-    Ps = power_solar(solar_irradiation, conductor)
-
-    current = np.sqrt((Pr + Pc - Ps) / conductor.resistance(conductor_temperature))
 
-    return current
+    # NaN where the surface temperature did not converge
+    with np.errstate(invalid="ignore"):
+        balance = heat_balance(
+            ambient_temperature,
+            wind_speed,
+            angle_of_attack,
+            solar_irradiation,
+            conductor,
+            Ts,
+            horizontal_angle,
+            elevation,
+        )
+        average = 0.5 * (conductor_temperature + Ts)
+
+        return np.sqrt(balance / conductor.resistance(average))
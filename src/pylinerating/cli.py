@@ -0,0 +1,359 @@
+"""Command line batch rating of weather files.
+
+    pylinerating weather/*.csv --conductor Hawk --standard ieee --jobs 4
+
+Every input file is rated into an output file named <name>.rating.<ext>, next
+to the input or in --output-dir. Files named *.rating.* are outputs and are
+skipped, inputs with the same output (the same name in different directories
+with --output-dir) are rejected before the batch starts. The weather columns are `COLUMNS`, other names
+can be mapped with --column ambient_temperature=temp. The formats:
+
+    .csv  comma separated with a header line, the output has the columns of
+          the input and `rating`, the input can not have a column `rating`
+    .npy  a structured array with the columns as fields, or an (n, 4) array
+          with the columns in the order of `COLUMNS`; the output is the rating
+    .npz  one array per column, the output has the arrays of the input and
+          `rating`
+
+An output is written to a temporary file and renamed when it is complete, so an
+output that exists is complete. With --resume the inputs that already have an
+output are skipped and an interrupted batch continues where it stopped.
+"""
+
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from . import engine
+from .catalog import load_catalog
+
+COLUMNS = [
+    "ambient_temperature",
+    "wind_speed",
+    "angle_of_attack",
+    "solar_irradiation",
+]
+
+RatingSettings = namedtuple(
+    "RatingSettings",
+    [
+        "conductor",
+        "conductor_temperature",
+        "horizontal_angle",
+        "elevation",
+        "standard",
+        "columns",
+    ],
+)
+
+FileResult = namedtuple("FileResult", ["path", "output", "elements", "seconds"])
+
+
+def read_columns(path):
+    """The columns of a weather file as a dict name -> 1-d array."""
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".csv":
+        with open(path, "r", encoding="utf-8") as f:
+            names = [name.strip() for name in f.readline().split(",")]
+            data = np.loadtxt(f, delimiter=",", ndmin=2).reshape(-1, len(names))
+
+        return {name: data[:, i] for i, name in enumerate(names)}
+
+    if extension == ".npy":
+        data = np.load(path)
+
+        if data.dtype.names:
+            return {name: data[name] for name in data.dtype.names}
+
+        if data.ndim != 2 or data.shape[1] != len(COLUMNS):
+            raise ValueError(
+                "Invalid argument: {} must be structured or have {} columns.".format(
+                    path, len(COLUMNS)
+                )
+            )
+
+        return {name: data[:, i] for i, name in enumerate(COLUMNS)}
+
+    if extension == ".npz":
+        with np.load(path) as data:
+            return {name: data[name] for name in data.files}
+
+    raise ValueError("Invalid argument: unknown format of {}.".format(path))
+
+
+def write_columns(path, columns, rating):
+    """Write the rating next to the input columns in the format of `path`.
+
+    The file is complete when it appears, it is renamed from a temporary file.
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension != ".npy" and "rating" in columns:
+        raise ValueError(
+            "Invalid argument: the input of {} has a column rating.".format(path)
+        )
+
+    temporary = path + ".partial"
+
+    with open(temporary, "wb") as f:
+        if extension == ".csv":
+            names = list(columns) + ["rating"]
+            np.savetxt(
+                f,
+                np.column_stack(list(columns.values()) + [rating]),
+                delimiter=",",
+                header=",".join(names),
+                comments="",
+                fmt="%.10g",
+            )
+        elif extension == ".npy":
+            np.save(f, rating)
+        else:
+            np.savez(f, rating=rating, **columns)
+
+    os.replace(temporary, path)
+
+
+def output_path(path, output_dir=None):
+    directory, name = os.path.split(path)
+    stem, extension = os.path.splitext(name)
+
+    return os.path.join(
+        directory if output_dir is None else output_dir,
+        "{}.rating{}".format(stem, extension),
+    )
+
+
+def is_output(path):
+    """True for the name of an output, <name>.rating.<ext>."""
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+
+    return os.path.splitext(stem)[1] == ".rating"
+
+
+def batch_tasks(paths, output_dir=None):
+    """The (input, output) pairs of the files that are not outputs.
+
+    Raises ValueError when inputs have the same output.
+    """
+
+    tasks = [(path, output_path(path, output_dir)) for path in paths]
+    tasks = [(path, output) for path, output in tasks if not is_output(path)]
+
+    inputs = {}
+    for path, output in tasks:
+        inputs.setdefault(os.path.normpath(output), []).append(path)
+
+    duplicates = [paths for paths in inputs.values() if len(paths) > 1]
+    if duplicates:
+        raise ValueError(
+            "Invalid argument: the files {} have the same output.".format(
+                "; ".join(", ".join(paths) for paths in duplicates)
+            )
+        )
+
+    return tasks
+
+
+def rate_file(path, output, settings):
+    """Rate one file into `output`, returns a `FileResult`."""
+
+    start = time.perf_counter()
+
+    columns = read_columns(path)
+    names = dict(zip(COLUMNS, COLUMNS))
+    names.update(settings.columns)
+
+    missing = [name for name in names.values() if name not in columns]
+    if missing:
+        raise ValueError(
+            "Invalid argument: {} has no column {}.".format(path, ", ".join(missing))
+        )
+
+    with np.errstate(invalid="ignore"):
+        rating = engine.thermal_rating(
+            *[columns[names[argument]] for argument in COLUMNS],
+            load_catalog()[settings.conductor],
+            conductor_temperature=settings.conductor_temperature,
+            horizontal_angle=settings.horizontal_angle,
+            elevation=settings.elevation,
+            standard=settings.standard,
+        )
+
+    write_columns(output, columns, np.asarray(rating, dtype=float))
+
+    return FileResult(path, output, np.size(rating), time.perf_counter() - start)
+
+
+def run_batch(paths, settings, jobs=1, output_dir=None, resume=False, report=None):
+    """Rate the files, `jobs` of them at once in worker processes.
+
+    report: called with (done, total, FileResult or exception, path) for every
+            finished file
+    Returns the list of `FileResult` and the dict of the failed paths -> error.
+    The outputs are skipped, see `batch_tasks`.
+    """
+
+    report = report or (lambda *args: None)
+
+    tasks = batch_tasks(paths, output_dir)
+    if resume:
+        tasks = [(path, output) for path, output in tasks if not os.path.exists(output)]
+
+    results = []
+    failures = {}
+
+    def finish(path, rate):
+        try:
+            result = rate()
+        except Exception as error:
+            failures[path] = error
+            report(len(results) + len(failures), len(tasks), error, path)
+        else:
+            results.append(result)
+            report(len(results) + len(failures), len(tasks), result, path)
+
+    if jobs == 1:
+        for path, output in tasks:
+            finish(path, lambda: rate_file(path, output, settings))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(jobs) as pool:
+            futures = {
+                pool.submit(rate_file, path, output, settings): path
+                for path, output in tasks
+            }
+
+            for future in concurrent.futures.as_completed(futures):
+                finish(futures[future], future.result)
+
+    return results, failures
+
+
+def _column_mapping(value):
+    argument, _, name = value.partition("=")
+
+    if argument not in COLUMNS or not name:
+        raise argparse.ArgumentTypeError(
+            "expected one of {} = column name".format(", ".join(COLUMNS))
+        )
+
+    return argument, name
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="pylinerating",
+        description="Calculate the rating of weather files (CSV, NPY or NPZ).",
+    )
+    parser.add_argument("files", nargs="+", help="the weather files to rate")
+    parser.add_argument(
+        "--standard", default="cigre", choices=engine.available_engines()
+    )
+    parser.add_argument(
+        "--conductor", default="Drake", help="the code in the conductor catalog"
+    )
+    parser.add_argument("--conductor-temperature", type=float, default=80.0)
+    parser.add_argument("--horizontal-angle", type=float, default=0.0)
+    parser.add_argument("--elevation", type=float, default=500.0)
+    parser.add_argument(
+        "--column",
+        type=_column_mapping,
+        action="append",
+        default=[],
+        metavar="ARGUMENT=NAME",
+        help="read the argument from a column of another name",
+    )
+    parser.add_argument("--output-dir", help="default: next to the input files")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1, help="the number of files rated at once"
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="skip the files with an output"
+    )
+    parser.add_argument("--quiet", "-q", action="store_true")
+
+    arguments = parser.parse_args(argv)
+
+    if arguments.conductor not in load_catalog():
+        parser.error("unknown conductor {}".format(arguments.conductor))
+
+    if arguments.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    try:
+        batch_tasks(arguments.files, arguments.output_dir)
+    except ValueError as error:
+        parser.error(str(error))
+
+    return arguments
+
+
+def main(argv=None):
+    """The console script, returns the exit status."""
+
+    arguments = parse_arguments(argv)
+
+    settings = RatingSettings(
+        conductor=arguments.conductor,
+        conductor_temperature=arguments.conductor_temperature,
+        horizontal_angle=arguments.horizontal_angle,
+        elevation=arguments.elevation,
+        standard=arguments.standard,
+        columns=dict(arguments.column),
+    )
+
+    def report(done, total, result, path):
+        if isinstance(result, Exception):
+            print("[{}/{}] {}: {}".format(done, total, path, result), file=sys.stderr)
+        elif not arguments.quiet:
+            print(
+                "[{}/{}] {}: {} elements, {:.3g} elements/s".format(
+                    done,
+                    total,
+                    path,
+                    result.elements,
+                    result.elements / max(result.seconds, 1e-9),
+                ),
+                file=sys.stderr,
+            )
+
+    if arguments.output_dir:
+        os.makedirs(arguments.output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    results, failures = run_batch(
+        arguments.files,
+        settings,
+        jobs=arguments.jobs,
+        output_dir=arguments.output_dir,
+        resume=arguments.resume,
+        report=report,
+    )
+    seconds = time.perf_counter() - start
+
+    if not arguments.quiet:
+        elements = sum(result.elements for result in results)
+        skipped = len(arguments.files) - len(results) - len(failures)
+
+        print(
+            "Rated {} elements in {} files in {:.2f} s, {:.3g} elements/s{}{}".format(
+                elements,
+                len(results),
+                seconds,
+                elements / max(seconds, 1e-9),
+                ", {} skipped".format(skipped) if skipped else "",
+                ", {} failed".format(len(failures)) if failures else "",
+            ),
+            file=sys.stderr,
+        )
+
+    return 1 if failures else 0
@@ -0,0 +1,126 @@
+"""Evaluation of CIGRE-601 and IEEE-738 in a single pass.
+
+`compare_standards` does the preprocessing shared by both standards once, see
+`engine.prepare_inputs`, and runs the in-place kernels of both engines on one
+`Workspace`. The inputs are rated in blocks, so the buffers of the workspace
+are reused by every block and stay in the cache. The speedup over two
+`thermal_rating` calls is checked by `pylinerating.benchmark`.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from . import engine
+from .conductor import conductor_shape, map_arrays
+from .wind import WindAngle
+from .workspace import Workspace
+
+StandardComparison = namedtuple("StandardComparison", ["cigre", "ieee", "difference"])
+
+
+def compare_prepared(prepared, workspace=None, out=None):
+    """Rate the prepared inputs by both standards, returns StandardComparison.
+
+    The in-place kernels of both engines run on the same workspace.
+    out: a pair of arrays for the ratings of CIGRE-601 and IEEE-738
+    """
+
+    if workspace is None:
+        workspace = Workspace()
+    if out is None:
+        out = (np.empty(prepared.shape), np.empty(prepared.shape))
+
+    cigre, ieee = [
+        engine.get_engine(name).thermal_rating(prepared, rating, workspace)
+        for name, rating in zip(["cigre", "ieee"], out)
+    ]
+
+    return StandardComparison(cigre, ieee, ieee - cigre)
+
+
+def _leading_chunk(value, ndim, start, stop):
+    """Rows start:stop of the leading axis of the broadcast shape with `ndim` axes."""
+
+    if isinstance(value, WindAngle):
+        return WindAngle(*[_leading_chunk(part, ndim, start, stop) for part in value])
+
+    value = np.asarray(value)
+
+    if value.ndim == ndim and value.shape[0] != 1:
+        return value[start:stop]
+
+    return value
+
+
+def compare_standards(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    conductor_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    block_size=32768,
+):
+    """Calculate the rating by CIGRE-601 and by IEEE-738.
+
+    The arguments are the same as for `pylinerating.thermal_rating`, the
+    conductor constants can be arrays, e.g. from `ConductorCatalog.conductors`.
+    block_size: the approximate number of elements rated at once. The buffers of
+                the workspace have the size of a block and stay in the cache.
+
+    Returns StandardComparison(cigre, ieee, difference), the difference is
+    ieee - cigre in [A].
+    """
+
+    inputs = [
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor_temperature,
+        horizontal_angle,
+        elevation,
+    ]
+
+    shape = np.broadcast(
+        *[
+            value.angle_of_attack if isinstance(value, WindAngle) else value
+            for value in inputs
+        ],
+        np.broadcast_to(0, conductor_shape(conductor)),
+    ).shape
+
+    workspace = Workspace()
+
+    if not shape or np.prod(shape) <= block_size:
+        prepared = engine.prepare_inputs(
+            *inputs[:4],
+            conductor,
+            conductor_temperature,
+            horizontal_angle,
+            elevation,
+            workspace=workspace,
+        )
+        return compare_prepared(prepared, workspace)
+
+    cigre = np.empty(shape)
+    ieee = np.empty(shape)
+
+    rows = max(1, block_size // int(np.prod(shape[1:])))
+
+    for start in range(0, shape[0], rows):
+        stop = min(start + rows, shape[0])
+        chunk = [_leading_chunk(value, len(shape), start, stop) for value in inputs]
+        conductor_chunk = map_arrays(
+            conductor, lambda value: _leading_chunk(value, len(shape), start, stop)
+        )
+
+        prepared = engine.prepare_inputs(
+            *chunk[:4], conductor_chunk, *chunk[4:], workspace=workspace
+        )
+        compare_prepared(prepared, workspace, (cigre[start:stop], ieee[start:stop]))
+
+    return StandardComparison(cigre, ieee, ieee - cigre)
@@ -1,4 +1,7 @@
 from collections import namedtuple
+
+import numpy as np
+
 from . import nusselt
 
 ConductorConstants = namedtuple(
@@ -20,6 +23,67 @@ HeatMaterial = namedtuple(
 )
 
 
+class LinearResistance(
+    namedtuple(
+        "LinearResistance",
+        ["temperature_low", "resistance_low", "temperature_high", "resistance_high"],
+    )
+):
+    """Resistance in [ohm/m] interpolated linearly between two temperatures.
+
+    Callable like `drake_resistance`. The resistances can be arrays, e.g. one
+    value per span.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, conductor_temperature):
+        per_1 = (self.resistance_high - self.resistance_low) / (
+            self.temperature_high - self.temperature_low
+        )
+
+        return (
+            self.resistance_low + (conductor_temperature - self.temperature_low) * per_1
+        )
+
+
+def map_arrays(conductor, function, types=np.ndarray):
+    """The conductor with `function` applied to every array of its fields.
+
+    Goes into the heat materials and the resistance models that are namedtuples,
+    e.g. `LinearResistance`. Used to take the chunk of the spans of a per span
+    conductor together with the chunk of the weather.
+    types: the values `function` is applied to, arrays by default
+    """
+
+    if isinstance(conductor, types):
+        return function(conductor)
+
+    if isinstance(conductor, tuple) and hasattr(conductor, "_fields"):
+        return conductor._make(
+            map_arrays(value, function, types) for value in conductor
+        )
+
+    if isinstance(conductor, list):
+        return [map_arrays(value, function, types) for value in conductor]
+
+    return conductor
+
+
+def conductor_shape(conductor):
+    """The broadcast shape of the arrays of the conductor, () for scalars."""
+
+    shapes = []
+
+    def collect(value):
+        shapes.append(np.broadcast_to(0, value.shape))
+        return value
+
+    map_arrays(conductor, collect)
+
+    return np.broadcast(0, *shapes).shape
+
+
 def drake_resistance(conductor_temperature):
     at_25 = 7.283e-5
     at_75 = 8.688e-5
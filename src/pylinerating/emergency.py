@@ -0,0 +1,386 @@
+"""Emergency ratings from the transient heat balance.
+
+After a step of the current the conductor temperature follows the heat equation
+(CIGRE-601 section 6, IEEE-738 eq 21):
+
+    m c(T) dT/dt = I^2 R(T) - B(T)
+
+B(T) is the heat balance of the standard at the conductor temperature T, the
+cooling minus the solar heating, and m c(T) the heat capacity per unit length
+from `cigre601.specific_heat`. The weather is constant during the emergency.
+
+With B linear between the initial and the maximum temperature the solution is
+exponential and both questions have an explicit answer:
+
+    time_to_limit:       how long the current can flow before the conductor
+                         reaches the maximum temperature
+    rating_for_duration: the current that brings the conductor to the maximum
+                         temperature at the end of the duration
+
+The explicit answers are the first guess. They are refined by integrating the
+heat equation (RK4 with adaptive steps, `temperature_after`) with Newton (time)
+and secant (the square of the current) steps. Every element is iterated until it
+converges and is then left out of the next iterations.
+
+All the arguments can be arrays, e.g. (span,) for the initial temperature
+against (span,) weather, and the conductor constants of every span.
+"""
+
+import numpy as np
+
+from . import cigre601
+from . import engine
+from .conductor import conductor_shape, map_arrays
+
+
+def heat_capacity(conductor, temperature):
+    """The heat capacity per unit length m c(T) in [J/(m K)]."""
+
+    mass = sum(metal.mass_per_unit_length for metal in conductor.materials_heat)
+
+    return mass * cigre601.specific_heat(conductor, temperature)
+
+
+class HeatEquation:
+    """The heat equation m c(T) dT/dt = I^2 R(T) - B(T) of flat arrays of elements.
+
+    weather:   flat arrays of the ambient temperature, the wind speed, the angle
+               of attack, the solar irradiation, the horizontal angle and the
+               elevation, the same as for `pylinerating.thermal_rating`
+    conductor: the conductor, its arrays are flat arrays of the elements too
+    standard:  the engine of the heat balance B(T)
+
+    Used by the emergency ratings and by `monitor.TemperatureEstimator`.
+    """
+
+    def __init__(self, weather, conductor, standard):
+        self.weather = weather
+        self.conductor = conductor
+        self.engine = engine.get_engine(standard)
+
+    def subset(self, index):
+        equation = HeatEquation.__new__(HeatEquation)
+        equation.weather = [value[index] for value in self.weather]
+        equation.conductor = map_arrays(self.conductor, lambda value: value[index])
+        equation.engine = self.engine
+
+        return equation
+
+    def balance(self, temperature):
+        Ta, wind, angle, solar, horizontal, elevation = self.weather
+
+        return self.engine.heat_balance(
+            engine.prepare_inputs(
+                Ta,
+                wind,
+                angle,
+                solar,
+                self.conductor,
+                temperature,
+                horizontal,
+                elevation,
+            )
+        )
+
+    def heating(self, current_squared, temperature):
+        """The net heating I^2 R(T) - B(T) in [W/m]."""
+        return current_squared * self.conductor.resistance(temperature) - self.balance(
+            temperature
+        )
+
+    def rate(self, current_squared, temperature):
+        """dT/dt in [K/s]."""
+        return self.heating(current_squared, temperature) / heat_capacity(
+            self.conductor, temperature
+        )
+
+    def step(self, current_squared, temperature, dt, k1=None):
+        """One RK4 step of dt [s]."""
+
+        if k1 is None:
+            k1 = self.rate(current_squared, temperature)
+
+        k2 = self.rate(current_squared, temperature + 0.5 * dt * k1)
+        k3 = self.rate(current_squared, temperature + 0.5 * dt * k2)
+        k4 = self.rate(current_squared, temperature + dt * k3)
+
+        return temperature + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+    def integrate(
+        self, current_squared, temperature, duration, time_step, tolerance=1e-5
+    ):
+        """RK4 with step doubling, every element has its own step.
+
+        time_step: the first step in [s]
+        tolerance: of the error of a step in [K]
+
+        A step is compared with two steps of half the length. It is accepted if
+        they agree within the tolerance and the next step is scaled by the
+        error, at most five times longer. Close to the steady state the steps
+        grow quickly, so a long duration costs few more steps than a short one.
+        A step costs 11 evaluations of the heat balance. Elements with a
+        non-finite result are NaN.
+        """
+
+        temperature = np.array(temperature, dtype=float)
+        current_squared = np.broadcast_to(current_squared, temperature.shape)
+        remaining = np.array(np.broadcast_to(duration, temperature.shape), dtype=float)
+        dt = np.minimum(time_step, remaining)
+
+        active = np.flatnonzero(remaining > 0)
+
+        while active.size:
+            equation = self.subset(active)
+            y, T, h = current_squared[active], temperature[active], dt[active]
+
+            k1 = equation.rate(y, T)
+            full = equation.step(y, T, h, k1)
+            half = equation.step(y, T, 0.5 * h, k1)
+            double = equation.step(y, half, 0.5 * h)
+            error = np.abs(double - full) / 15
+
+            accepted = error <= tolerance
+            temperature[active[accepted]] = double[accepted]
+            remaining[active[accepted]] -= h[accepted]
+
+            failed = active[~np.isfinite(error)]
+            temperature[failed] = np.nan
+            remaining[failed] = 0.0
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                factor = np.clip(0.9 * (tolerance / error) ** 0.2, 0.2, 5.0)
+            dt[active] = np.minimum(h * factor, remaining[active])
+
+            active = active[remaining[active] > 0]
+
+        return temperature
+
+
+def _flatten(conductor, *values):
+    """The broadcast shape, the conductor and the values as flat arrays of that
+    shape."""
+
+    shape = np.broadcast(*values, np.broadcast_to(0, conductor_shape(conductor))).shape
+
+    def flat(value):
+        return np.array(np.broadcast_to(value, shape), dtype=float).reshape(-1)
+
+    return shape, map_arrays(conductor, flat), [flat(value) for value in values]
+
+
+def temperature_after(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    current,
+    initial_temperature,
+    duration,
+    horizontal_angle=0,
+    elevation=500,
+    standard="cigre",
+    time_step=30.0,
+):
+    """The conductor temperature after `duration` [s] with the current [A].
+
+    The weather arguments are the same as for `pylinerating.thermal_rating`.
+    time_step: the first step of the integration in [s]
+    """
+
+    shape, conductor, values = _flatten(
+        conductor,
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        horizontal_angle,
+        elevation,
+        current,
+        initial_temperature,
+        duration,
+    )
+    equation = HeatEquation(values[:6], conductor, standard)
+    current, initial_temperature, duration = values[6:]
+
+    return equation.integrate(
+        current ** 2, initial_temperature, duration, time_step
+    ).reshape(shape)
+
+
+def time_to_limit(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    current,
+    initial_temperature,
+    maximum_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    standard="cigre",
+    max_iterations=10,
+    tolerance=1.0,
+    time_step=30.0,
+):
+    """How long the current [A] can flow before the conductor is too hot, in [s].
+
+    The weather arguments are the same as for `pylinerating.thermal_rating`.
+    initial_temperature: the conductor temperature when the current starts [°C]
+    maximum_temperature: the limit of the conductor temperature [°C]
+    tolerance:           of the time in [s]
+    time_step:           the first step of the integration in [s]
+
+    Returns inf where the conductor never reaches the limit, i.e. the current is
+    not above the steady state rating, and 0 where it is already at the limit.
+    """
+
+    shape, conductor, values = _flatten(
+        conductor,
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        horizontal_angle,
+        elevation,
+        current,
+        initial_temperature,
+        maximum_temperature,
+    )
+    equation = HeatEquation(values[:6], conductor, standard)
+    current_squared, T0, Tmax = values[6] ** 2, values[7], values[8]
+
+    result = np.where(T0 >= Tmax, 0.0, np.inf)
+
+    # The heating at the limit must be positive to get there
+    heating_start = equation.heating(current_squared, T0)
+    heating_limit = equation.heating(current_squared, Tmax)
+    result[np.isnan(heating_limit)] = np.nan
+    active = np.flatnonzero((T0 < Tmax) & (heating_limit > 0))
+
+    # With the heating linear in T: t = m c (Tmax - T0) log(q) / (f0 (q - 1)),
+    # q = f(Tmax) / f(T0)
+    f0 = heating_start[active]
+    q = heating_limit[active] / f0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor = np.where(np.abs(q - 1) > 1e-9, np.log(q) / (q - 1), 1.0)
+
+    mid = 0.5 * (T0[active] + Tmax[active])
+    result[active] = (
+        heat_capacity(equation.subset(active).conductor, mid)
+        * (Tmax[active] - T0[active])
+        / f0
+        * factor
+    )
+
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+
+        subset = equation.subset(active)
+        t = result[active]
+
+        # Newton with the exact dT/dt at the end
+        T = subset.integrate(current_squared[active], T0[active], t, time_step)
+        step = (T - Tmax[active]) / subset.rate(current_squared[active], T)
+
+        # Do not step past the start, the time halves at most
+        updated = np.maximum(t - step, 0.5 * t)
+        result[active] = updated
+
+        active = active[~(np.abs(updated - t) < tolerance)]
+
+    return result.reshape(shape)
+
+
+def rating_for_duration(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    duration,
+    initial_temperature,
+    maximum_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    standard="cigre",
+    max_iterations=10,
+    tolerance=0.01,
+    time_step=30.0,
+):
+    """The current [A] that brings the conductor to the limit in `duration` [s].
+
+    The weather arguments are the same as for `pylinerating.thermal_rating`.
+    initial_temperature: the conductor temperature when the current starts [°C]
+    maximum_temperature: the limit of the conductor temperature [°C]
+    tolerance:           of the final temperature in [K]
+    time_step:           the first step of the integration in [s]
+
+    For long durations the result is the steady state rating. Where even no
+    current cools the conductor down to the limit in time, the result is 0.
+    """
+
+    if np.any(np.asarray(duration) <= 0):
+        raise ValueError("Invalid argument: the duration must be positive.")
+
+    shape, conductor, values = _flatten(
+        conductor,
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        horizontal_angle,
+        elevation,
+        duration,
+        initial_temperature,
+        maximum_temperature,
+    )
+    equation = HeatEquation(values[:6], conductor, standard)
+    duration, T0, Tmax = values[6:]
+
+    # The balance linear between T0 and Tmax, B(T) = B1 + k (T - Tmax). The
+    # slope of the elements that start at the limit is taken below it.
+    B1 = equation.balance(Tmax)
+    lower = np.minimum(T0, Tmax - 1.0)
+    B0 = equation.balance(np.where(T0 < lower, T0, lower))
+    k = (B1 - B0) / (Tmax - lower)
+
+    resistance = conductor.resistance(Tmax)
+    mid = 0.5 * (T0 + Tmax)
+    decay = np.exp(-duration * k / heat_capacity(conductor, mid))
+
+    # The final temperature of the exponential is Tmax + (Tmax - T0) d / (1 - d)
+    current_squared = (B1 + k * (Tmax - T0) * decay / (1 - decay)) / resistance
+    slope = resistance * (1 - decay) / k
+
+    active = np.arange(current_squared.size)
+    previous = None
+
+    for _ in range(max_iterations):
+        subset = equation.subset(active)
+        y = current_squared[active]
+
+        error = (
+            subset.integrate(y, T0[active], duration[active], time_step) - Tmax[active]
+        )
+
+        # Secant steps, the first from the slope of the linear model
+        if previous is not None:
+            y_previous, error_previous = previous
+            secant = (error - error_previous) / (y - y_previous)
+            slope[active] = np.where(
+                np.isfinite(secant) & (secant > 0), secant, slope[active]
+            )
+
+        current_squared[active] = y - error / slope[active]
+
+        converged = np.abs(error) < tolerance
+        active = active[~converged]
+        previous = (y[~converged], error[~converged])
+
+        if active.size == 0:
+            break
+
+    return np.sqrt(np.maximum(current_squared, 0)).reshape(shape)
@@ -0,0 +1,377 @@
+"""Rating engines sharing the preprocessing of the inputs.
+
+The steps that do not depend on the standard (normalisation of the angle of
+attack and its sine and cosine, broadcasting, the solar heating and the
+resistance of the conductor) are done once by `prepare_inputs`. Any number of
+engines can then evaluate the same `PreparedInputs`:
+
+    prepared = prepare_inputs(ambient_temperature, wind_speed, ...)
+    ratings = evaluate(prepared, ["cigre", "ieee"])
+
+New standards (or variants of the existing ones) are added by subclassing
+`RatingEngine` and calling `register_engine`.
+
+With a `workspace.Workspace` the preprocessing and the built-in engines work in
+place, see `pylinerating.workspace`.
+"""
+
+import abc
+from collections import namedtuple
+
+import numpy as np
+
+from . import cigre601
+from . import ieee738
+from .conductor import conductor_shape
+from .wind import WindAngle, fold_angle, sin_cos
+from .workspace import minimal_shape, store, workspace_for
+
+PreparedInputs = namedtuple(
+    "PreparedInputs",
+    [
+        "ambient_temperature",
+        "wind_speed",
+        "angle_of_attack",
+        "solar_irradiation",
+        "conductor",
+        "conductor_temperature",
+        "horizontal_angle",
+        "elevation",
+        "solar_heating",
+        "resistance",
+        "shape",
+        "sin_angle",
+        "cos_angle",
+        "precipitation_rate",
+        "relative_humidity",
+    ],
+)
+
+
+def normalize_angle_of_attack(angle_of_attack, out=None):
+    """Fold any angle in [°] into the range 0-90°."""
+    return fold_angle(angle_of_attack, out)
+
+
+def prepare_inputs(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    conductor_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    workspace=None,
+    precipitation_rate=None,
+    relative_humidity=1.0,
+):
+    """Do the preprocessing shared by all the engines.
+
+    The arguments are the same as for `pylinerating.thermal_rating`. The inputs
+    are not broadcast against each other, `shape` is the shape of the result.
+    The precipitation is only used by the engines with `precipitation`.
+    The angle, its sine and cosine have the shape of the angle of attack, the
+    solar heating the shape of the irradiation and the conductor constants.
+    With a workspace they are stored in its buffers.
+    """
+
+    wind_angle = angle_of_attack
+    if isinstance(wind_angle, WindAngle):
+        angle_of_attack = wind_angle.angle_of_attack
+
+    shape = np.broadcast(
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor_temperature,
+        horizontal_angle,
+        elevation,
+        np.broadcast_to(0, conductor_shape(conductor)),
+        *(() if precipitation_rate is None else (precipitation_rate, relative_humidity))
+    ).shape
+
+    if workspace is None:
+        angle_buffer = trig_buffers = solar_buffer = None
+    else:
+        # Every term at the shape of its own inputs
+        angle_shape = np.shape(angle_of_attack)
+        angle_buffer = workspace.buffer("engine.angle_of_attack", angle_shape)
+        trig_buffers = (
+            workspace.buffer("engine.sin_angle", angle_shape),
+            workspace.buffer("engine.cos_angle", angle_shape),
+        )
+        solar_buffer = workspace.buffer(
+            "engine.solar_heating",
+            minimal_shape(solar_irradiation, conductor.absortivity, conductor.diameter),
+        )
+
+    if isinstance(wind_angle, WindAngle):
+        sin_angle, cos_angle = wind_angle.sin_angle, wind_angle.cos_angle
+    else:
+        angle_of_attack = normalize_angle_of_attack(angle_of_attack, out=angle_buffer)
+        sin_angle, cos_angle = sin_cos(angle_of_attack, out=trig_buffers)
+
+    return PreparedInputs(
+        ambient_temperature=ambient_temperature,
+        wind_speed=wind_speed,
+        angle_of_attack=angle_of_attack,
+        solar_irradiation=solar_irradiation,
+        conductor=conductor,
+        conductor_temperature=conductor_temperature,
+        horizontal_angle=horizontal_angle,
+        elevation=elevation,
+        solar_heating=cigre601.power_solar(
+            solar_irradiation, conductor, out=solar_buffer
+        ),
+        resistance=conductor.resistance(conductor_temperature),
+        shape=shape,
+        sin_angle=sin_angle,
+        cos_angle=cos_angle,
+        precipitation_rate=precipitation_rate,
+        relative_humidity=relative_humidity,
+    )
+
+
+class RatingEngine(abc.ABC):
+    """The interface of a rating engine.
+
+    Subclasses implement `cooling`. The angle of attack in the prepared inputs is
+    already in 0-90°, its sine and cosine are `sin_angle` and `cos_angle`.
+    `cooling_into` is the in-place variant used with a workspace, by default
+    it stores the result of `cooling` in `out`.
+    An engine with `precipitation` adds the evaporative cooling of the
+    `precipitation_rate` of the prepared inputs, the others reject it.
+    """
+
+    name = None
+    precipitation = False
+
+    @abc.abstractmethod
+    def cooling(self, prepared):
+        """The heat removed by convection and radiation in [W/m].
+
+        A subclass of a built-in engine that overrides `cooling` has to override
+        `cooling_into` too, e.g. with `RatingEngine.cooling_into`, or the
+        workspace path keeps the cooling of the built-in engine.
+        """
+
+    def cooling_into(self, prepared, out, workspace):
+        return store(self.cooling(prepared), out)
+
+    def heat_balance(self, prepared, out=None, workspace=None):
+        """The heat that can be removed by the joule heating in [W/m]."""
+
+        if prepared.precipitation_rate is not None and not self.precipitation:
+            raise ValueError(
+                "Invalid argument: the {} engine has no precipitation.".format(
+                    self.name
+                )
+            )
+
+        workspace = workspace_for(out, workspace)
+        if workspace is None:
+            return self.cooling(prepared) - prepared.solar_heating
+
+        if out is None:
+            out = np.empty(prepared.shape)
+
+        self.cooling_into(prepared, out, workspace)
+        out -= prepared.solar_heating
+
+        return out
+
+    def thermal_rating(self, prepared, out=None, workspace=None):
+        """The rating in [A]."""
+
+        workspace = workspace_for(out, workspace)
+        if workspace is None:
+            return np.sqrt(self.heat_balance(prepared) / prepared.resistance)
+
+        balance = self.heat_balance(prepared, out, workspace)
+        balance /= prepared.resistance
+
+        return np.sqrt(balance, out=balance)
+
+
+def _add_precipitation(cooling, convective, prepared):
+    """Add the evaporative cooling of CIGRE-601 to the cooling in place."""
+
+    return cigre601._add_precipitation(
+        cooling,
+        convective,
+        prepared.ambient_temperature,
+        prepared.conductor,
+        prepared.conductor_temperature,
+        prepared.precipitation_rate,
+        prepared.elevation,
+        prepared.relative_humidity,
+    )
+
+
+class Cigre601Engine(RatingEngine):
+    name = "cigre"
+    precipitation = True
+
+    def cooling(self, prepared):
+        Pc = cigre601.power_convective(
+            prepared.ambient_temperature,
+            prepared.wind_speed,
+            prepared.angle_of_attack,
+            prepared.conductor,
+            prepared.conductor_temperature,
+            prepared.horizontal_angle,
+            prepared.elevation,
+            sin_angle=prepared.sin_angle,
+        )
+        Pr = cigre601.power_radiation(
+            prepared.ambient_temperature,
+            prepared.conductor,
+            prepared.conductor_temperature,
+        )
+
+        cooling = Pr + Pc
+
+        if prepared.precipitation_rate is None:
+            return cooling
+
+        # With the shape of the precipitation, a new array changed in place
+        if not isinstance(cooling, np.ndarray) or cooling.shape != prepared.shape:
+            cooling = np.array(np.broadcast_to(cooling, prepared.shape), dtype=float)
+
+        if cigre601._is_wet(prepared.precipitation_rate):
+            _add_precipitation(cooling, Pc, prepared)
+
+        return cooling
+
+    def cooling_into(self, prepared, out, workspace):
+        cigre601.power_convective(
+            prepared.ambient_temperature,
+            prepared.wind_speed,
+            prepared.angle_of_attack,
+            prepared.conductor,
+            prepared.conductor_temperature,
+            prepared.horizontal_angle,
+            prepared.elevation,
+            out=out,
+            workspace=workspace,
+            sin_angle=prepared.sin_angle,
+        )
+        if cigre601._is_wet(prepared.precipitation_rate):
+            # out is the convective cooling so far
+            _add_precipitation(out, out, prepared)
+        out += cigre601.power_radiation(
+            prepared.ambient_temperature,
+            prepared.conductor,
+            prepared.conductor_temperature,
+            out=workspace.buffer("engine.radiation", out.shape),
+            workspace=workspace,
+        )
+
+        return out
+
+
+class Ieee738Engine(RatingEngine):
+    name = "ieee"
+
+    def cooling(self, prepared):
+        qc = ieee738.convective_heat_loss(
+            prepared.ambient_temperature,
+            prepared.wind_speed,
+            None,  # the sine and cosine are used instead
+            prepared.conductor,
+            prepared.conductor_temperature,
+            prepared.elevation,
+            sin_angle=prepared.sin_angle,
+            cos_angle=prepared.cos_angle,
+        )
+        qr = ieee738.radiated_heat_loss(
+            prepared.ambient_temperature,
+            prepared.conductor,
+            prepared.conductor_temperature,
+        )
+
+        return qc + qr
+
+    def cooling_into(self, prepared, out, workspace):
+        ieee738.convective_heat_loss(
+            prepared.ambient_temperature,
+            prepared.wind_speed,
+            None,  # the sine and cosine are used instead
+            prepared.conductor,
+            prepared.conductor_temperature,
+            prepared.elevation,
+            out=out,
+            workspace=workspace,
+            sin_angle=prepared.sin_angle,
+            cos_angle=prepared.cos_angle,
+        )
+        out += ieee738.radiated_heat_loss(
+            prepared.ambient_temperature,
+            prepared.conductor,
+            prepared.conductor_temperature,
+            out=workspace.buffer("engine.radiation", out.shape),
+            workspace=workspace,
+        )
+
+        return out
+
+
+_engines = {}
+
+
+def register_engine(engine, name=None):
+    """Make the engine available under `name` (default `engine.name`)."""
+
+    name = name or engine.name
+
+    if not name:
+        raise ValueError("Invalid argument: the engine must have a name.")
+
+    _engines[name] = engine
+
+
+def get_engine(name):
+    try:
+        return _engines[name]
+    except KeyError:
+        *others, last = sorted(_engines)
+        raise ValueError(
+            "Invalid argument: standard must be {} or {}.".format(
+                ", ".join(others), last
+            )
+        ) from None
+
+
+def available_engines():
+    return sorted(_engines)
+
+
+register_engine(Cigre601Engine())
+register_engine(Ieee738Engine())
+
+
+def evaluate(prepared, standards=("cigre", "ieee")):
+    """Rate the prepared inputs with every engine, returns a dict name -> rating."""
+    return {name: get_engine(name).thermal_rating(prepared) for name in standards}
+
+
+def thermal_rating(
+    *args, standard="cigre", out=None, workspace=None, cache=None, **kwargs
+):
+    """Calculate the rating with the engine registered as `standard`.
+
+    The arguments are the same as for `pylinerating.thermal_rating`.
+    """
+
+    if cache is not None:
+        return cache.thermal_rating(
+            *args, standard=standard, out=out, workspace=workspace, **kwargs
+        )
+
+    rating_engine = get_engine(standard)
+    workspace = workspace_for(out, workspace)
+    prepared = prepare_inputs(*args, workspace=workspace, **kwargs)
+
+    return rating_engine.thermal_rating(prepared, out, workspace)
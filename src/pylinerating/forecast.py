@@ -0,0 +1,141 @@
+"""Rating of forecast weather cubes (span x horizon x member).
+
+The cube is rated chunk by chunk along the span axis. Every chunk goes through
+`thermal_rating` once and is immediately reduced to percentiles over the
+ensemble members, so the full rating cube is never held in memory.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from . import engine
+from .conductor import conductor_shape, map_arrays
+
+ForecastRating = namedtuple("ForecastRating", ["percentiles", "rolling_minimum"])
+
+
+def rolling_minimum(values, window, axis=-1):
+    """Forward looking rolling minimum along `axis`.
+
+    Element `i` is the minimum of `values[i:i + window]`. Near the end of the axis
+    the window is shortened to the elements that are available, so the output
+    has the same shape as the input.
+    """
+
+    values = np.asarray(values)
+
+    if window < 1:
+        raise ValueError("Invalid argument: window must be at least 1.")
+
+    result = np.array(values, copy=True)
+    moved = np.moveaxis(result, axis, -1)
+    source = np.moveaxis(values, axis, -1)
+    length = moved.shape[-1]
+
+    for offset in range(1, min(window, length)):
+        np.minimum(
+            moved[..., : length - offset],
+            source[..., offset:],
+            out=moved[..., : length - offset],
+        )
+
+    return result
+
+
+def _span_chunk(value, start, stop):
+    value = np.asarray(value)
+
+    if value.ndim == 3 and value.shape[0] != 1:
+        return value[start:stop]
+
+    return value
+
+
+def forecast_rating(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    conductor_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    standard="cigre",
+    percentiles=(5, 50, 95),
+    window=1,
+    horizon_axis=1,
+    member_axis=2,
+    chunk_size=1024,
+):
+    """Rate a forecast cube and reduce it over the ensemble members.
+
+    The weather arguments are arrays broadcastable to (span, horizon, member).
+    The order of the horizon and the member axis can be changed with
+    `horizon_axis` and `member_axis`; the span axis is always the first one.
+    Per span parameters (conductor_temperature, elevation, the conductor
+    constants, ...) can be given with the shape (span, 1, 1).
+
+    percentiles: the percentiles of the rating over the members in [%]
+    window:      the length of the rolling minimum along the horizon axis
+    chunk_size:  the number of spans rated at once
+
+    Returns ForecastRating with arrays of the shape (percentile, span, horizon).
+    `rolling_minimum` is the forward looking minimum of every percentile over
+    `window` horizons.
+    """
+
+    rating_engine = engine.get_engine(standard)
+
+    if sorted((horizon_axis, member_axis)) != [1, 2]:
+        raise ValueError("Invalid argument: horizon_axis and member_axis must be 1, 2.")
+
+    inputs = [
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor_temperature,
+        horizontal_angle,
+        elevation,
+    ]
+
+    shape = np.broadcast(
+        *[np.asarray(value) for value in inputs],
+        np.broadcast_to(0, conductor_shape(conductor)),
+    ).shape
+
+    if len(shape) != 3:
+        raise ValueError("Invalid argument: the weather cube must have 3 dimensions.")
+
+    spans = shape[0]
+    horizons = shape[horizon_axis]
+    q = np.asarray(percentiles, dtype=float)
+
+    result = np.empty((len(q), spans, horizons))
+
+    for start in range(0, spans, chunk_size):
+        stop = min(start + chunk_size, spans)
+        chunk = [_span_chunk(value, start, stop) for value in inputs]
+        conductor_chunk = map_arrays(
+            conductor, lambda value: _span_chunk(value, start, stop)
+        )
+
+        prepared = engine.prepare_inputs(
+            chunk[0],
+            chunk[1],
+            chunk[2],
+            chunk[3],
+            conductor_chunk,
+            conductor_temperature=chunk[4],
+            horizontal_angle=chunk[5],
+            elevation=chunk[6],
+        )
+        rating = rating_engine.thermal_rating(prepared)
+
+        # Chunks of spans with the same weather come back with a single span
+        rating = np.broadcast_to(rating, (stop - start,) + shape[1:])
+
+        result[:, start:stop, :] = np.percentile(rating, q, axis=member_axis)
+
+    return ForecastRating(result, rolling_minimum(result, window, axis=-1))
@@ -0,0 +1,141 @@
+"""The spans that limit the rating of a line.
+
+The rating of a line is the rating of its weakest span. For a line of many spans
+with the weather of every span, `limiting_spans` keeps the k spans with the
+lowest rating at every timestamp. The (span, time) weather is rated in blocks,
+every block is merged into the k lowest ratings so far by a partial selection
+(`np.argpartition`), so at most (k + span_chunk) x time_chunk ratings are held
+at once, not the full span x time matrix.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from . import engine
+from .conductor import conductor_shape, map_arrays
+from .wind import WindAngle
+
+LimitingSpans = namedtuple("LimitingSpans", ["spans", "ratings"])
+
+
+def _block(value, spans, times):
+    """The block of an input broadcastable to (span, time)."""
+
+    if isinstance(value, WindAngle):
+        return WindAngle(*[_block(part, spans, times) for part in value])
+
+    value = np.asarray(value)
+
+    if value.ndim == 2 and value.shape[0] != 1:
+        value = value[spans]
+
+    if value.ndim >= 1 and value.shape[-1] != 1:
+        value = value[..., times]
+
+    return value
+
+
+def limiting_spans(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    conductor_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    standard="cigre",
+    k=3,
+    span_chunk=256,
+    time_chunk=8760,
+):
+    """The k spans with the lowest rating at every timestamp.
+
+    The weather arguments are arrays broadcastable to (span, time), e.g. (span,
+    time) weather with (span, 1) elevations and conductor constants. The other
+    arguments are the same as for `pylinerating.thermal_rating`.
+
+    k:          the number of spans, at most the number of spans of the line
+    span_chunk: the number of spans rated at once
+    time_chunk: the number of timestamps rated at once
+
+    Returns LimitingSpans(spans, ratings), arrays of the shape (k, time) with the
+    span indices and their ratings, the lowest rating first. `ratings[0]` is the
+    rating of the line. NaN ratings are never limiting.
+    """
+
+    rating_engine = engine.get_engine(standard)
+
+    inputs = [
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor_temperature,
+        horizontal_angle,
+        elevation,
+    ]
+
+    shape = np.broadcast(
+        *[
+            value.angle_of_attack if isinstance(value, WindAngle) else value
+            for value in inputs
+        ],
+        np.broadcast_to(0, conductor_shape(conductor)),
+    ).shape
+
+    if len(shape) != 2:
+        raise ValueError("Invalid argument: the weather must have 2 dimensions.")
+
+    if k < 1:
+        raise ValueError("Invalid argument: k must be at least 1.")
+
+    spans, times = shape
+    k = min(k, spans)
+
+    result_spans = np.empty((k, times), dtype=np.intp)
+    result_ratings = np.empty((k, times))
+
+    for time_start in range(0, times, time_chunk):
+        time_stop = min(time_start + time_chunk, times)
+        time_block = slice(time_start, time_stop)
+
+        best_spans = np.empty((0, time_stop - time_start), dtype=np.intp)
+        best_ratings = np.empty((0, time_stop - time_start))
+
+        for start in range(0, spans, span_chunk):
+            stop = min(start + span_chunk, spans)
+            spans_block = slice(start, stop)
+            block = [_block(value, spans_block, time_block) for value in inputs]
+            conductor_block = map_arrays(
+                conductor, lambda value: _block(value, spans_block, time_block)
+            )
+
+            prepared = engine.prepare_inputs(*block[:4], conductor_block, *block[4:])
+            rating = np.broadcast_to(
+                rating_engine.thermal_rating(prepared),
+                (stop - start, time_stop - time_start),
+            )
+
+            candidates = np.concatenate([best_ratings, rating])
+            indices = np.concatenate(
+                [
+                    best_spans,
+                    np.broadcast_to(np.arange(start, stop)[:, None], rating.shape),
+                ]
+            )
+
+            if len(candidates) > k:
+                # NaN is sorted last
+                selected = np.argpartition(candidates, k - 1, axis=0)[:k]
+                candidates = np.take_along_axis(candidates, selected, axis=0)
+                indices = np.take_along_axis(indices, selected, axis=0)
+
+            best_ratings, best_spans = candidates, indices
+
+        order = np.argsort(best_ratings, axis=0, kind="stable")
+        result_ratings[:, time_block] = np.take_along_axis(best_ratings, order, axis=0)
+        result_spans[:, time_block] = np.take_along_axis(best_spans, order, axis=0)
+
+    return LimitingSpans(result_spans, result_ratings)
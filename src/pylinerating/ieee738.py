@@ -1,29 +1,80 @@
 import numpy as np
 
+from .wind import WindAngle, fold_angle, sin_cos
+from .workspace import (
+    buffers,
+    minimal_shape,
+    no_buffers,
+    polynomial,
+    store,
+    workspace_for,
+)
+
+
+def temperature_film(ambient_temperature, conductor_temperature, out=None):
+    Tfilm = np.add(conductor_temperature, ambient_temperature, out=out)
+    return np.divide(Tfilm, 2, out=out)
+
+
+def dynamic_viscosity_film(Tfilm, out=None, buffer=no_buffers):
+    """Eq 13a as a function of the film temperature.
+
+    out, buffer: see `pylinerating.workspace`
+    """
+
+    # 1.458e-6 (Tfilm + 273) ** 1.5 / (Tfilm + 383.4)
+    term = buffer("viscosity_term")
+
+    viscosity = np.add(Tfilm, 273.0, out=out)
+    root = np.sqrt(viscosity, out=term)
+    viscosity = np.multiply(viscosity, root, out=out)
+    viscosity = np.multiply(viscosity, 1.458e-6, out=out)
+    denominator = np.add(Tfilm, 383.4, out=term)
+
+    return np.divide(viscosity, denominator, out=out)
+
 
 def dynamic_viscosity(ambient_temperature, conductor_temperature):
     """From section 4.5.1, eq 13a, valid for SI units."""
 
-    Tfilm = (conductor_temperature + ambient_temperature) / 2
+    Tfilm = temperature_film(ambient_temperature, conductor_temperature)
 
-    return 1.458e-6 * (Tfilm + 273.0) ** 1.5 / (Tfilm + 383.4)
+    return dynamic_viscosity_film(Tfilm)
+
+
+def air_density_film(Tfilm, elevation, out=None, buffer=no_buffers):
+    """Eq 14a as a function of the film temperature.
+
+    out, buffer: see `pylinerating.workspace`
+    """
+
+    numerator = buffer("density_numerator", elevation)
+    numerator = polynomial(elevation, [1.293, -1.525e-4, 6.379e-9], numerator)
+
+    density = np.multiply(Tfilm, 0.00367, out=out)
+    density = np.add(density, 1, out=out)
+
+    return np.divide(numerator, density, out=out)
 
 
 def air_density(ambient_temperature, conductor_temperature, elevation):
     """From section 4.5.2, eq 14a, valid for SI units."""
 
-    Tfilm = (conductor_temperature + ambient_temperature) / 2
+    Tfilm = temperature_film(ambient_temperature, conductor_temperature)
+
+    return air_density_film(Tfilm, elevation)
 
-    return (1.293 - 1.525e-4 * elevation + 6.379e-9 * elevation ** 2) / (
-        1 + 0.00367 * Tfilm
-    )
+
+def thermal_conductivity_of_air_film(Tfilm, out=None):
+    """Eq 15a as a function of the film temperature."""
+    return polynomial(Tfilm, [2.424e-2, 7.477e-5, -4.407e-9], out)
 
 
 def thermal_conductivity_of_air(ambient_temperature, conductor_temperature):
     """Section 4.5.3, eq 15a, valid for SI units."""
-    Tfilm = (conductor_temperature + ambient_temperature) / 2
+    Tfilm = temperature_film(ambient_temperature, conductor_temperature)
 
-    return 2.424e-2 + 7.477e-5 * Tfilm - 4.407e-9 * Tfilm ** 2
+    return thermal_conductivity_of_air_film(Tfilm)
 
 
 def reynolds_number(
@@ -32,14 +83,80 @@ def reynolds_number(
     conductor,
     conductor_temperature,
     elevation,
+    out=None,
+    density=None,
+    viscosity=None,
 ):
-    """Section 4.4.3, eq 2c, page 10."""
-    return (
-        conductor.diameter
-        * air_density(ambient_temperature, conductor_temperature, elevation)
-        * wind_speed
-        / dynamic_viscosity(ambient_temperature, conductor_temperature)
-    )
+    """Section 4.4.3, eq 2c, page 10.
+
+    density, viscosity: of the air at the film temperature, if already known
+    """
+
+    if density is None:
+        density = air_density(ambient_temperature, conductor_temperature, elevation)
+    if viscosity is None:
+        viscosity = dynamic_viscosity(ambient_temperature, conductor_temperature)
+
+    Nre = np.multiply(wind_speed, conductor.diameter, out=out)
+    Nre = np.multiply(Nre, density, out=out)
+
+    return np.divide(Nre, viscosity, out=out)
+
+
+def wind_direction_factor(angle_of_attack, out=None, buffer=no_buffers):
+    """Section 4.4.3.1, eq 4a, the angle of attack in radians."""
+
+    sin_angle = np.sin(angle_of_attack, out=buffer("angle_sin", angle_of_attack))
+    cos_angle = np.cos(angle_of_attack, out=buffer("angle_cos", angle_of_attack))
+
+    return wind_direction_factor_trig(sin_angle, cos_angle, out, buffer)
+
+
+def wind_direction_factor_trig(sin_angle, cos_angle, out=None, buffer=no_buffers):
+    """Eq 4a from the sine and cosine of the angle of attack.
+
+    1.194 - cos + 0.194 cos(2 phi) + 0.368 sin(2 phi), with cos(2 phi) =
+    1 - 2 sin^2 and sin(2 phi) = 2 sin cos.
+    out, buffer: see `pylinerating.workspace`
+    """
+
+    Kangle = np.multiply(sin_angle, sin_angle, out=out)
+    Kangle = np.multiply(Kangle, -2 * 0.194, out=out)
+    Kangle = np.add(Kangle, 1.194 + 0.194, out=out)
+
+    double_angle = buffer("double_angle", sin_angle, cos_angle)
+    sin_double = np.multiply(sin_angle, cos_angle, out=double_angle)
+    sin_double = np.multiply(sin_double, 2 * 0.368, out=double_angle)
+
+    Kangle = np.add(Kangle, sin_double, out=out)
+
+    return np.subtract(Kangle, cos_angle, out=out)
+
+
+def _forced_convection_low(Nre, out=None):
+    """Eq 3a without the factor Kangle kf (Tc - Ta)."""
+
+    factor = np.power(Nre, 0.52, out=out)
+    factor = np.multiply(factor, 1.35, out=out)
+
+    return np.add(factor, 1.01, out=out)
+
+
+def _forced_convection_high(Nre, out=None):
+    """Eq 3b without the factor Kangle kf (Tc - Ta)."""
+
+    factor = np.power(Nre, 0.6, out=out)
+
+    return np.multiply(factor, 0.754, out=out)
+
+
+def _convection_factor(forced, Kangle, kf, delta, out=None):
+    """Multiply eq 3a or 3b by the factor Kangle kf (Tc - Ta)."""
+
+    forced = np.multiply(forced, Kangle, out=out)
+    forced = np.multiply(forced, kf, out=out)
+
+    return np.multiply(forced, delta, out=out)
 
 
 def forced_convection(
@@ -50,31 +167,28 @@ def forced_convection(
     conductor_temperature,
     elevation,
     return_parts=False,
+    sin_angle=None,
+    cos_angle=None,
 ):
-    """Section 4.4.3.1, page 11."""
-    Kangle = (
-        1.194
-        - np.cos(angle_of_attack)
-        + 0.194 * np.cos(2 * angle_of_attack)
-        + 0.368 * np.sin(2 * angle_of_attack)
-    )
+    """Section 4.4.3.1, page 11.
+
+    The sine and cosine of the angle of attack can be passed in `sin_angle` and
+    `cos_angle` if they are already known.
+    """
+    if sin_angle is None:
+        Kangle = wind_direction_factor(angle_of_attack)
+    else:
+        Kangle = wind_direction_factor_trig(sin_angle, cos_angle)
 
     Nre = reynolds_number(
         ambient_temperature, wind_speed, conductor, conductor_temperature, elevation
     )
 
     kf = thermal_conductivity_of_air(ambient_temperature, conductor_temperature)
+    delta = np.subtract(conductor_temperature, ambient_temperature)
 
-    qc1 = (
-        Kangle
-        * (1.01 + 1.35 * Nre ** 0.52)
-        * kf
-        * (conductor_temperature - ambient_temperature)
-    )
-
-    qc2 = (
-        Kangle * 0.754 * Nre ** 0.6 * kf * (conductor_temperature - ambient_temperature)
-    )
+    qc1 = _convection_factor(_forced_convection_low(Nre), Kangle, kf, delta)
+    qc2 = _convection_factor(_forced_convection_high(Nre), Kangle, kf, delta)
 
     if return_parts:
         return np.maximum(qc1, qc2), qc1, qc2, Kangle
@@ -82,6 +196,18 @@ def forced_convection(
     return np.maximum(qc1, qc2)
 
 
+def _natural_convection(density, diameter, delta, out=None):
+    """Eq 5a, 3.645 rho ** 0.5 D ** 0.75 (Tc - Ta) ** 1.25."""
+
+    # rho ** 0.5 (Tc - Ta) ** 1.25 is (Tc - Ta) sqrt(rho sqrt(Tc - Ta))
+    natural = np.sqrt(delta, out=out)
+    natural = np.multiply(natural, density, out=out)
+    natural = np.sqrt(natural, out=out)
+    natural = np.multiply(natural, delta, out=out)
+
+    return np.multiply(natural, 3.645 * diameter ** 0.75, out=out)
+
+
 def natural_convection(
     ambient_temperature,
     conductor,
@@ -89,11 +215,10 @@ def natural_convection(
     elevation,
 ):
     """Section 4.4.3.2, eq 5a 5b, page 12"""
-    return (
-        3.645
-        * air_density(ambient_temperature, conductor_temperature, elevation) ** 0.5
-        * conductor.diameter ** 0.75
-        * (conductor_temperature - ambient_temperature) ** 1.25
+    return _natural_convection(
+        air_density(ambient_temperature, conductor_temperature, elevation),
+        conductor.diameter,
+        np.subtract(conductor_temperature, ambient_temperature),
     )
 
 
@@ -104,49 +229,256 @@ def convective_heat_loss(
     conductor,
     conductor_temperature,
     elevation,
+    out=None,
+    workspace=None,
+    sin_angle=None,
+    cos_angle=None,
 ):
     """The convective heat loss is the bigger of forced and natural convection
 
-    From section 4.4.3 in the standard, page 10.
+    From section 4.4.3 in the standard, page 10. The maximum of eq 3a and 3b
+    is multiplied by their common factor Kangle kf (Tc - Ta).
+    out, workspace:       see `pylinerating.workspace`
+    sin_angle, cos_angle: of the angle of attack, if they are already known
+    """
+
+    Ta, Tc = ambient_temperature, conductor_temperature
+
+    workspace = workspace_for(out, workspace)
+    if workspace is not None and out is None:
+        out = np.empty(
+            np.broadcast(
+                Ta,
+                wind_speed,
+                angle_of_attack,
+                Tc,
+                elevation,
+                conductor.diameter,
+            ).shape
+        )
+
+    # The terms of some inputs only are computed at the shape of these inputs
+    buffer = buffers(workspace, "ieee738.", None if out is None else out.shape)
+
+    Tfilm = temperature_film(Ta, Tc, out=buffer("film_temperature"))
+    delta = np.subtract(Tc, Ta, out=buffer("temperature_difference"))
+    kf = thermal_conductivity_of_air_film(Tfilm, out=buffer("conductivity"))
+    viscosity = dynamic_viscosity_film(Tfilm, buffer("viscosity"), buffer)
+    density = air_density_film(Tfilm, elevation, buffer("density"), buffer)
+
+    reynolds = buffer("reynolds")
+    Nre = reynolds_number(
+        Ta, wind_speed, conductor, Tc, elevation, reynolds, density, viscosity
+    )
+
+    # With the angle of attack in radians, at the shape of the angle
+    if sin_angle is None:
+        Kangle = wind_direction_factor(
+            angle_of_attack, buffer("kangle", angle_of_attack), buffer
+        )
+    else:
+        Kangle = wind_direction_factor_trig(
+            sin_angle, cos_angle, buffer("kangle", sin_angle, cos_angle), buffer
+        )
+
+    forced = buffer("forced")
+    factor = np.maximum(
+        _forced_convection_low(Nre, out=forced),
+        _forced_convection_high(Nre, out=reynolds),
+        out=forced,
+    )
+    forced = _convection_factor(factor, Kangle, kf, delta, out=forced)
+
+    natural = _natural_convection(density, conductor.diameter, delta, out=out)
+
+    return np.maximum(forced, natural, out=out)
+
+
+def _fourth_power(temperature, out=None):
+    """((T + 273) / 100) ** 4, the temperature in [°C]."""
+
+    power = np.add(temperature, 273, out=out)
+    power = np.divide(power, 100, out=out)
+    power = np.multiply(power, power, out=out)
+
+    return np.multiply(power, power, out=out)
+
+
+def radiated_heat_loss(
+    ambient_temperature,
+    conductor,
+    conductor_temperature,
+    out=None,
+    workspace=None,
+):
+    """Section 4.4.4, eq 7a 7b, page 12"""
+
+    workspace = workspace_for(out, workspace)
+    if workspace is not None and out is None:
+        out = np.empty(
+            np.broadcast(
+                ambient_temperature, conductor_temperature, conductor.diameter
+            ).shape
+        )
+
+    # The fourth powers at the shapes of the temperatures
+    buffer = buffers(workspace, "ieee738.radiation_", None)
+
+    ambient = _fourth_power(ambient_temperature, buffer("ambient", ambient_temperature))
+    conductor_term = _fourth_power(
+        conductor_temperature, buffer("conductor", conductor_temperature)
+    )
+
+    radiation = np.subtract(conductor_term, ambient, out=out)
+
+    return np.multiply(
+        radiation, 17.8 * conductor.diameter * conductor.emmisivity, out=out
+    )
+
+
+def solar_heat_gain(solar_irradiation, conductor, out=None):
+    solar = np.multiply(solar_irradiation, conductor.absortivity, out=out)
+
+    return np.multiply(solar, conductor.diameter, out=out)
+
+
+def heat_balance(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    conductor_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    out=None,
+    workspace=None,
+):
+    """The heat that can be removed by the joule heating, qc + qr - qs in [W/m].
+
+    The arguments are the same as for `thermal_rating`. The balance is negative
+    when the solar heating is bigger than the cooling.
     """
 
-    forced = forced_convection(
+    if isinstance(angle_of_attack, WindAngle):
+        angle_of_attack, sin_angle, cos_angle = angle_of_attack
+    else:
+        sin_angle = cos_angle = None
+
+    workspace = workspace_for(out, workspace)
+    if workspace is not None:
+        return _heat_balance_into(
+            ambient_temperature,
+            wind_speed,
+            angle_of_attack,
+            solar_irradiation,
+            conductor,
+            conductor_temperature,
+            elevation,
+            out,
+            workspace,
+            sin_angle,
+            cos_angle,
+        )
+
+    # the angle must be in the range 0-90
+    if sin_angle is None:
+        angle_of_attack = fold_angle(angle_of_attack)
+        sin_angle, cos_angle = sin_cos(angle_of_attack)
+    angle_of_attack = (angle_of_attack / 180.0) * np.pi
+
+    qc = convective_heat_loss(
         ambient_temperature,
         wind_speed,
         angle_of_attack,
         conductor,
         conductor_temperature,
         elevation,
+        sin_angle=sin_angle,
+        cos_angle=cos_angle,
     )
 
-    natural = natural_convection(
-        ambient_temperature, conductor, conductor_temperature, elevation
-    )
+    qr = radiated_heat_loss(ambient_temperature, conductor, conductor_temperature)
 
-    qc = np.maximum(forced, natural)
+    qs = solar_heat_gain(solar_irradiation, conductor)
 
-    return qc
+    return store(qc + qr - qs, out)
 
 
-def radiated_heat_loss(
+def _heat_balance_into(
     ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
     conductor,
     conductor_temperature,
+    elevation,
+    out,
+    workspace,
+    sin_angle=None,
+    cos_angle=None,
 ):
-    """Section 4.4.4, eq 7a 7b, page 12"""
-    return (
-        17.8
-        * conductor.diameter
-        * conductor.emmisivity
-        * (
-            ((conductor_temperature + 273) / 100) ** 4
-            - ((ambient_temperature + 273) / 100) ** 4
+    if out is None:
+        out = np.empty(
+            np.broadcast(
+                ambient_temperature,
+                wind_speed,
+                angle_of_attack,
+                solar_irradiation,
+                conductor_temperature,
+                elevation,
+                conductor.diameter,
+            ).shape
         )
-    )
 
+    def buffer(name, *inputs):
+        shape = minimal_shape(*inputs) if inputs else out.shape
+        return workspace.buffer("ieee738." + name, shape)
+
+    # the angle must be in the range 0-90, in radians
+    if sin_angle is None:
+        angle = fold_angle(
+            angle_of_attack, out=buffer("angle_of_attack", angle_of_attack)
+        )
+        sin_angle, cos_angle = sin_cos(
+            angle,
+            out=(
+                buffer("wind_sin", angle_of_attack),
+                buffer("wind_cos", angle_of_attack),
+            ),
+        )
+
+    # The angle in radians is not used with the sine and cosine
+    angle = None
+
+    convective_heat_loss(
+        ambient_temperature,
+        wind_speed,
+        angle,
+        conductor,
+        conductor_temperature,
+        elevation,
+        out=out,
+        workspace=workspace,
+        sin_angle=sin_angle,
+        cos_angle=cos_angle,
+    )
+    out += radiated_heat_loss(
+        ambient_temperature,
+        conductor,
+        conductor_temperature,
+        out=buffer("radiation"),
+        workspace=workspace,
+    )
+    out -= solar_heat_gain(
+        solar_irradiation,
+        conductor,
+        out=buffer(
+            "solar", solar_irradiation, conductor.absortivity, conductor.diameter
+        ),
+    )
 
-def solar_heat_gain(solar_irradiation, conductor):
-    return conductor.absortivity * solar_irradiation * conductor.diameter
+    return out
 
 
 def thermal_rating(
@@ -158,36 +490,54 @@ def thermal_rating(
     conductor_temperature=80.0,
     horizontal_angle=0,
     elevation=500,
+    out=None,
+    workspace=None,
 ):
     """Calculate the rating using IEEE738.
 
     ambient_temperature:   temperature of air in [°C]
     wind_speed:            in [m/s]
     angle_of_attack:       the angle between the wind and the conductor in [°]. 0° is parallel wind, 90° is perpendicular
+                           or a `pylinerating.wind.WindAngle` from the wind direction
     solar_irradiation:     in [W/m^2]
     conductor:             the conductor structure with details about the material. from pylinerating.conductor
     conductor_temperature: the target conductor temperature [°C]
     horizontal_angle:      not used
     elevation:             the see level elevation in [m]
+    out:                   array for the result, without a workspace the
+                           intermediates go to a temporary one
+    workspace:             `pylinerating.workspace.Workspace` for the intermediates
     """
 
-    # the angle must be in the range 0-90
-    angle_of_attack = 90 - np.abs((angle_of_attack % 180) - 90)
-    angle_of_attack = (angle_of_attack / 180.0) * np.pi
+    workspace = workspace_for(out, workspace)
+    if workspace is not None:
+        balance = heat_balance(
+            ambient_temperature,
+            wind_speed,
+            angle_of_attack,
+            solar_irradiation,
+            conductor,
+            conductor_temperature,
+            horizontal_angle,
+            elevation,
+            out=out,
+            workspace=workspace,
+        )
+        balance /= conductor.resistance(conductor_temperature)
 
-    qc = convective_heat_loss(
+        return np.sqrt(balance, out=balance)
+
+    balance = heat_balance(
         ambient_temperature,
         wind_speed,
         angle_of_attack,
+        solar_irradiation,
         conductor,
         conductor_temperature,
+        horizontal_angle,
         elevation,
     )
 
-    qr = radiated_heat_loss(ambient_temperature, conductor, conductor_temperature)
-
-    qs = solar_heat_gain(solar_irradiation, conductor)
-
-    current = np.sqrt((qc + qr - qs) / conductor.resistance(conductor_temperature))
+    current = np.sqrt(balance / conductor.resistance(conductor_temperature))
 
-    return current
+    return store(current, out)
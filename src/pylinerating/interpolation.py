@@ -0,0 +1,181 @@
+"""Mapping of gridded weather (NWP) to spans.
+
+`GridMapper` finds the grid cells and the interpolation weights of every span once.
+Every weather field is then mapped to the spans by a single sparse matrix-vector
+product with a fixed number of nonzeros per span (the ELLPACK layout): a gather
+of `indices` followed by a weighted sum. The mapper can be saved to disk and
+loaded in the next cycle.
+
+Interpolate the wind as u and v components, not as speed and direction.
+"""
+
+import numpy as np
+
+
+def _bracket(axis, values):
+    """Index of the lower neighbour on a 1-D axis and the fractional position.
+
+    Values outside of the axis are clamped to the edge.
+    """
+
+    axis = np.asarray(axis, dtype=float)
+    values = np.asarray(values, dtype=float)
+
+    descending = axis[0] > axis[-1]
+    if descending:
+        axis = axis[::-1]
+
+    lower = np.clip(np.searchsorted(axis, values, side="right") - 1, 0, len(axis) - 2)
+    fraction = (values - axis[lower]) / (axis[lower + 1] - axis[lower])
+    fraction = np.clip(fraction, 0.0, 1.0)
+
+    if descending:
+        # lower + 1 in the reversed axis is the lower index in the original one
+        lower = len(axis) - 2 - lower
+        fraction = 1.0 - fraction
+
+    return lower, fraction
+
+
+def _unit_vectors(latitude, longitude):
+    latitude = np.radians(latitude)
+    longitude = np.radians(longitude)
+
+    return np.stack(
+        [
+            np.cos(latitude) * np.cos(longitude),
+            np.cos(latitude) * np.sin(longitude),
+            np.sin(latitude),
+        ],
+        axis=-1,
+    )
+
+
+class GridMapper:
+    """Precomputed interpolation from a weather grid to spans.
+
+    indices:    (span, k) flat indices of the grid points used by every span
+    weights:    (span, k) weights of the grid points, every row sums to 1
+    grid_shape: the shape of one weather field
+    """
+
+    def __init__(self, indices, weights, grid_shape):
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.weights = np.asarray(weights, dtype=float)
+        self.grid_shape = tuple(grid_shape)
+
+        if self.indices.shape != self.weights.shape or self.indices.ndim != 2:
+            raise ValueError("Invalid argument: indices and weights must be (span, k).")
+
+    @property
+    def spans(self):
+        return self.indices.shape[0]
+
+    @classmethod
+    def regular(
+        cls,
+        grid_latitudes,
+        grid_longitudes,
+        span_latitudes,
+        span_longitudes,
+        method="bilinear",
+    ):
+        """Mapper for a regular latitude x longitude grid.
+
+        grid_latitudes, grid_longitudes: the 1-D axes of the grid, the fields have
+                                         the shape (latitude, longitude)
+        method:                          `bilinear` or `nearest`
+        """
+
+        nx = len(grid_longitudes)
+        shape = (len(grid_latitudes), nx)
+
+        i, t = _bracket(grid_latitudes, span_latitudes)
+        j, u = _bracket(grid_longitudes, span_longitudes)
+
+        # The four corners of the cell around every span
+        lower_left = i * nx + j
+        indices = np.stack(
+            [lower_left, lower_left + 1, lower_left + nx, lower_left + nx + 1], axis=-1
+        )
+        weights = np.stack(
+            [(1 - t) * (1 - u), (1 - t) * u, t * (1 - u), t * u], axis=-1
+        )
+
+        if method == "nearest":
+            closest = np.argmax(weights, axis=-1)[:, None]
+            indices = np.take_along_axis(indices, closest, axis=-1)
+            weights = np.ones_like(indices, dtype=float)
+        elif method != "bilinear":
+            raise ValueError("Invalid argument: method must be bilinear or nearest.")
+
+        return cls(indices, weights, shape)
+
+    @classmethod
+    def scattered(
+        cls, grid_latitudes, grid_longitudes, span_latitudes, span_longitudes, k=1
+    ):
+        """Mapper for an arbitrary set of grid points (e.g. a rotated or curvilinear grid).
+
+        The grid coordinates can have any shape, which is then the shape of the
+        fields. The `k` nearest grid points of every span are found by a KD-tree
+        and weighted by their inverse distance. Needs scipy.
+        """
+
+        try:
+            from scipy.spatial import cKDTree
+        except ImportError:
+            raise ImportError(
+                "GridMapper.scattered needs scipy, install pylinerating[spatial]."
+            ) from None
+
+        grid_latitudes = np.asarray(grid_latitudes, dtype=float)
+        shape = grid_latitudes.shape
+
+        grid = _unit_vectors(grid_latitudes.ravel(), np.ravel(grid_longitudes))
+        spans = _unit_vectors(span_latitudes, span_longitudes).reshape(-1, 3)
+
+        distances, indices = cKDTree(grid).query(spans, k=k)
+        distances = distances.reshape(len(spans), k)
+        indices = indices.reshape(len(spans), k)
+
+        with np.errstate(divide="ignore"):
+            weights = 1.0 / distances
+
+        # A span on a grid point takes the value of the point
+        exact = ~np.isfinite(weights)
+        weights = np.where(exact.any(axis=-1, keepdims=True), exact, weights)
+        weights = weights / weights.sum(axis=-1, keepdims=True)
+
+        return cls(indices, weights, shape)
+
+    def apply(self, field):
+        """Map a weather field (or a stack of fields) to the spans.
+
+        field: array of the shape (..., *grid_shape)
+
+        Returns an array of the shape (..., span).
+        """
+
+        field = np.asarray(field)
+        grid_ndim = len(self.grid_shape)
+
+        if field.shape[field.ndim - grid_ndim :] != self.grid_shape:
+            raise ValueError("Invalid argument: the field does not match the grid.")
+
+        flat = field.reshape(field.shape[: field.ndim - grid_ndim] + (-1,))
+
+        return np.einsum("...sk,sk->...s", flat[..., self.indices], self.weights)
+
+    def save(self, path):
+        np.savez(
+            path,
+            indices=self.indices,
+            weights=self.weights,
+            grid_shape=np.asarray(self.grid_shape),
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["indices"], data["weights"], tuple(data["grid_shape"]))
@@ -0,0 +1,153 @@
+"""Rating of labelled data (xarray), optionally Dask backed.
+
+The functions take `xarray.DataArray` (or a `Dataset`) and return a DataArray
+with the coordinates of the broadcast inputs. The rating is applied block by
+block with `xarray.apply_ufunc`; for Dask backed inputs the result is lazy and
+every chunk is rated independently when it is computed, so a hindcast larger
+than the memory can be rated on a local or a distributed Dask cluster:
+
+    ds = xarray.open_zarr("hindcast.zarr")  # (span, time), chunked
+    rating = rate_dataset(ds, drake_constants)
+    rating.resample(time="1D").min().compute()
+
+Needs xarray (and dask for chunked data), install pylinerating[xarray].
+"""
+
+import numpy as np
+
+from . import engine
+
+DEFAULT_VARIABLES = {
+    "ambient_temperature": "ambient_temperature",
+    "wind_speed": "wind_speed",
+    "angle_of_attack": "angle_of_attack",
+    "solar_irradiation": "solar_irradiation",
+}
+
+
+def _import_xarray():
+    try:
+        import xarray
+    except ImportError:
+        raise ImportError(
+            "pylinerating.labelled needs xarray, install pylinerating[xarray]."
+        ) from None
+
+    return xarray
+
+
+def _rate_block(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor_temperature,
+    horizontal_angle,
+    elevation,
+    conductor=None,
+    standard="cigre",
+):
+    with np.errstate(invalid="ignore"):
+        return engine.thermal_rating(
+            ambient_temperature,
+            wind_speed,
+            angle_of_attack,
+            solar_irradiation,
+            conductor,
+            conductor_temperature=conductor_temperature,
+            horizontal_angle=horizontal_angle,
+            elevation=elevation,
+            standard=standard,
+        )
+
+
+def thermal_rating(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    conductor_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    standard="cigre",
+):
+    """Calculate the rating of DataArrays.
+
+    The arguments are the same as for `pylinerating.thermal_rating`, every
+    numeric argument can be a DataArray or a scalar. The DataArrays are aligned
+    and broadcast by their dimension names, e.g. a (span,) conductor temperature
+    against (span, time) weather. NaN is returned where there is no rating.
+
+    Returns a DataArray named `rating` in [A].
+    """
+
+    xarray = _import_xarray()
+
+    rating = xarray.apply_ufunc(
+        _rate_block,
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor_temperature,
+        horizontal_angle,
+        elevation,
+        kwargs={"conductor": conductor, "standard": standard},
+        dask="parallelized",
+        output_dtypes=[float],
+    )
+
+    if not isinstance(rating, xarray.DataArray):
+        raise ValueError("Invalid argument: at least one input must be a DataArray.")
+
+    rating.name = "rating"
+    rating.attrs = {"units": "A", "standard": standard}
+
+    return rating
+
+
+def rate_dataset(
+    dataset,
+    conductor,
+    conductor_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    standard="cigre",
+    variables=None,
+):
+    """Calculate the rating of the weather variables of a Dataset.
+
+    variables: a mapping of the argument names of `thermal_rating` to the names of
+               the variables in the dataset, if they differ from `DEFAULT_VARIABLES`.
+               The per span parameters can be mapped to variables too.
+    """
+
+    names = dict(DEFAULT_VARIABLES)
+    names.update(variables or {})
+
+    parameters = {
+        "conductor_temperature": conductor_temperature,
+        "horizontal_angle": horizontal_angle,
+        "elevation": elevation,
+    }
+
+    for argument, name in names.items():
+        if argument not in DEFAULT_VARIABLES and argument not in parameters:
+            raise ValueError("Invalid argument: unknown argument {}.".format(argument))
+        if name not in dataset:
+            raise ValueError("Invalid argument: {} is not in the dataset.".format(name))
+
+    for argument in parameters:
+        if argument in names:
+            parameters[argument] = dataset[names[argument]]
+
+    return thermal_rating(
+        dataset[names["ambient_temperature"]],
+        dataset[names["wind_speed"]],
+        dataset[names["angle_of_attack"]],
+        dataset[names["solar_irradiation"]],
+        conductor,
+        standard=standard,
+        **parameters
+    )
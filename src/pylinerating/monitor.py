@@ -0,0 +1,129 @@
+"""The conductor temperature of every span from streamed current and weather.
+
+    estimator = TemperatureEstimator(conductor, initial_temperature=ambient)
+
+    for interval, current, weather in ticks:
+        temperature = estimator.update(interval, current, *weather)
+
+The state is one temperature per span. Every tick advances all spans by the
+heat equation of `emergency` (CIGRE-601 section 6):
+
+    m c(T) dT/dt = I^2 R(T) - B(T)
+
+with the current and the weather of the tick held over the interval, which can
+differ between the ticks and between the spans. The interval is integrated with
+RK4 steps that adapt to the error, starting from `time_step`. A span with a
+missing (NaN) value in the tick keeps its temperature.
+"""
+
+import numpy as np
+
+from .conductor import conductor_shape, map_arrays
+from .emergency import HeatEquation
+
+
+class TemperatureEstimator:
+    """The conductor temperatures of spans, advanced tick by tick.
+
+    conductor:           the conductor, its constants can be arrays of the
+                         shape of the spans
+    initial_temperature: the conductor temperature of every span [°C]
+    horizontal_angle:    per span, the same as for `pylinerating.thermal_rating`
+    elevation:           per span, in [m]
+    standard:            the engine of the heat balance
+    time_step:           the first step of the integration in [s]
+    dtype:               of the state, e.g. np.float32. The tick is computed in
+                         float64.
+
+    temperature: the current state [°C]
+    time:        the time integrated so far per span [s]
+    """
+
+    def __init__(
+        self,
+        conductor,
+        initial_temperature,
+        horizontal_angle=0,
+        elevation=500,
+        standard="cigre",
+        time_step=60.0,
+        dtype=float,
+    ):
+        if time_step <= 0:
+            raise ValueError("Invalid argument: time_step must be positive.")
+
+        shape = np.broadcast(
+            initial_temperature,
+            horizontal_angle,
+            elevation,
+            np.broadcast_to(0, conductor_shape(conductor)),
+        ).shape
+
+        # The heat equation works on flat arrays of the spans
+        self.conductor = map_arrays(
+            conductor, lambda value: np.broadcast_to(value, shape).reshape(-1)
+        )
+        self.standard = standard
+        self.time_step = time_step
+        self.temperature = np.array(
+            np.broadcast_to(initial_temperature, shape), dtype=dtype
+        )
+        self.time = np.zeros(shape)
+
+        self._site = [
+            np.array(np.broadcast_to(value, shape), dtype=float).reshape(-1)
+            for value in (horizontal_angle, elevation)
+        ]
+
+    @property
+    def shape(self):
+        return self.temperature.shape
+
+    def update(
+        self,
+        interval,
+        current,
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+    ):
+        """Advance the spans by the interval [s] with the current [A] and the weather.
+
+        The arguments are broadcast to the shape of the spans, the weather
+        arguments are the same as for `pylinerating.thermal_rating`. Returns a
+        copy of the temperatures after the tick.
+        """
+
+        interval, current, *weather = [
+            np.array(np.broadcast_to(value, self.shape), dtype=float).reshape(-1)
+            for value in (
+                interval,
+                current,
+                ambient_temperature,
+                wind_speed,
+                angle_of_attack,
+                solar_irradiation,
+            )
+        ]
+
+        if np.any(interval < 0):
+            raise ValueError("Invalid argument: the interval can not be negative.")
+
+        # Missing intervals are not integrated
+        missing = np.isnan(interval)
+        interval[missing] = 0.0
+
+        state = self.temperature.reshape(-1)
+        equation = HeatEquation(weather + self._site, self.conductor, self.standard)
+
+        with np.errstate(invalid="ignore"):
+            temperature = equation.integrate(
+                current ** 2, state.astype(float), interval, self.time_step
+            )
+
+        advanced = np.isfinite(temperature) & ~missing
+        state[advanced] = temperature[advanced]
+        self.time.reshape(-1)[advanced] += interval[advanced]
+
+        return self.temperature.copy()
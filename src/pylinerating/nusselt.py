@@ -1,66 +1,140 @@
 import numpy as np
 
+from .wind import sine
+from .workspace import no_buffers, select_regimes
 
-def wind_direction_correction_stranded(angle_of_attack):
-    correction_low = 0.42 + 0.68 * np.sin(angle_of_attack / 180 * np.pi) ** 1.08
-    correction_high = 0.42 + 0.58 * np.sin(angle_of_attack / 180 * np.pi) ** 0.90
 
-    correction = np.where(angle_of_attack <= 24, correction_low, correction_high)
+def wind_direction_correction_stranded(
+    angle_of_attack, sin_angle=None, out=None, buffer=no_buffers
+):
+    """Eq 21-23, page 26, for stranded conductors.
 
-    return correction
-
-
-def nusselt_smooth_conductor(reynolds_number, angle_of_attack):
-    re = reynolds_number
-
-    conditions = [re < 5000, (5000 <= re) & (re < 50000), (50000 <= re) & (re < 200000)]
-
-    B_options = [0.583, 0.148, 0.0208]
-    n_options = [0.471, 0.633, 0.814]
-
-    B = np.select(conditions, B_options)
-    n = np.select(conditions, n_options)
-
-    wind_direction_correction = (
-        np.sin(angle_of_attack / 180 * np.pi) ** 2
-        + 0.0169 * np.cos(angle_of_attack / 180 * np.pi) ** 2
-    ) ** 0.225
-
-    return B * re ** n * wind_direction_correction
-
-
-def nusselt_stranded_small_Rs_conductor(reynolds_number, angle_of_attack):
-    re = reynolds_number
-
-    conditions = [re < 2650, (2650 <= re) & (re < 50000), (50000 <= re) & (re < 200000)]
-
-    B_options = [0.641, 0.178, 0.0208]
-    n_options = [0.471, 0.633, 0.814]
-
-    B = np.select(conditions, B_options)
-    n = np.select(conditions, n_options)
+    The sine of the angle can be passed in `sin_angle` if it is already known.
+    out, buffer: see `pylinerating.workspace`
+    """
 
-    wind_direction_correction = wind_direction_correction_stranded(angle_of_attack)
+    if sin_angle is None:
+        sin_angle = sine(angle_of_attack, out=buffer("sin_angle", angle_of_attack))
 
-    return B * re ** n * wind_direction_correction
+    # 0.42 + 0.68 sin ** 1.08 up to 24°, 0.42 + 0.58 sin ** 0.90 above
+    low_factor, low_exponent = 0.68, 1.08
+    high_factor, high_exponent = 0.58, 0.90
 
+    low = buffer("angle_mask", angle_of_attack, sin_angle, dtype=bool)
+    low = np.less_equal(angle_of_attack, 24, out=low)
 
-def nusselt_stranded_high_Rs_conductor(reynolds_number, angle_of_attack):
-    re = reynolds_number
+    term = buffer("angle_term", angle_of_attack, sin_angle)
+    exponent = np.multiply(low, low_exponent - high_exponent, out=term)
+    exponent = np.add(exponent, high_exponent, out=term)
+    correction = np.power(sin_angle, exponent, out=out)
 
-    conditions = [re < 2650, (2650 <= re) & (re < 50000), (50000 <= re) & (re < 200000)]
+    factor = np.multiply(low, low_factor - high_factor, out=term)
+    factor = np.add(factor, high_factor, out=term)
+    correction = np.multiply(correction, factor, out=out)
 
-    B_options = [0.641, 0.048, 0.0208]
-    n_options = [0.471, 0.800, 0.814]
+    return np.add(correction, 0.42, out=out)
 
-    B = np.select(conditions, B_options)
-    n = np.select(conditions, n_options)
 
-    wind_direction_correction = wind_direction_correction_stranded(angle_of_attack)
+def wind_direction_correction_smooth(
+    angle_of_attack, sin_angle=None, out=None, buffer=no_buffers
+):
+    """(sin ** 2 + 0.0169 cos ** 2) ** 0.225, page 26, for smooth conductors.
 
-    nusselt = B * re ** n * wind_direction_correction
+    The arguments are the same as for `wind_direction_correction_stranded`.
+    """
 
-    return nusselt
+    if sin_angle is None:
+        sin_angle = sine(angle_of_attack, out=buffer("sin_angle", angle_of_attack))
+
+    correction = np.multiply(sin_angle, sin_angle, out=out)
+    correction = np.multiply(correction, 1 - 0.0169, out=out)
+    correction = np.add(correction, 0.0169, out=out)
+
+    return np.power(correction, 0.225, out=out)
+
+
+def _forced_nusselt(function, reynolds_number, correction, out, buffer):
+    """B Re ** n times the correction, with B and n of `FORCED_REGIMES`."""
+
+    bounds, B_options, n_options = FORCED_REGIMES[function]
+    B, n = select_regimes(
+        reynolds_number,
+        bounds,
+        [B_options, n_options],
+        [buffer("regime_factor"), buffer("regime_exponent")],
+        buffer("regime_mask", dtype=bool),
+    )
+
+    nusselt = np.power(reynolds_number, n, out=out)
+    nusselt = np.multiply(nusselt, B, out=out)
+
+    return np.multiply(nusselt, correction, out=out)
+
+
+def nusselt_smooth_conductor(
+    reynolds_number, angle_of_attack, sin_angle=None, out=None, buffer=no_buffers
+):
+    correction = wind_direction_correction_smooth(
+        angle_of_attack,
+        sin_angle,
+        out=buffer("angle_correction", angle_of_attack, sin_angle),
+        buffer=buffer,
+    )
+
+    return _forced_nusselt(
+        nusselt_smooth_conductor, reynolds_number, correction, out, buffer
+    )
+
+
+def nusselt_stranded_small_Rs_conductor(
+    reynolds_number, angle_of_attack, sin_angle=None, out=None, buffer=no_buffers
+):
+    correction = wind_direction_correction_stranded(
+        angle_of_attack,
+        sin_angle,
+        out=buffer("angle_correction", angle_of_attack, sin_angle),
+        buffer=buffer,
+    )
+
+    return _forced_nusselt(
+        nusselt_stranded_small_Rs_conductor, reynolds_number, correction, out, buffer
+    )
+
+
+def nusselt_stranded_high_Rs_conductor(
+    reynolds_number, angle_of_attack, sin_angle=None, out=None, buffer=no_buffers
+):
+    correction = wind_direction_correction_stranded(
+        angle_of_attack,
+        sin_angle,
+        out=buffer("angle_correction", angle_of_attack, sin_angle),
+        buffer=buffer,
+    )
+
+    return _forced_nusselt(
+        nusselt_stranded_high_Rs_conductor, reynolds_number, correction, out, buffer
+    )
+
+
+# The upper bounds of the Reynolds number and the constants B and n of every regime
+# of the functions above, page 26
+FORCED_REGIMES = {
+    nusselt_smooth_conductor: (
+        [5000, 50000, 200000],
+        [0.583, 0.148, 0.0208],
+        [0.471, 0.633, 0.814],
+    ),
+    nusselt_stranded_small_Rs_conductor: (
+        [2650, 50000, 200000],
+        [0.641, 0.178, 0.0208],
+        [0.471, 0.633, 0.814],
+    ),
+    nusselt_stranded_high_Rs_conductor: (
+        [2650, 50000, 200000],
+        [0.641, 0.048, 0.0208],
+        [0.471, 0.800, 0.814],
+    ),
+}
 
 
 def get_nusselt_function(conductor=None, stranded=None, high_rs=None):
@@ -0,0 +1,280 @@
+"""Multi-process rating with the arrays in shared memory.
+
+`SharedMemoryPool` keeps a pool of worker processes for its whole life. The
+inputs and the output of a call are placed in `multiprocessing.shared_memory`
+blocks, the arrays of the conductor too; the workers only receive the names of
+the blocks and the rows of the leading axis they rate, and write their part of
+the result in place. No array is pickled, only the scalars and the callables of
+the conductor (e.g. its resistance function), which must be picklable.
+
+Arrays allocated with `SharedMemoryPool.empty` are used as they are. Any other
+array, including every array of the conductor, is copied into a new temporary
+block on every call, so keep the large weather arrays in `SharedArray`:
+
+    with SharedMemoryPool(4) as pool:
+        wind = pool.empty((spans, times))
+        wind.array[:] = ...
+        rating = pool.thermal_rating(ambient, wind, 90, solar, drake_constants)
+
+The result is split along the leading axis of the broadcast shape, put the
+longest axis first.
+
+Needs Python 3.8 or newer.
+"""
+
+import multiprocessing
+import sys
+import traceback
+from collections import namedtuple
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from . import engine
+from .conductor import conductor_shape, map_arrays
+
+_ARGUMENTS = [
+    "ambient_temperature",
+    "wind_speed",
+    "angle_of_attack",
+    "solar_irradiation",
+    "conductor_temperature",
+    "horizontal_angle",
+    "elevation",
+]
+
+# What a worker needs to attach a block
+BlockDescriptor = namedtuple("BlockDescriptor", ["name", "shape", "dtype"])
+
+
+class SharedArray:
+    """A numpy array in a shared memory block, `array` is the view of the block."""
+
+    def __init__(self, shape, dtype=float):
+        shape = tuple(int(n) for n in np.atleast_1d(shape))
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf)
+
+    @classmethod
+    def copy_of(cls, value):
+        value = np.asarray(value)
+        shared = cls(value.shape, value.dtype)
+        shared.array[...] = value
+        return shared
+
+    @property
+    def descriptor(self):
+        """What a worker needs to attach the block: (name, shape, dtype)."""
+        return BlockDescriptor(self.shm.name, self.array.shape, self.array.dtype.str)
+
+    def close(self):
+        """Release the block, the array must not be used afterwards."""
+
+        self.array = None
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _attach(descriptor):
+    name, shape, dtype = descriptor
+
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+        # The creator owns the block, the worker must not unlink it at exit
+        resource_tracker.unregister(shm._name, "shared_memory")
+
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _rate_into(task, blocks):
+    inputs, out, start, stop, ndim, conductor, standard = task
+
+    def rows(value):
+        if value.ndim == ndim and value.shape[0] != 1:
+            return value[start:stop]
+        return value
+
+    def attach_rows(descriptor):
+        shm, value = _attach(descriptor)
+        blocks.append(shm)
+        return rows(value)
+
+    arguments = [
+        attach_rows(value) if isinstance(value, BlockDescriptor) else value
+        for value in inputs
+    ]
+    conductor = map_arrays(conductor, attach_rows, types=BlockDescriptor)
+
+    shm, result = _attach(out)
+    blocks.append(shm)
+
+    result[start:stop] = engine.thermal_rating(
+        conductor=conductor, standard=standard, **dict(zip(_ARGUMENTS, arguments))
+    )
+
+
+def _rate_rows(task):
+    """Worker: rate the rows start:stop into the output block."""
+
+    blocks = []
+
+    # The views of the blocks are gone when _rate_into returns, only then the
+    # blocks can be closed
+    try:
+        _rate_into(task, blocks)
+    except Exception as error:
+        # The frames of the traceback still hold the views
+        traceback.clear_frames(error.__traceback__)
+        raise
+    finally:
+        for shm in blocks:
+            shm.close()
+
+
+class SharedMemoryPool:
+    """A reusable pool of worker processes rating arrays in shared memory.
+
+    processes: the number of workers, the number of CPUs by default
+    tasks:     the number of row blocks per worker and call, more blocks balance
+               the load better
+    """
+
+    def __init__(self, processes=None, tasks=4, context=None):
+        self.processes = processes or multiprocessing.cpu_count()
+        self.tasks = tasks
+        self._pool = multiprocessing.get_context(context).Pool(self.processes)
+
+    def empty(self, shape, dtype=float):
+        """A `SharedArray` the caller fills and closes, used without a copy."""
+        return SharedArray(shape, dtype)
+
+    def thermal_rating(
+        self,
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor,
+        conductor_temperature=80.0,
+        horizontal_angle=0,
+        elevation=500,
+        standard="cigre",
+        out=None,
+    ):
+        """Calculate the rating in the worker processes.
+
+        The arguments are the same as for `pylinerating.thermal_rating`, arrays
+        can be numpy arrays or `SharedArray`. The numpy arrays and the arrays of
+        the conductor are copied into new shared blocks on every call.
+        out: a `SharedArray` or a numpy array of the broadcast shape for the
+             result. A numpy array is filled from a temporary block. Without
+             it the result is returned as a new numpy array.
+        """
+
+        engine.get_engine(standard)
+
+        values = [
+            ambient_temperature,
+            wind_speed,
+            angle_of_attack,
+            solar_irradiation,
+            conductor_temperature,
+            horizontal_angle,
+            elevation,
+        ]
+        arrays = [v.array if isinstance(v, SharedArray) else v for v in values]
+        shape = np.broadcast(
+            *arrays, np.broadcast_to(0, conductor_shape(conductor))
+        ).shape
+
+        if out is not None:
+            if not isinstance(out, (SharedArray, np.ndarray)):
+                raise ValueError(
+                    "Invalid argument: out must be a SharedArray or a numpy array."
+                )
+
+            out_shape = out.array.shape if isinstance(out, SharedArray) else out.shape
+            if out_shape != shape:
+                raise ValueError("Invalid argument: out must have the broadcast shape.")
+
+        temporary = []
+
+        try:
+            inputs = []
+            for value in values:
+                if not isinstance(value, SharedArray) and np.ndim(value) > 0:
+                    value = SharedArray.copy_of(value)
+                    temporary.append(value)
+
+                inputs.append(
+                    value.descriptor if isinstance(value, SharedArray) else value
+                )
+
+            def share(value):
+                shared = SharedArray.copy_of(value)
+                temporary.append(shared)
+                return shared.descriptor
+
+            shared_conductor = map_arrays(conductor, share)
+
+            if isinstance(out, SharedArray):
+                result = out
+            else:
+                # A scalar result is rated as one row
+                result = SharedArray(shape or (1,))
+                temporary.append(result)
+
+            rows = shape[0] if shape else 1
+            ndim = len(shape)
+
+            bounds = np.linspace(0, rows, min(rows, self.processes * self.tasks) + 1)
+            bounds = np.unique(bounds.astype(int))
+
+            self._pool.map(
+                _rate_rows,
+                [
+                    (
+                        inputs,
+                        result.descriptor,
+                        start,
+                        stop,
+                        ndim,
+                        shared_conductor,
+                        standard,
+                    )
+                    for start, stop in zip(bounds[:-1], bounds[1:])
+                ],
+            )
+
+            if isinstance(out, SharedArray):
+                return out.array
+
+            if out is not None:
+                out[...] = result.array.reshape(shape)
+                return out
+
+            return np.array(result.array).reshape(shape)
+        finally:
+            for shared in temporary:
+                shared.close()
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,198 @@
+"""AC resistance of the conductor: skin effect and the magnetic heating of the steel core.
+
+`ACResistance` wraps a DC resistance (a callable of the temperature, like
+`conductor.drake_resistance`) and can be used as the `resistance` of a
+`ConductorConstants`. Called with the temperature only it gives the resistance
+with the skin effect; called with the current too it adds the magnetic heating
+of the steel core of ACSR with an odd number of aluminum layers
+(CIGRE-601 section 2.1.3). The magnetic heating is modelled as an increase of
+the resistance linear in the current density of the aluminum, up to a
+saturation. CIGRE-601 gives no general values of the two coefficients, they
+depend on the construction of the conductor and have to be fitted to
+measurements or data of the manufacturer, so they have no defaults.
+
+Because the resistance depends on the current, the rating is found by the fixed
+point iteration I = sqrt(balance / R(T, I)) in `thermal_rating_ac`.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from . import engine
+from .conductor import map_arrays
+
+
+def skin_effect_factor(dc_resistance, frequency=50.0, skin_coefficient=1.0):
+    """Ratio of the AC and the DC resistance due to the skin effect.
+
+    The approximation of IEC 60287-1-1 section 2.1.2, valid for x_s < 2.8:
+    x_s^2 = 8 pi f k_s 1e-7 / R_dc and y_s = x_s^4 / (192 + 0.8 x_s^4).
+
+    dc_resistance:    in [ohm/m]
+    frequency:        in [Hz]
+    skin_coefficient: k_s, 1 for a solid round conductor, about 0.8 for stranded
+                      conductors with a steel core
+    """
+
+    xs4 = (8 * np.pi * frequency * skin_coefficient * 1e-7 / dc_resistance) ** 2
+
+    return 1 + xs4 / (192 + 0.8 * xs4)
+
+
+def magnetic_factor(current, aluminum_area, slope, saturation):
+    """Relative increase of the resistance due to the magnetisation of the core.
+
+    current:       in [A]
+    aluminum_area: the cross section of the aluminum in [mm^2]
+    slope:         the increase per [A/mm^2] of current density in the aluminum
+    saturation:    the largest increase
+    """
+
+    return np.minimum(slope * np.abs(current) / aluminum_area, saturation)
+
+
+class ACResistance(
+    namedtuple(
+        "ACResistance",
+        [
+            "dc_resistance",
+            "frequency",
+            "skin_coefficient",
+            "aluminum_area",
+            "magnetic_slope",
+            "magnetic_saturation",
+        ],
+    )
+):
+    """AC resistance in [ohm/m] as a function of the temperature and the current.
+
+    dc_resistance:       callable of the conductor temperature, returns [ohm/m]
+    frequency:           in [Hz]
+    skin_coefficient:    see `skin_effect_factor`
+    aluminum_area:       the cross section of the aluminum in [mm^2], only needed
+                         for the magnetic heating
+    magnetic_slope,
+    magnetic_saturation: see `magnetic_factor`, None for no magnetic heating
+                         (e.g. an even number of aluminum layers)
+    """
+
+    __slots__ = ()
+
+    def __new__(
+        cls,
+        dc_resistance,
+        frequency=50.0,
+        skin_coefficient=1.0,
+        aluminum_area=None,
+        magnetic_slope=None,
+        magnetic_saturation=None,
+    ):
+        magnetic = [aluminum_area, magnetic_slope, magnetic_saturation]
+
+        if magnetic_slope is not None and any(value is None for value in magnetic):
+            raise ValueError(
+                "Invalid argument: the magnetic heating needs the aluminum_area "
+                "and the magnetic_saturation."
+            )
+
+        return super().__new__(
+            cls,
+            dc_resistance,
+            frequency,
+            skin_coefficient,
+            aluminum_area,
+            magnetic_slope,
+            magnetic_saturation,
+        )
+
+    @property
+    def magnetic(self):
+        return self.magnetic_slope is not None
+
+    def __call__(self, conductor_temperature, current=None):
+        dc = self.dc_resistance(conductor_temperature)
+        resistance = dc * skin_effect_factor(dc, self.frequency, self.skin_coefficient)
+
+        if current is None or not self.magnetic:
+            return resistance
+
+        return resistance * (
+            1
+            + magnetic_factor(
+                current,
+                self.aluminum_area,
+                self.magnetic_slope,
+                self.magnetic_saturation,
+            )
+        )
+
+
+def thermal_rating_ac(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    conductor_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    standard="cigre",
+    max_iterations=20,
+    tolerance=1e-3,
+):
+    """Calculate the rating with a resistance that depends on the current.
+
+    The arguments are the same as for `pylinerating.thermal_rating`, the
+    `resistance` of the conductor must accept the current as the second argument
+    (see `ACResistance`).
+
+    max_iterations: the limit of the fixed point iterations
+    tolerance:      every element is iterated until it changes by less than this
+                    [A] and is then left out of the next iterations
+    """
+
+    prepared = engine.prepare_inputs(
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor,
+        conductor_temperature,
+        horizontal_angle,
+        elevation,
+    )
+    balance = engine.get_engine(standard).heat_balance(prepared)
+
+    # The rating without the magnetic heating is the upper bound and the start
+    current = np.sqrt(balance / prepared.resistance)
+
+    if not getattr(conductor.resistance, "magnetic", False):
+        return current
+
+    shape = prepared.shape
+
+    def flat(value):
+        return np.broadcast_to(value, shape).reshape(-1)
+
+    balance = flat(balance)
+    temperature = flat(conductor_temperature)
+    result = np.array(flat(current))
+    active = np.arange(result.size)
+
+    for _ in range(max_iterations):
+        # The constants of the resistance can be arrays too
+        resistance = map_arrays(conductor.resistance, lambda value: flat(value)[active])
+        updated = np.sqrt(
+            balance[active] / resistance(temperature[active], result[active])
+        )
+
+        # NaN never changes by more than the tolerance
+        changed = np.abs(updated - result[active]) > tolerance
+        result[active] = updated
+        active = active[changed]
+
+        if active.size == 0:
+            break
+
+    return result.reshape(shape)
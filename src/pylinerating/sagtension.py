@@ -0,0 +1,180 @@
+"""Sag-tension of a ruling span and the clearance limited rating.
+
+The sag of a ruling span grows with the conductor temperature. With the
+parabolic approximation and a linear elastic conductor, the state change
+equation between the reference state (T0, H0) and any other state (T, H) is
+
+    w^2 L^2 / 24 (1 / H^2 - 1 / H0^2) = alpha (T - T0) + (H - H0) / (E A)
+
+The maximum sag fixes the minimum tension H = w L^2 / (8 S), so the temperature
+at which the span reaches its clearance limit follows explicitly, without a
+root-find. The clearance limited rating is then the thermal rating at the lower
+of this temperature and the maximum operating temperature, for all the spans and
+weather at once.
+
+Units: lengths in [m], tensions in [N], weights in [N/m].
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from . import engine
+
+ConductorMechanics = namedtuple(
+    "ConductorMechanics",
+    ["weight", "area", "elastic_modulus", "thermal_expansion"],
+)
+
+# ACSR Drake 26/7, final modulus of the composite conductor
+drake_mechanics = ConductorMechanics(
+    weight=1.628 * 9.81,
+    area=468.6e-6,
+    elastic_modulus=74.5e9,
+    thermal_expansion=18.9e-6,
+)
+
+
+def sag(tension, weight, span_length):
+    """The sag of a span with the horizontal tension, parabolic approximation."""
+    return weight * span_length ** 2 / (8 * tension)
+
+
+def tension_at_sag(maximum_sag, weight, span_length):
+    """The horizontal tension at which the span has the sag `maximum_sag`."""
+    return weight * span_length ** 2 / (8 * maximum_sag)
+
+
+def temperature_at_tension(
+    tension, mechanics, span_length, reference_temperature, reference_tension
+):
+    """The conductor temperature at which the horizontal tension is `tension`.
+
+    The state change equation solved for the temperature.
+    """
+
+    w = mechanics.weight
+    ea = mechanics.elastic_modulus * mechanics.area
+
+    slack = (
+        w ** 2 * span_length ** 2 / 24 * (1 / tension ** 2 - 1 / reference_tension ** 2)
+    )
+    elastic = (tension - reference_tension) / ea
+
+    return reference_temperature + (slack - elastic) / mechanics.thermal_expansion
+
+
+def tension_at_temperature(
+    temperature,
+    mechanics,
+    span_length,
+    reference_temperature,
+    reference_tension,
+    max_iterations=20,
+    tolerance=1e-6,
+):
+    """The horizontal tension at the conductor temperature.
+
+    Solves the state change equation by Newton's method. The residual is
+    increasing and concave in the tension, so the iteration from the reference
+    tension converges monotonically after the first step.
+    """
+
+    w = mechanics.weight
+    ea = mechanics.elastic_modulus * mechanics.area
+    c = ea * w ** 2 * span_length ** 2 / 24
+
+    shift = ea * mechanics.thermal_expansion * (temperature - reference_temperature)
+    shift = shift - reference_tension + c / reference_tension ** 2
+
+    tension = np.broadcast_to(
+        np.asarray(reference_tension, dtype=float), np.shape(shift)
+    )
+
+    for _ in range(max_iterations):
+        residual = tension + shift - c / tension ** 2
+        step = residual / (1 + 2 * c / tension ** 3)
+
+        # The tension stays positive, a step past 0 is halved towards it
+        tension = np.where(step < tension, tension - step, 0.5 * tension)
+
+        if not (np.abs(step) > tolerance * tension).any():
+            break
+
+    return tension
+
+
+def sag_at_temperature(
+    temperature, mechanics, span_length, reference_temperature, reference_tension
+):
+    tension = tension_at_temperature(
+        temperature, mechanics, span_length, reference_temperature, reference_tension
+    )
+
+    return sag(tension, mechanics.weight, span_length)
+
+
+def clearance_temperature(
+    maximum_sag, mechanics, span_length, reference_temperature, reference_tension
+):
+    """The conductor temperature at which the span reaches `maximum_sag` in [°C]."""
+
+    tension = tension_at_sag(maximum_sag, mechanics.weight, span_length)
+
+    return temperature_at_tension(
+        tension, mechanics, span_length, reference_temperature, reference_tension
+    )
+
+
+def clearance_limited_rating(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    mechanics,
+    span_length,
+    reference_temperature,
+    reference_tension,
+    maximum_sag,
+    maximum_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    standard="cigre",
+):
+    """The maximum current that keeps the conductor below the MOT and the sag limit.
+
+    The weather arguments are the same as for `pylinerating.thermal_rating`.
+    The span arguments can be arrays, e.g. of the shape (span, 1) against
+    (span, time) weather.
+
+    mechanics:             `ConductorMechanics`
+    span_length:           the ruling span in [m]
+    reference_temperature: the temperature of the reference state in [°C]
+    reference_tension:     the horizontal tension in the reference state in [N]
+    maximum_sag:           the sag at the clearance limit in [m]
+    maximum_temperature:   the maximum operating temperature in [°C]
+    """
+
+    limit = np.minimum(
+        clearance_temperature(
+            maximum_sag,
+            mechanics,
+            span_length,
+            reference_temperature,
+            reference_tension,
+        ),
+        maximum_temperature,
+    )
+
+    return engine.thermal_rating(
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor,
+        conductor_temperature=limit,
+        horizontal_angle=horizontal_angle,
+        elevation=elevation,
+        standard=standard,
+    )
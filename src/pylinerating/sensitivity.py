@@ -0,0 +1,299 @@
+"""Derivatives of the rating by forward mode automatic differentiation.
+
+The functions in `cigre601` and `ieee738` are evaluated once on `Dual` numbers that
+carry the value together with the derivatives with respect to the weather
+parameters. Piecewise parts of the standards (the `np.maximum` of forced and
+natural convection, the `np.select` of the Nusselt regimes) propagate the
+derivative of the active branch, which is the exact derivative everywhere except
+on the switching boundaries.
+"""
+
+import numpy as np
+
+from . import cigre601
+from . import ieee738
+
+PARAMETERS = (
+    "ambient_temperature",
+    "wind_speed",
+    "angle_of_attack",
+    "solar_irradiation",
+)
+
+_rating_functions = {
+    "cigre": cigre601.thermal_rating,
+    "ieee": ieee738.thermal_rating,
+}
+
+
+def _split(x):
+    if isinstance(x, Dual):
+        return x.value, x.derivative
+    return np.asarray(x), None
+
+
+def _scale(derivative, factor):
+    """Multiply the derivative by a factor with the shape of the value."""
+    if derivative is None:
+        return None
+    return derivative * np.expand_dims(factor, -1)
+
+
+def _add(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a + b
+
+
+def _make(value, derivative):
+    if derivative is None:
+        return value
+    return Dual(value, derivative)
+
+
+def _plus(a, b):
+    a, da = _split(a)
+    b, db = _split(b)
+    return _make(a + b, _add(da, db))
+
+
+def _minus(a, b):
+    a, da = _split(a)
+    b, db = _split(b)
+    return _make(a - b, _add(da, None if db is None else -db))
+
+
+def _times(a, b):
+    a, da = _split(a)
+    b, db = _split(b)
+    return _make(a * b, _add(_scale(da, b), _scale(db, a)))
+
+
+def _divide(a, b):
+    a, da = _split(a)
+    b, db = _split(b)
+    value = a / b
+    return _make(value, _add(_scale(da, 1 / b), _scale(db, -value / b)))
+
+
+def _power(a, b):
+    if isinstance(b, Dual):
+        raise TypeError("Only constant exponents are supported.")
+
+    a, da = _split(a)
+    b = np.asarray(b)
+    return _make(a ** b, _scale(da, b * a ** (b - 1)))
+
+
+def _remainder(a, b):
+    if isinstance(b, Dual):
+        raise TypeError("Only constant divisors are supported.")
+
+    a, da = _split(a)
+    return _make(a % b, da)
+
+
+def _select_derivative(condition, a, b):
+    """Pick the derivatives of `a` where condition is true, of `b` elsewhere."""
+    a, da = _split(a)
+    b, db = _split(b)
+
+    if da is None:
+        da = np.zeros_like(db)
+    if db is None:
+        db = np.zeros_like(da)
+
+    return np.where(np.expand_dims(condition, -1), da, db)
+
+
+def _maximum(a, b):
+    a_value, b_value = _split(a)[0], _split(b)[0]
+    return Dual(
+        np.maximum(a_value, b_value), _select_derivative(a_value >= b_value, a, b)
+    )
+
+
+def _where(condition, a, b):
+    condition = np.asarray(condition)
+    value = np.where(condition, _split(a)[0], _split(b)[0])
+    return Dual(value, _select_derivative(condition, a, b))
+
+
+def _compare(operator):
+    def compare(a, b):
+        return operator(_split(a)[0], _split(b)[0])
+
+    return compare
+
+
+class Dual:
+    """An array of values with derivatives in an extra trailing axis.
+
+    value:      array of values
+    derivative: array with the shape `value.shape + (n,)` (or broadcastable to it)
+    """
+
+    __slots__ = ("value", "derivative")
+
+    def __init__(self, value, derivative):
+        self.value = np.asarray(value)
+        self.derivative = np.asarray(derivative)
+
+    @property
+    def shape(self):
+        return self.value.shape
+
+    def __repr__(self):
+        return "Dual({!r}, {!r})".format(self.value, self.derivative)
+
+    def __add__(self, other):
+        return _plus(self, other)
+
+    def __radd__(self, other):
+        return _plus(other, self)
+
+    def __sub__(self, other):
+        return _minus(self, other)
+
+    def __rsub__(self, other):
+        return _minus(other, self)
+
+    def __neg__(self):
+        return Dual(-self.value, -self.derivative)
+
+    def __mul__(self, other):
+        return _times(self, other)
+
+    def __rmul__(self, other):
+        return _times(other, self)
+
+    def __truediv__(self, other):
+        return _divide(self, other)
+
+    def __rtruediv__(self, other):
+        return _divide(other, self)
+
+    def __pow__(self, exponent):
+        return _power(self, exponent)
+
+    def __mod__(self, other):
+        return _remainder(self, other)
+
+    def __lt__(self, other):
+        return self.value < _split(other)[0]
+
+    def __le__(self, other):
+        return self.value <= _split(other)[0]
+
+    def __gt__(self, other):
+        return self.value > _split(other)[0]
+
+    def __ge__(self, other):
+        return self.value >= _split(other)[0]
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        if ufunc in _binary_ufuncs:
+            return _binary_ufuncs[ufunc](*inputs)
+
+        if ufunc in _unary_ufuncs:
+            (x,) = inputs
+            value, slope = _unary_ufuncs[ufunc](x.value)
+            return Dual(value, _scale(x.derivative, slope))
+
+        return NotImplemented
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func is np.where and len(args) == 3 and not kwargs:
+            return _where(*args)
+
+        return NotImplemented
+
+
+_binary_ufuncs = {
+    np.add: _plus,
+    np.subtract: _minus,
+    np.multiply: _times,
+    np.true_divide: _divide,
+    np.power: _power,
+    np.remainder: _remainder,
+    np.maximum: _maximum,
+    np.less: _compare(np.less),
+    np.less_equal: _compare(np.less_equal),
+    np.greater: _compare(np.greater),
+    np.greater_equal: _compare(np.greater_equal),
+}
+
+_unary_ufuncs = {
+    np.negative: lambda x: (-x, -np.ones_like(x)),
+    np.absolute: lambda x: (np.abs(x), np.sign(x)),
+    np.sin: lambda x: (np.sin(x), np.cos(x)),
+    np.cos: lambda x: (np.cos(x), -np.sin(x)),
+    np.sqrt: lambda x: (np.sqrt(x), 0.5 / np.sqrt(x)),
+}
+
+
+def seed(values):
+    """Make `Dual` variables for differentiation with respect to all `values`.
+
+    The i-th returned variable has the unit derivative in the i-th column.
+    """
+
+    count = len(values)
+    seeded = []
+
+    for index, value in enumerate(values):
+        value = np.asarray(value, dtype=float)
+        derivative = np.zeros(value.shape + (count,))
+        derivative[..., index] = 1.0
+        seeded.append(Dual(value, derivative))
+
+    return seeded
+
+
+def thermal_rating_jacobian(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    conductor_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    standard="cigre",
+):
+    """Calculate the rating and its derivatives in a single pass.
+
+    The arguments are the same as for `pylinerating.thermal_rating`.
+
+    Returns a tuple (rating, jacobian). The last axis of the jacobian holds the
+    derivatives with respect to `PARAMETERS`: ambient temperature in [A/°C], wind
+    speed in [A/(m/s)], angle of attack in [A/°] and solar irradiation in
+    [A/(W/m^2)].
+    """
+
+    if standard not in _rating_functions:
+        raise ValueError("Invalid argument: standard must be cigre or ieee.")
+
+    variables = seed(
+        [ambient_temperature, wind_speed, angle_of_attack, solar_irradiation]
+    )
+
+    # The branches not selected by np.where / np.maximum can have infinite slopes
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rating = _rating_functions[standard](
+            *variables,
+            conductor,
+            conductor_temperature=conductor_temperature,
+            horizontal_angle=horizontal_angle,
+            elevation=elevation,
+        )
+
+    shape = rating.value.shape
+    jacobian = np.broadcast_to(rating.derivative, shape + (len(PARAMETERS),))
+
+    return rating.value, np.array(jacobian)
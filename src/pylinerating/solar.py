@@ -0,0 +1,229 @@
+"""Position of the sun and the clear sky solar irradiation.
+
+The result of `effective_irradiation` can be passed directly as the
+`solar_irradiation` argument of `thermal_rating`: the solar heating is then
+absorptivity * irradiation * diameter for both standards.
+
+The latitude, span azimuth and elevation are broadcast against the timestamps,
+e.g. (span, 1) arrays against a (time,) array of timestamps. Everything that
+depends only on the time (day of year, declination, hour angle) is computed once
+per distinct timestamp.
+
+Angles are in [°], azimuths are measured clockwise from the north. Timestamps
+are numpy datetime64 in local solar time, or in UTC when the longitude is given.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+SolarPosition = namedtuple("SolarPosition", ["altitude", "azimuth"])
+
+# IEEE-738, table 5 (SI units), coefficients of the polynomial in the altitude
+_ieee_heat_flux_coefficients = {
+    "clear": [
+        -42.2391,
+        63.8044,
+        -1.9220,
+        3.46921e-2,
+        -3.61118e-4,
+        1.94318e-6,
+        -4.07608e-9,
+    ],
+    "industrial": [
+        53.1821,
+        14.2110,
+        6.6138e-1,
+        -3.1658e-2,
+        5.4654e-4,
+        -4.3446e-6,
+        1.3236e-8,
+    ],
+}
+
+
+def day_of_year_and_hour(timestamps, longitude=None):
+    """Day of the year (1 = January 1) and the hour of the solar day.
+
+    With `longitude` in [°] the timestamps are taken as UTC and shifted by
+    longitude / 15 hours to solar time (the equation of time is neglected).
+    """
+
+    timestamps = np.asarray(timestamps, dtype="datetime64[s]")
+
+    if longitude is not None:
+        shift = np.round(np.asarray(longitude) * 240.0).astype("timedelta64[s]")
+        timestamps = timestamps + shift
+
+    days = timestamps.astype("datetime64[D]")
+    day_of_year = (days - days.astype("datetime64[Y]")).astype(int) + 1
+    hour = (timestamps - days) / np.timedelta64(1, "h")
+
+    return day_of_year, hour
+
+
+def declination(day_of_year, standard="cigre"):
+    """Solar declination in [°].
+
+    CIGRE-601 section 3.3 uses 23.3°, IEEE-738 annex A uses 23.46°.
+    """
+
+    amplitude = {"cigre": 23.3, "ieee": 23.46}[standard]
+
+    return amplitude * np.sin(2 * np.pi * (284 + day_of_year) / 365)
+
+
+def hour_angle(hour):
+    """Hour angle in [°], 15° per hour, 0 at solar noon, negative in the morning."""
+    return 15.0 * (hour - 12.0)
+
+
+def _per_timestamp(timestamps, longitude, standard):
+    """Declination and hour angle, evaluated once per distinct timestamp."""
+
+    timestamps = np.asarray(timestamps, dtype="datetime64[s]")
+
+    if longitude is not None and np.ndim(longitude) > 0:
+        # Every span has its own solar time, nothing to share
+        day_of_year, hour = day_of_year_and_hour(timestamps, longitude)
+        return declination(day_of_year, standard), hour_angle(hour)
+
+    unique, inverse = np.unique(timestamps, return_inverse=True)
+    day_of_year, hour = day_of_year_and_hour(unique, longitude)
+
+    delta = declination(day_of_year, standard)[inverse].reshape(timestamps.shape)
+    omega = hour_angle(hour)[inverse].reshape(timestamps.shape)
+
+    return delta, omega
+
+
+def solar_position(latitude, timestamps, longitude=None, standard="cigre"):
+    """Altitude and azimuth of the sun in [°].
+
+    IEEE-738 eq 16a and 17a, CIGRE-601 section 3.3. The azimuth uses arctan2,
+    which gives the same result as the table of constants of IEEE-738.
+    """
+
+    delta, omega = _per_timestamp(timestamps, longitude, standard)
+
+    delta = np.radians(delta)
+    omega = np.radians(omega)
+    latitude = np.radians(latitude)
+
+    sin_omega = np.sin(omega)
+    cos_omega = np.cos(omega)
+    sin_delta = np.sin(delta)
+    cos_delta = np.cos(delta)
+
+    sin_altitude = (
+        np.cos(latitude) * cos_delta * cos_omega + np.sin(latitude) * sin_delta
+    )
+    altitude = np.degrees(np.arcsin(np.clip(sin_altitude, -1.0, 1.0)))
+
+    azimuth = (
+        np.degrees(
+            np.arctan2(
+                sin_omega * cos_delta,
+                np.sin(latitude) * cos_omega * cos_delta - np.cos(latitude) * sin_delta,
+            )
+        )
+        + 180.0
+    ) % 360.0
+
+    return SolarPosition(altitude, azimuth)
+
+
+def incidence_angle(altitude, azimuth, span_azimuth):
+    """Angle between the rays of the sun and the axis of the span in [°].
+
+    IEEE-738 eq 9, CIGRE-601 section 3.3.
+    """
+
+    cos_incidence = np.cos(np.radians(altitude)) * np.cos(
+        np.radians(azimuth - span_azimuth)
+    )
+
+    return np.degrees(np.arccos(np.clip(cos_incidence, -1.0, 1.0)))
+
+
+def ieee_heat_flux(altitude, elevation=0.0, atmosphere="clear"):
+    """Total heat flux on a surface normal to the sun in [W/m^2].
+
+    IEEE-738 eq 18 with the elevation correction factor of eq 20.
+    """
+
+    coefficients = _ieee_heat_flux_coefficients[atmosphere]
+
+    # Horner's scheme of A + B Hc + C Hc^2 + ... + G Hc^6
+    flux = np.full(np.shape(altitude), coefficients[-1])
+    for coefficient in reversed(coefficients[:-1]):
+        flux = flux * altitude + coefficient
+
+    correction = 1 + 1.148e-4 * elevation - 1.108e-8 * elevation ** 2
+
+    return np.where(altitude > 0, correction * np.maximum(flux, 0.0), 0.0)
+
+
+def cigre_irradiance(altitude, elevation=0.0, clearness_ratio=1.0):
+    """Direct beam and diffuse irradiance of a clear sky in [W/m^2].
+
+    CIGRE-601 section 3.3: the beam at sea level scaled by the clearness ratio,
+    corrected for the elevation, and the diffuse irradiance derived from it.
+
+    Returns a tuple (beam, diffuse).
+    """
+
+    sin_altitude = np.maximum(np.sin(np.radians(altitude)), 0.0)
+
+    beam = clearness_ratio * 1280 * sin_altitude / (sin_altitude + 0.314)
+    beam = beam * (1 + 1.4e-4 * elevation * (1367 / np.where(beam > 0, beam, 1367) - 1))
+
+    diffuse = (430.5 - 0.3288 * beam) * sin_altitude
+
+    return beam, diffuse
+
+
+def effective_irradiation(
+    latitude,
+    span_azimuth,
+    elevation,
+    timestamps,
+    longitude=None,
+    standard="cigre",
+    albedo=0.1,
+    atmosphere="clear",
+    clearness_ratio=1.0,
+):
+    """Irradiation for the `solar_irradiation` argument of `thermal_rating`.
+
+    latitude:        in [°], positive on the northern hemisphere
+    span_azimuth:    the direction of the span in [°], clockwise from the north
+    elevation:       the see level elevation in [m]
+    timestamps:      numpy datetime64, see `day_of_year_and_hour`
+    longitude:       in [°], positive to the east, if the timestamps are in UTC
+    standard:        either `cigre` of `ieee`
+    albedo:          reflectance of the ground, only CIGRE-601
+    atmosphere:      `clear` or `industrial`, only IEEE-738
+    clearness_ratio: scaling of the direct beam, only CIGRE-601
+    """
+
+    if standard not in ("cigre", "ieee"):
+        raise ValueError("Invalid argument: standard must be cigre or ieee.")
+
+    position = solar_position(latitude, timestamps, longitude, standard)
+    incidence = np.radians(
+        incidence_angle(position.altitude, position.azimuth, span_azimuth)
+    )
+
+    if standard == "ieee":
+        # IEEE-738 eq 8, qs = alpha * Qse * sin(theta) * D
+        flux = ieee_heat_flux(position.altitude, elevation, atmosphere)
+        return flux * np.sin(incidence)
+
+    beam, diffuse = cigre_irradiance(position.altitude, elevation, clearness_ratio)
+    sin_altitude = np.maximum(np.sin(np.radians(position.altitude)), 0.0)
+
+    # Direct, diffuse and reflected irradiation of the conductor
+    return beam * (
+        np.sin(incidence) + 0.5 * np.pi * albedo * sin_altitude
+    ) + diffuse * (1 + 0.5 * np.pi * albedo)
@@ -0,0 +1,625 @@
+"""Fast polynomial surrogates of the rating with a certified error bound.
+
+For one conductor, conductor temperature, elevation and horizontal angle the
+heat balance of both standards separates into functions of the ambient
+temperature Ta and cheap closed forms:
+
+    L       = log(Tc - Ta)
+    forced  = K(angle) * exp(L + A(Ta) + log Nu(log V + q(Ta)))
+    natural = exp(1.25 L + N(Ta))
+    rating  = sqrt((max(forced, natural) + radiation(Ta) - alpha D S) / R(Tc))
+
+A(Ta) is the logarithm of the conductivity of the air, q(Ta) the logarithm of
+the Reynolds number at 1 m/s and N(Ta) the logarithm of the natural convection
+over (Tc - Ta) ** 1.25. They are smooth and fitted by piecewise Chebyshev
+polynomials of a low degree, split where Gr * Pr crosses the bounds of the
+regimes of the natural convection so that no piece has to approximate a jump.
+The Nusselt number of the forced convection is evaluated exactly from log Re in
+its regimes, as are the radiation and the solar heating. The angle correction is computed
+from a fitted sine (CIGRE-601) or fitted itself (IEEE-738), np.sin is slow.
+
+The fit error of A, q and N is measured on a dense grid in every piece and
+propagated to `max_relative_error`, the bound of the relative error of the
+rating in the whole envelope. The bound does not hold within the fit error of
+a bound of the Reynolds regimes, where the standard itself jumps, and it does
+not include the roundoff. Outside the envelope the surrogate returns NaN.
+
+    surrogate = fit_surrogate(drake_constants, conductor_temperature=80)
+    rating = surrogate(ambient, wind, angle, solar)
+"""
+
+from collections import namedtuple
+
+import numpy as np
+from numpy.polynomial import chebyshev, polynomial
+
+from . import cigre601
+from . import ieee738
+from . import nusselt
+from .workspace import Workspace
+
+Envelope = namedtuple(
+    "Envelope", ["ambient_temperature", "wind_speed", "solar_irradiation"]
+)
+
+# The natural convection is fitted over (Tc - Ta) ** NATURAL_EXPONENT, the power
+# of IEEE-738 and of the common regime of CIGRE-601, which leaves a smooth rest
+NATURAL_EXPONENT = 1.25
+
+
+class PiecewiseChebyshev:
+    """A piecewise polynomial fitted at the Chebyshev points of every piece.
+
+    breaks:       the boundaries of the pieces, increasing
+    coefficients: (piece, degree + 1), power series in the variable scaled to
+                  [-1, 1] within the piece, lowest degree first
+    error:        the maximum absolute error on the check grid
+    """
+
+    def __init__(self, breaks, coefficients, error):
+        self.breaks = np.asarray(breaks, dtype=float)
+        self.coefficients = np.asarray(coefficients, dtype=float)
+        self.error = error
+
+        self._centre = 0.5 * (self.breaks[1:] + self.breaks[:-1])
+        self._scale = 2.0 / (self.breaks[1:] - self.breaks[:-1])
+        # The columns are gathered per element when there are several pieces
+        self._columns = np.ascontiguousarray(self.coefficients.T)
+
+    @property
+    def pieces(self):
+        return len(self.coefficients)
+
+    @property
+    def degree(self):
+        return self.coefficients.shape[1] - 1
+
+    @classmethod
+    def fit(cls, function, breaks, tolerance, max_degree=12, check_points=2001):
+        """Fit `function` (vectorized) within `tolerance` on every piece.
+
+        The degree of a piece is increased up to `max_degree`, then the piece is
+        halved. The function is only evaluated inside the pieces, a jump at a
+        break is allowed.
+        """
+
+        check = np.linspace(-1, 1, check_points)[1:-1]
+        pieces = []
+        stack = list(zip(breaks[1:], breaks[:-1]))[::-1]
+
+        while stack:
+            b, a = stack.pop()
+            centre, half = 0.5 * (a + b), 0.5 * (b - a)
+
+            def scaled(t):
+                return function(centre + half * t)
+
+            exact = scaled(check)
+
+            for degree in range(max_degree + 1):
+                # The error of the power series, which is what is evaluated
+                power = chebyshev.cheb2poly(chebyshev.chebinterpolate(scaled, degree))
+                error = np.max(np.abs(polynomial.polyval(check, power) - exact))
+
+                if error <= tolerance:
+                    pieces.append((b, power, error))
+                    break
+            else:
+                if half < 1e-6 * max(1.0, abs(centre)):
+                    raise ValueError(
+                        "Invalid argument: the function cannot be fitted within "
+                        "the tolerance."
+                    )
+
+                stack.extend([(b, centre), (centre, a)])
+
+        coefficients = np.zeros((len(pieces), max(len(p) for _, p, _ in pieces)))
+        for i, (_, power, _) in enumerate(pieces):
+            coefficients[i, : len(power)] = power
+
+        return cls(
+            [breaks[0]] + [b for b, _, _ in pieces],
+            coefficients,
+            max(error for _, _, error in pieces),
+        )
+
+    def __call__(self, x, out=None, workspace=None):
+        """Evaluate by Horner's scheme, see `pylinerating.workspace`."""
+
+        x = np.asarray(x, dtype=float)
+        workspace = workspace or Workspace()
+
+        if out is None:
+            out = np.empty(x.shape)
+
+        t = workspace.buffer("surrogate.t", x.shape)
+
+        if self.pieces == 1:
+            np.subtract(x, self._centre[0], out=t)
+            t *= self._scale[0]
+            out.fill(self.coefficients[0, -1])
+
+            for c in self.coefficients[0, -2::-1]:
+                out *= t
+                out += c
+
+            return out
+
+        index = workspace.buffer("surrogate.index", x.shape, np.intp)
+        index.fill(0)
+        for inner in self.breaks[1:-1]:
+            index += x >= inner
+
+        coefficient = workspace.buffer("surrogate.coefficient", x.shape)
+        np.take(self._centre, index, out=t)
+        np.subtract(x, t, out=t)
+        t *= np.take(self._scale, index, out=coefficient)
+
+        np.take(self._columns[-1], index, out=out)
+        for column in self._columns[-2::-1]:
+            out *= t
+            out += np.take(column, index, out=coefficient)
+
+        return out
+
+
+def _crossings(function, levels, low, high, points=4001):
+    """Where the continuous, vectorized function crosses the levels."""
+
+    x = np.linspace(low, high, points)
+    y = function(x)
+    crossings = []
+
+    for level in levels:
+        sign = np.sign(y - level)
+
+        for i in np.nonzero(sign[:-1] * sign[1:] < 0)[0]:
+            a, b = x[i], x[i + 1]
+
+            for _ in range(60):
+                middle = 0.5 * (a + b)
+                if np.sign(function(middle) - level) == sign[i]:
+                    a = middle
+                else:
+                    b = middle
+
+            crossings.append(0.5 * (a + b))
+
+    return sorted(crossings)
+
+
+class _Cigre:
+    """The parts of the CIGRE-601 balance."""
+
+    # pi D sigma epsilon (Tc4 - (Ta + 273) ** 4), eq 27
+    radiation_constant = np.pi * 5.6697e-8
+
+    def __init__(self, conductor, conductor_temperature, elevation, horizontal_angle):
+        self.conductor = conductor
+        self.Tc = conductor_temperature
+        self.elevation = elevation
+        self.horizontal_angle = horizontal_angle
+
+        function = nusselt.get_nusselt_function(conductor)
+        bounds, B, n = nusselt.FORCED_REGIMES[function]
+        self.reynolds_limit = bounds[-1]
+        self.log_bounds = np.log(bounds[:-1])
+        self.log_B = np.log(B)
+        self.n = np.array(n, dtype=float)
+        self.max_slope = max(n)
+
+    def film(self, Ta):
+        return cigre601.temperature_film(self.Tc, Ta)
+
+    def log_conductivity(self, Ta):
+        return np.log(np.pi * cigre601.thermal_conductivity_of_air(self.film(Ta)))
+
+    def log_reynolds(self, Ta):
+        return np.log(
+            self.conductor.diameter
+            / cigre601.kinematic_viscosity(self.film(Ta), self.elevation)
+        )
+
+    def natural_convection(self, Ta):
+        return cigre601.natural_convection(
+            Ta, self.conductor, self.Tc, self.horizontal_angle, self.elevation
+        )
+
+    def natural_breaks(self, low, high):
+        def gp(Ta):
+            t_f = self.film(Ta)
+            return cigre601.grashof(
+                self.conductor, self.Tc, Ta, t_f, self.elevation
+            ) * cigre601.prandtl(self.conductor, self.Tc, t_f)
+
+        return _crossings(gp, cigre601.NATURAL_REGIMES[0], low, high)
+
+    def log_nusselt(self, u, out, buffer):
+        """log B + n log Re in the regime of every log Re, in place."""
+
+        index = buffer("regime", np.intp)
+        index.fill(0)
+        for bound in self.log_bounds:
+            index += u >= bound
+
+        np.take(self.n, index, out=out)
+        out *= u
+        out += np.take(self.log_B, index, out=buffer("log_B"))
+
+        return out
+
+    def angle_function(self, angle):
+        """The fitted function of the folded angle of attack in [°]."""
+        return np.sin(angle / 180 * np.pi)
+
+    @property
+    def angle_slope(self):
+        """The bound of |d log K / d sin|, an error of the sine is this much in K.
+
+        Stranded 0.68 * 1.08 / 0.42 below 24°, smooth 0.45 s / (s^2 + 0.0172) at
+        s = 0.131.
+        """
+        return 1.75 if self.conductor.stranded else 1.72
+
+    def angle_factor(self, sine, angle, out, buffer):
+        """The correction from the fitted sine of the folded angle, in place."""
+
+        np.maximum(sine, 0, out=sine)
+
+        if not self.conductor.stranded:
+            # (sin^2 + 0.0169 cos^2) ** 0.225
+            np.square(sine, out=out)
+            out *= 0.9831
+            out += 0.0169
+            np.log(out, out=out)
+            out *= 0.225
+            return np.exp(out, out=out)
+
+        # 0.42 + 0.68 sin ** 1.08 up to 24°, 0.42 + 0.58 sin ** 0.90 above
+        low = buffer("low_angle", bool)
+        np.less_equal(angle, 24, out=low)
+
+        np.log(sine, out=sine)
+        np.multiply(low, 0.18, out=out)
+        out += 0.90
+        sine *= out
+        np.exp(sine, out=sine)
+
+        np.multiply(low, 0.10, out=out)
+        out += 0.58
+        out *= sine
+        out += 0.42
+
+        return out
+
+
+class _Ieee:
+    """The parts of the IEEE-738 balance."""
+
+    # 17.8 D epsilon (Tc4 - (Ta + 273) ** 4) / 100 ** 4, eq 7a
+    radiation_constant = 17.8e-8
+
+    # The Reynolds number is not limited
+    reynolds_limit = np.inf
+
+    # The biggest derivative of log Nu by log Re
+    max_slope = 0.6
+
+    def __init__(self, conductor, conductor_temperature, elevation, horizontal_angle):
+        self.conductor = conductor
+        self.Tc = conductor_temperature
+        self.elevation = elevation
+
+    def film(self, Ta):
+        return ieee738.temperature_film(Ta, self.Tc)
+
+    def log_conductivity(self, Ta):
+        return np.log(ieee738.thermal_conductivity_of_air_film(self.film(Ta)))
+
+    def log_reynolds(self, Ta):
+        return np.log(
+            self.conductor.diameter
+            * ieee738.air_density(Ta, self.Tc, self.elevation)
+            / ieee738.dynamic_viscosity_film(self.film(Ta))
+        )
+
+    def natural_convection(self, Ta):
+        return ieee738.natural_convection(Ta, self.conductor, self.Tc, self.elevation)
+
+    def natural_breaks(self, low, high):
+        return []
+
+    def log_nusselt(self, u, out, buffer):
+        """log max(1.01 + 1.35 Re ** 0.52, 0.754 Re ** 0.6), eq 3a 3b, in place."""
+
+        high = buffer("high_wind")
+        np.multiply(u, 0.6, out=high)
+        np.exp(high, out=high)
+        high *= 0.754
+
+        np.multiply(u, 0.52, out=out)
+        np.exp(out, out=out)
+        out *= 1.35
+        out += 1.01
+
+        np.maximum(out, high, out=out)
+
+        return np.log(out, out=out)
+
+    def angle_function(self, angle):
+        """The fitted function of the folded angle of attack in [°], eq 4a."""
+        return ieee738.wind_direction_factor(angle / 180 * np.pi)
+
+    # 1 / min K, an absolute error of K is this much relative to K
+    angle_slope = 1 / 0.388
+
+    def angle_factor(self, fitted, angle, out, buffer):
+        """The correction is fitted itself."""
+        return fitted
+
+
+_standards = {"cigre": _Cigre, "ieee": _Ieee}
+
+
+class Surrogate:
+    """A fitted surrogate of the rating, see `fit_surrogate`.
+
+    max_relative_error: the bound of |surrogate / rating - 1| in the envelope
+    block_size:         the number of elements evaluated at once
+    """
+
+    def __init__(
+        self,
+        standard,
+        conductor,
+        conductor_temperature,
+        elevation,
+        horizontal_angle,
+        envelope,
+        log_conductivity,
+        log_reynolds,
+        log_natural,
+        angle,
+        max_relative_error,
+        block_size=16384,
+    ):
+        self.standard = standard
+        self.conductor = conductor
+        self.conductor_temperature = conductor_temperature
+        self.elevation = elevation
+        self.horizontal_angle = horizontal_angle
+        self.envelope = envelope
+        self.log_conductivity = log_conductivity
+        self.log_reynolds = log_reynolds
+        self.log_natural = log_natural
+        self.angle = angle
+        self.max_relative_error = max_relative_error
+        self.block_size = block_size
+
+        self._parts = _standards[standard](
+            conductor, conductor_temperature, elevation, horizontal_angle
+        )
+        self._radiation = (
+            self._parts.radiation_constant * conductor.diameter * conductor.emmisivity
+        )
+        self._solar = conductor.absortivity * conductor.diameter
+        self._resistance = conductor.resistance(conductor_temperature)
+        self._workspace = Workspace()
+
+    def _outside(self, values):
+        """False if all the values of the block are in the envelope."""
+        for value, (low, high) in zip(values, self.envelope):
+            if value.min() < low or value.max() > high:
+                return True
+
+        return False
+
+    def _block(self, Ta, V, angle, S, out):
+        workspace = self._workspace
+
+        def buffer(name, dtype=float):
+            return workspace.buffer("surrogate." + name, Ta.shape, dtype)
+
+        L = buffer("log_difference")
+        np.subtract(self.conductor_temperature, Ta, out=L)
+        np.log(L, out=L)
+
+        # Forced convection
+        u = buffer("log_reynolds")
+        self.log_reynolds(Ta, out=u, workspace=workspace)
+        forced = buffer("forced")
+        u += np.log(V, out=forced)
+
+        self._parts.log_nusselt(u, forced, buffer)
+        forced += self.log_conductivity(Ta, out=u, workspace=workspace)
+        forced += L
+        np.exp(forced, out=forced)
+
+        # Fold into 0-90°, floor is much cheaper than np.remainder
+        folded = buffer("angle")
+        np.multiply(angle, 1 / 180, out=folded)
+        np.floor(folded, out=folded)
+        folded *= -180
+        folded += angle
+        folded -= 90
+        np.abs(folded, out=folded)
+        np.subtract(90, folded, out=folded)
+
+        fitted = self.angle(folded, out=buffer("fitted_angle"), workspace=workspace)
+        forced *= self._parts.angle_factor(fitted, folded, u, buffer)
+
+        # Natural convection
+        self.log_natural(Ta, out=out, workspace=workspace)
+        L *= NATURAL_EXPONENT
+        out += L
+        np.exp(out, out=out)
+        np.maximum(out, forced, out=out)
+
+        # Radiation and solar heating
+        radiation = forced
+        np.add(Ta, 273, out=radiation)
+        np.square(radiation, out=radiation)
+        np.square(radiation, out=radiation)
+        np.subtract((self.conductor_temperature + 273) ** 4, radiation, out=radiation)
+        radiation *= self._radiation
+        out += radiation
+
+        out -= np.multiply(S, self._solar, out=radiation)
+        out /= self._resistance
+        np.sqrt(out, out=out)
+
+        if self._outside((Ta, V, S)):
+            outside = buffer("outside", bool)
+            check = buffer("check", bool)
+            outside.fill(False)
+
+            for value, (low, high) in zip((Ta, V, S), self.envelope):
+                outside |= np.less(value, low, out=check)
+                outside |= np.greater(value, high, out=check)
+
+            np.copyto(out, np.nan, where=outside)
+
+    def __call__(
+        self, ambient_temperature, wind_speed, angle_of_attack, solar_irradiation
+    ):
+        """The rating in [A], the arguments as for `pylinerating.thermal_rating`.
+
+        The arrays are broadcast against each other and evaluated in blocks of
+        `block_size` elements.
+        """
+
+        iterator = np.nditer(
+            [
+                ambient_temperature,
+                wind_speed,
+                angle_of_attack,
+                solar_irradiation,
+                None,
+            ],
+            flags=["external_loop", "buffered", "zerosize_ok"],
+            op_flags=[["readonly"]] * 4 + [["writeonly", "allocate"]],
+            op_dtypes=[float] * 5,
+            buffersize=self.block_size,
+        )
+
+        # log(0) of a calm wind gives no forced convection, as in the standards
+        with np.errstate(divide="ignore", invalid="ignore"), iterator:
+            for Ta, V, angle, S, out in iterator:
+                self._block(Ta, V, angle, S, out)
+
+            result = iterator.operands[4]
+
+        return result[()] if result.ndim == 0 else result
+
+
+def fit_surrogate(
+    conductor,
+    conductor_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    standard="cigre",
+    ambient_temperature=(-40.0, 50.0),
+    wind_speed=(0.0, 30.0),
+    solar_irradiation=(0.0, 1400.0),
+    tolerance=1e-7,
+    max_degree=12,
+):
+    """Fit the surrogate of the rating of one conductor over an envelope.
+
+    The fixed arguments are the same as for `pylinerating.thermal_rating` and
+    must be scalars.
+    ambient_temperature, wind_speed, solar_irradiation: (min, max) of the
+        envelope, the angle of attack is not limited
+    tolerance:  the absolute error of the fitted logarithms, about the relative
+                error of the convection
+    max_degree: the degree above which a piece is halved
+
+    Raises ValueError if the envelope reaches the conductor temperature, is
+    beyond the Reynolds numbers of the Nusselt correlations or has no rating.
+    """
+
+    if standard not in _standards:
+        raise ValueError("Invalid argument: standard must be cigre or ieee.")
+
+    low, high = ambient_temperature
+
+    if not low < high < conductor_temperature:
+        raise ValueError(
+            "Invalid argument: the ambient temperatures must be below the conductor "
+            "temperature."
+        )
+
+    if not 0 <= wind_speed[0] <= wind_speed[1]:
+        raise ValueError("Invalid argument: the wind speed must be increasing from 0.")
+
+    if not 0 <= solar_irradiation[0] <= solar_irradiation[1]:
+        raise ValueError(
+            "Invalid argument: the solar irradiation must be increasing from 0."
+        )
+
+    parts = _standards[standard](
+        conductor, conductor_temperature, elevation, horizontal_angle
+    )
+    Ta = np.linspace(low, high, 4001)
+
+    reynolds = wind_speed[1] * np.exp(np.max(parts.log_reynolds(Ta)))
+    if reynolds >= parts.reynolds_limit:
+        raise ValueError(
+            "Invalid argument: the Reynolds number is beyond the Nusselt correlations."
+        )
+
+    def fit(function, breaks):
+        return PiecewiseChebyshev.fit(function, breaks, tolerance, max_degree)
+
+    log_conductivity = fit(parts.log_conductivity, [low, high])
+    log_reynolds = fit(parts.log_reynolds, [low, high])
+    log_natural = fit(
+        lambda x: np.log(parts.natural_convection(x))
+        - NATURAL_EXPONENT * np.log(conductor_temperature - x),
+        [low] + parts.natural_breaks(low, high) + [high],
+    )
+    angle = fit(parts.angle_function, [0.0, 90.0])
+
+    # The error of log(forced) and log(natural) bounds the relative error of
+    # the convection, log Nu changes by at most max_slope times the error of q
+    angle_error = parts.angle_slope * angle.error
+    log_error = max(
+        log_conductivity.error
+        + parts.max_slope * log_reynolds.error
+        + angle_error / (1 - angle_error),
+        log_natural.error,
+    )
+    convection_error = np.expm1(log_error)
+
+    # The cooling is at least natural + radiation. The relative error of the
+    # balance is the biggest at the smallest cooling and the biggest solar gain.
+    radiation = (
+        parts.radiation_constant
+        * conductor.diameter
+        * conductor.emmisivity
+        * ((conductor_temperature + 273) ** 4 - (Ta + 273) ** 4)
+    )
+    minimum_cooling = np.min(parts.natural_convection(Ta) + radiation)
+    solar = conductor.absortivity * conductor.diameter * solar_irradiation[1]
+
+    if minimum_cooling <= solar:
+        raise ValueError("Invalid argument: the envelope includes no rating.")
+
+    balance_error = convection_error * minimum_cooling / (minimum_cooling - solar)
+    max_relative_error = 1 - np.sqrt(1 - balance_error)
+
+    return Surrogate(
+        standard,
+        conductor,
+        conductor_temperature,
+        elevation,
+        horizontal_angle,
+        Envelope(
+            tuple(ambient_temperature), tuple(wind_speed), tuple(solar_irradiation)
+        ),
+        log_conductivity,
+        log_reynolds,
+        log_natural,
+        angle,
+        max_relative_error,
+    )
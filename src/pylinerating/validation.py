@@ -0,0 +1,133 @@
+"""Rating with an explicit policy for degenerate inputs.
+
+`thermal_rating` returns NaN (and numpy emits a RuntimeWarning) when the solar
+heating exceeds the cooling or when the ambient temperature is above the
+conductor temperature. `validated_thermal_rating` evaluates the same heat balance
+with the warnings switched off, classifies every element with a status code and
+applies one of the policies:
+
+clip:  the rating of the flagged elements is 0 A
+mask:  the rating is a masked array with the flagged elements masked
+raise: ValueError is raised if any element is flagged
+"""
+
+import numpy as np
+
+from . import engine
+
+STATUS_OK = 0
+STATUS_NO_CAPACITY = 1  # the solar heating is bigger than the cooling
+STATUS_AMBIENT_ABOVE_LIMIT = 2  # the ambient temperature is not below the limit
+STATUS_INVALID_INPUT = 3  # non-finite or negative wind speed or irradiation
+
+STATUS_NAMES = {
+    STATUS_OK: "ok",
+    STATUS_NO_CAPACITY: "no capacity",
+    STATUS_AMBIENT_ABOVE_LIMIT: "ambient above limit",
+    STATUS_INVALID_INPUT: "invalid input",
+}
+
+POLICIES = ("clip", "mask", "raise")
+
+
+def rating_status(
+    balance,
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor_temperature,
+):
+    """Classify the elements of a heat balance, returns an array of uint8 codes.
+
+    If more problems apply to one element, the most severe one is reported.
+    """
+
+    shape = np.shape(balance)
+    status = np.zeros(shape, dtype=np.uint8)
+
+    status[balance < 0] = STATUS_NO_CAPACITY
+    status[~np.isfinite(balance)] = STATUS_INVALID_INPUT
+
+    above = np.asarray(ambient_temperature) >= np.asarray(conductor_temperature)
+    status[np.broadcast_to(above, shape)] = STATUS_AMBIENT_ABOVE_LIMIT
+
+    invalid = (
+        ~np.isfinite(ambient_temperature)
+        | ~np.isfinite(wind_speed)
+        | ~np.isfinite(angle_of_attack)
+        | ~np.isfinite(solar_irradiation)
+        | (np.asarray(wind_speed) < 0)
+        | (np.asarray(solar_irradiation) < 0)
+    )
+    status[np.broadcast_to(invalid, shape)] = STATUS_INVALID_INPUT
+
+    return status
+
+
+def validated_thermal_rating(
+    ambient_temperature,
+    wind_speed,
+    angle_of_attack,
+    solar_irradiation,
+    conductor,
+    conductor_temperature=80.0,
+    horizontal_angle=0,
+    elevation=500,
+    standard="cigre",
+    policy="clip",
+):
+    """Calculate the rating and a status code for every element.
+
+    The arguments are the same as for `pylinerating.thermal_rating`.
+    policy: one of `POLICIES`
+
+    Returns a tuple (rating, status).
+    """
+
+    rating_engine = engine.get_engine(standard)
+
+    if policy not in POLICIES:
+        raise ValueError("Invalid argument: policy must be clip, mask or raise.")
+
+    prepared = engine.prepare_inputs(
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor,
+        conductor_temperature,
+        horizontal_angle,
+        elevation,
+    )
+
+    with np.errstate(invalid="ignore"):
+        balance = rating_engine.heat_balance(prepared)
+
+    balance = np.asarray(balance, dtype=float)
+    status = rating_status(
+        balance,
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor_temperature,
+    )
+    valid = status == STATUS_OK
+
+    if policy == "raise" and not valid.all():
+        counts = np.bincount(status.ravel(), minlength=len(STATUS_NAMES))
+        problems = ", ".join(
+            "{} {}".format(counts[code], name)
+            for code, name in STATUS_NAMES.items()
+            if code != STATUS_OK and counts[code]
+        )
+        raise ValueError("Invalid rating: " + problems + ".")
+
+    balance = np.where(valid, balance, 0.0)
+    rating = np.sqrt(balance / prepared.resistance)
+
+    if policy == "mask":
+        rating = np.ma.masked_array(rating, mask=~valid)
+
+    return rating, status
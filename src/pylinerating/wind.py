@@ -0,0 +1,105 @@
+"""The angle of attack from the wind direction and the azimuth of the span.
+
+    angle = wind_angle(wind_direction, span_azimuth)
+    thermal_rating(ambient_temperature, wind_speed, angle, solar_irradiation, ...)
+
+A `WindAngle` is accepted everywhere instead of the angle of attack in [°] by
+`pylinerating.thermal_rating`, the engines, `cigre601.thermal_rating`,
+`ieee738.thermal_rating`, their `heat_balance` and
+`comparison.compare_standards`. The wind direction corrections of both
+standards depend only on the sine and cosine of the angle of attack (CIGRE-601
+eq 21-23, IEEE-738 eq 4a), with a `WindAngle` they are not computed again.
+
+The sine and cosine of the direction and of the azimuth are computed at the
+shape of each, e.g. once per span for (span, 1) azimuths against (span, time)
+directions, and combined by the angle difference identities. Their absolute
+values fold the angle of attack into 0-90° without the remainder of a division.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+WindAngle = namedtuple("WindAngle", ["angle_of_attack", "sin_angle", "cos_angle"])
+
+
+def wind_angle(wind_direction, span_azimuth):
+    """The angle of attack in 0-90° of the wind on the span, with its sine and cosine.
+
+    wind_direction: where the wind comes from in [°], clockwise from the north
+    span_azimuth:   the direction of the span in [°], clockwise from the north.
+                    The span in the opposite direction is the same.
+    """
+
+    direction = np.radians(wind_direction)
+    azimuth = np.radians(span_azimuth)
+
+    sin_direction, cos_direction = np.sin(direction), np.cos(direction)
+    sin_azimuth, cos_azimuth = np.sin(azimuth), np.cos(azimuth)
+
+    # |sin(d - a)| and |cos(d - a)|
+    sin_angle = np.abs(sin_direction * cos_azimuth - cos_direction * sin_azimuth)
+    cos_angle = np.abs(cos_direction * cos_azimuth + sin_direction * sin_azimuth)
+
+    angle = np.degrees(np.arctan2(sin_angle, cos_angle))
+
+    return WindAngle(angle, sin_angle, cos_angle)
+
+
+def fold_angle(angle_of_attack, out=None):
+    """Fold any angle in [°] into the range 0-90°.
+
+    The angles from -180° to 180° are folded by absolute values alone, the
+    remainder of the division by 180° is only computed for the others.
+    """
+
+    if out is None:
+        absolute = np.abs(angle_of_attack)
+
+        # 90 - | |angle| - 90 |
+        if np.all(absolute <= 180.0):
+            return 90 - np.abs(absolute - 90)
+
+        return 90 - np.abs((angle_of_attack % 180) - 90)
+
+    if -180.0 <= np.min(angle_of_attack, initial=0.0) and (
+        np.max(angle_of_attack, initial=0.0) <= 180.0
+    ):
+        np.abs(angle_of_attack, out=out)
+    else:
+        np.remainder(angle_of_attack, 180, out=out)
+
+    out -= 90
+    np.abs(out, out=out)
+
+    return np.subtract(90, out, out=out)
+
+
+def sine(angle_of_attack, out=None):
+    """The sine of an angle in [°]."""
+
+    if out is None:
+        return np.sin(angle_of_attack * (np.pi / 180))
+
+    np.multiply(angle_of_attack, np.pi / 180, out=out)
+
+    return np.sin(out, out=out)
+
+
+def sin_cos(angle_of_attack, out=None):
+    """The sine and the cosine of an angle of attack in 0-90° in [°].
+
+    out: a pair of arrays for the sine and the cosine
+    """
+
+    if out is None:
+        radians = angle_of_attack * (np.pi / 180)
+        return np.sin(radians), np.cos(radians)
+
+    # The cosine is not negative in 0-90°
+    sin_angle, cos_angle = out
+    sine(angle_of_attack, out=sin_angle)
+    np.multiply(sin_angle, sin_angle, out=cos_angle)
+    np.subtract(1.0, cos_angle, out=cos_angle)
+
+    return sin_angle, np.sqrt(cos_angle, out=cos_angle)
@@ -0,0 +1,150 @@
+"""Reusable buffers for the intermediates of the rating.
+
+Every function of `cigre601` and `ieee738` that computes an array takes `out=`
+and the functions of the heat balance take `workspace=` too. The formulas are
+written once, as chains of ufuncs with `out=`. Without a workspace and `out`
+every step allocates its result, which also works for the `sensitivity.Dual`
+numbers. With a workspace the intermediates are kept in its buffers, which are
+allocated on the first call and reused by every following call with the same
+shape:
+
+    workspace = Workspace()
+    rating = np.empty((spans, times))
+
+    while True:
+        ...  # update the weather arrays in place
+        thermal_rating(ambient, wind, angle, solar, conductor, out=rating,
+                       workspace=workspace)
+
+After the first cycle a steady-state loop does no allocations proportional to
+the size of the arrays. With `out` alone a temporary workspace is used, the
+intermediates are computed in place but allocated again on every call.
+
+The buffer of a term has the broadcast shape of the inputs the term depends
+on, see `minimal_shape`. With (span, 1) elevations and (1, time) weather the
+elevation terms are computed per span and the angle of attack per timestamp,
+only the terms of the weather and the conductor temperature together are
+computed at the full (span, time) shape.
+"""
+
+import numpy as np
+
+
+class Workspace:
+    """Named buffers, reallocated only when the shape or the dtype changes.
+
+    allocations: the number of buffers allocated so far
+    """
+
+    def __init__(self):
+        self._buffers = {}
+        self.allocations = 0
+
+    def buffer(self, name, shape, dtype=float):
+        shape = tuple(shape)
+        dtype = np.dtype(dtype)
+
+        buffer = self._buffers.get(name)
+
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buffer
+            self.allocations += 1
+
+        return buffer
+
+    @property
+    def nbytes(self):
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def clear(self):
+        self._buffers.clear()
+
+
+def minimal_shape(*values):
+    """The broadcast shape of the values, the shape of a term of these only."""
+    return np.broadcast(*values).shape
+
+
+def store(result, out):
+    """Copy the result into `out` if given, returns the output."""
+
+    if out is None:
+        return result
+
+    np.copyto(out, result)
+
+    return out
+
+
+def no_buffers(name, *inputs, dtype=float):
+    """The buffers without a workspace, the ufuncs allocate their results."""
+    return None
+
+
+def buffers(workspace, prefix, shape):
+    """The buffers of the intermediates of a function in the workspace.
+
+    Returns buffer(name, *inputs, dtype=float), the buffer `prefix + name` with
+    the broadcast shape of the inputs, `shape` without inputs. Without a
+    workspace it is `no_buffers`.
+    """
+
+    if workspace is None:
+        return no_buffers
+
+    def buffer(name, *inputs, dtype=float):
+        buffer_shape = minimal_shape(*inputs) if inputs else shape
+        return workspace.buffer(prefix + name, buffer_shape, dtype)
+
+    return buffer
+
+
+def workspace_for(out, workspace):
+    """The workspace of a call, a temporary one for `out=` alone.
+
+    With `out` and without a workspace the intermediates are still computed in
+    place, in buffers allocated for this call only.
+    """
+
+    if workspace is None and out is not None:
+        return Workspace()
+
+    return workspace
+
+
+def polynomial(x, coefficients, out=None):
+    """c[0] + c[1] x + c[2] x^2 + ... by Horner's scheme, in `out` if given."""
+
+    result = np.multiply(x, coefficients[-1], out=out)
+
+    for coefficient in coefficients[-2:0:-1]:
+        result = np.add(result, coefficient, out=out)
+        result = np.multiply(result, x, out=out)
+
+    return np.add(result, coefficients[0], out=out)
+
+
+def select_regimes(values, bounds, tables, outs=None, mask=None):
+    """The constants of the regime of every value, one array per table.
+
+    The constants of `tables[i][j]` are used for bounds[j - 1] <= values <
+    bounds[j]. Above the last bound (and for NaN) the constants are 0, the same
+    as `np.select` with the default. With a boolean `mask` buffer they are
+    looked up in place and stored in `outs[i]`, otherwise by `np.select`.
+    """
+
+    if mask is None:
+        conditions = [values < bound for bound in bounds]
+        return [np.select(conditions, table) for table in tables]
+
+    for out in outs:
+        out.fill(0.0)
+
+    for j in reversed(range(len(bounds))):
+        np.less(values, bounds[j], out=mask)
+
+        for out, table in zip(outs, tables):
+            np.copyto(out, table[j], where=mask)
+
+    return outs
@@ -0,0 +1,144 @@
+import json
+import os
+import time
+
+import pytest
+import numpy as np
+
+from pylinerating.benchmark import (
+    BENCHMARKS,
+    benchmark_inputs,
+    check,
+    main,
+    measure,
+    record,
+    run,
+)
+
+
+def test_every_benchmark_runs():
+    measurements = run(size=1000, repeat=1, min_time=0)
+
+    assert set(measurements) == set(BENCHMARKS)
+    for measurement in measurements.values():
+        assert measurement.seconds > 0
+        assert measurement.peak_arrays > 0
+
+        # The workspace is filled by the first call, the result is one array
+        assert measurement.allocations == 0
+        assert measurement.blocks >= 1
+
+    assert measurements["comparison.compare_standards"].blocks == 3
+
+
+def test_workspace_benchmarks_allocate_less():
+    measurements = run(size=20000, repeat=1, min_time=0)
+
+    for module in ["cigre601", "ieee738"]:
+        assert (
+            measurements[module + ".thermal_rating(workspace)"].peak_bytes
+            < measurements[module + ".thermal_rating"].peak_bytes / 2
+        )
+
+
+def test_measure_the_peak_of_the_temporaries():
+    def three_temporaries(inputs, workspace):
+        a = inputs.ambient_temperature + 1
+        b = a * 2
+        c = b - 1
+        return c.sum()
+
+    inputs = benchmark_inputs(100000)
+    measurement = measure(three_temporaries, inputs, repeat=1, min_time=0)
+
+    assert measurement.peak_arrays == pytest.approx(3, abs=0.2)
+
+
+def test_check_finds_regressions(tmp_path):
+    def fast(inputs, workspace):
+        return inputs.wind_speed * 2
+
+    def slow(inputs, workspace):
+        time.sleep(0.01)
+        return inputs.wind_speed * 2
+
+    def hungry(inputs, workspace):
+        return np.stack([inputs.wind_speed] * 4).sum()
+
+    def reallocating(inputs, workspace):
+        workspace.clear()
+        return workspace.buffer("twice", inputs.wind_speed.shape)
+
+    path = str(tmp_path / "baseline.json")
+    record(path, size=10000, repeat=3, benchmarks={"a": fast, "b": fast})
+
+    with open(path) as f:
+        assert set(json.load(f)["functions"]) == {"a", "b"}
+
+    benchmarks = {"a": fast, "b": fast}
+    assert check(path, tolerance=100, benchmarks=benchmarks, min_time=0) == []
+
+    benchmarks = {"a": slow, "b": hungry, "c": slow}
+    regressions = check(path, benchmarks=benchmarks, min_time=0)
+    found = {(r.name, r.quantity) for r in regressions}
+
+    assert ("a", "seconds") in found
+    assert ("a", "peak_bytes") not in found
+    assert ("b", "peak_bytes") in found
+    assert all(r.name != "c" for r in regressions)
+
+    benchmarks = {"a": reallocating, "b": fast}
+    regressions = check(path, tolerance=100, benchmarks=benchmarks, min_time=0)
+
+    assert {(r.name, r.quantity) for r in regressions} == {("a", "allocations")}
+
+
+def test_check_finds_missing_speedups(tmp_path):
+    def fast(inputs, workspace):
+        return inputs.wind_speed * 2
+
+    def slow(inputs, workspace):
+        time.sleep(0.01)
+        return inputs.wind_speed * 2
+
+    path = str(tmp_path / "baseline.json")
+    record(path, size=10000, repeat=3, benchmarks={"a": slow, "b": slow})
+
+    benchmarks = {"a": fast, "b": slow}
+    speedups = {"a": ("b", 2.0, 10000)}
+    assert check(path, 100, benchmarks=benchmarks, speedups=speedups) == []
+
+    benchmarks = {"a": slow, "b": slow}
+    regressions = check(path, 100, benchmarks=benchmarks, speedups=speedups)
+    assert [(r.name, r.quantity) for r in regressions] == [("a", "speedup")]
+
+    # Only checked from the size of the claim
+    speedups = {"a": ("b", 2.0, 100000)}
+    assert check(path, 100, benchmarks=benchmarks, speedups=speedups) == []
+
+
+def test_command_line(tmp_path, capsys):
+    path = str(tmp_path / "baseline.json")
+
+    options = ["--min-time", "0"]
+
+    assert main(["record", path, "--size", "1000", "--repeat", "1"] + options) == 0
+    assert "cigre601.thermal_rating" in capsys.readouterr().out
+    assert main(["check", path, "--tolerance", "100"] + options) == 0
+
+
+def test_no_memory_regression_against_the_committed_baseline():
+    baseline = os.path.join(os.path.dirname(__file__), "benchmark_baseline.json")
+
+    assert check(baseline, repeat=1, min_time=0, timing=False) == []
+
+
+@pytest.mark.skipif(
+    "PYLINERATING_BENCHMARK_BASELINE" not in os.environ,
+    reason="no baseline of this machine, record one with "
+    "python -m pylinerating.benchmark record",
+)
+def test_no_regression_against_the_baseline():
+    regressions = check(os.environ["PYLINERATING_BENCHMARK_BASELINE"])
+
+    assert regressions == []
@@ -0,0 +1,100 @@
+import os
+
+import pytest
+import numpy as np
+
+from pylinerating import thermal_rating
+from pylinerating.cache import RatingCache, input_key
+from pylinerating.conductor import LinearResistance, drake_constants
+
+weather = (
+    np.linspace(0, 40, 50),
+    np.linspace(0.5, 10, 50),
+    90,
+    np.linspace(0, 1000, 50),
+)
+
+
+def test_rating_is_loaded_from_the_cache(tmp_path):
+    cache = RatingCache(tmp_path)
+    expected = thermal_rating(*weather, drake_constants)
+
+    first = thermal_rating(*weather, drake_constants, cache=cache)
+    second = thermal_rating(*weather, drake_constants, cache=cache)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert type(second) is np.ndarray and second.flags.writeable
+    assert np.array_equal(first, expected) and np.array_equal(second, expected)
+
+    # Another process, or after a restart
+    other = RatingCache(tmp_path)
+    out = np.empty(50)
+    assert other.thermal_rating(*weather, drake_constants, out=out) is out
+    assert other.hits == 1
+    assert np.array_equal(out, expected)
+
+
+def test_memory_mapped_ratings(tmp_path):
+    cache = RatingCache(tmp_path, mmap=True)
+
+    first = cache.thermal_rating(*weather, drake_constants)
+    second = cache.thermal_rating(*weather, drake_constants)
+
+    assert type(first) is np.ndarray and first.flags.writeable
+    assert isinstance(second, np.memmap) and not second.flags.writeable
+    assert np.array_equal(first, second)
+
+
+def test_key_depends_on_the_inputs():
+    key = input_key(*weather, drake_constants)
+
+    assert key == input_key(*[np.copy(w) for w in weather], drake_constants)
+    assert key != input_key(*weather, drake_constants, standard="ieee")
+    assert key != input_key(*weather, drake_constants, 100.0)
+    assert key != input_key(weather[0] + 1e-9, *weather[1:], drake_constants)
+    assert key != input_key(*weather, drake_constants._replace(emmisivity=0.9))
+
+    # The resistance model
+    linear = drake_constants._replace(
+        resistance=LinearResistance(25.0, 7.28e-5, 75.0, 8.69e-5)
+    )
+    scaled = drake_constants._replace(
+        resistance=LinearResistance(25.0, 7.28e-5, 75.0, 8.70e-5)
+    )
+    assert input_key(*weather, linear) != input_key(*weather, scaled)
+
+    def factory(scale):
+        return lambda T: scale * drake_constants.resistance(T)
+
+    assert input_key(*weather, drake_constants._replace(resistance=factory(1.0))) != (
+        input_key(*weather, drake_constants._replace(resistance=factory(1.1)))
+    )
+
+    # Objects without a defined hash
+    with pytest.raises(TypeError):
+        input_key(*weather, drake_constants._replace(resistance=object()))
+
+
+def test_least_recently_used_are_evicted(tmp_path):
+    # The header of a .npy file is 128 bytes
+    cache = RatingCache(tmp_path, max_bytes=2 * (50 * 8 + 128))
+
+    keys = []
+    for i, temperature in enumerate([60.0, 70.0, 80.0]):
+        cache.thermal_rating(*weather, drake_constants, temperature)
+        keys.append(input_key(*weather, drake_constants, temperature))
+
+        # The modification time has a limited resolution
+        os.utime(os.path.join(str(tmp_path), keys[-1] + ".npy"), (0, 1e9 + i))
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) is not None and cache.get(keys[2]) is not None
+    assert cache.nbytes <= cache.max_bytes
+
+    cache.clear()
+    assert cache.nbytes == 0
+
+
+def test_invalid_size(tmp_path):
+    with pytest.raises(ValueError):
+        RatingCache(tmp_path, max_bytes=0)
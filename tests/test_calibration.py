@@ -0,0 +1,128 @@
+import pytest
+import numpy as np
+
+from pylinerating import cigre601, ieee738
+from pylinerating.calibration import calibrate
+from pylinerating.catalog import load_catalog
+from pylinerating.conductor import drake_constants
+
+
+def monitor_data(standard, spans=6, samples=300, seed=0):
+    rng = np.random.default_rng(seed)
+    shape = (spans, samples)
+
+    truth = (
+        rng.uniform(0.4, 0.95, spans),
+        rng.uniform(0.3, 0.9, spans),
+        rng.uniform(0.5, 1.5, spans),
+    )
+
+    ambient = rng.uniform(-5, 30, shape)
+    wind = rng.uniform(0.2, 8, shape)
+    angle = rng.uniform(0, 360, shape)
+    solar = rng.uniform(0, 1000, shape)
+    temperature = ambient + rng.uniform(15, 60, shape)
+
+    module = {"cigre": cigre601, "ieee": ieee738}[standard]
+    with np.errstate(invalid="ignore"):
+        current = module.thermal_rating(
+            ambient,
+            truth[2][:, None] * wind,
+            angle,
+            solar,
+            drake_constants._replace(
+                absortivity=truth[0][:, None], emmisivity=truth[1][:, None]
+            ),
+            temperature,
+        )
+
+    return truth, (temperature, current, ambient, wind, angle, solar)
+
+
+@pytest.mark.parametrize("standard", ["cigre", "ieee"])
+def test_calibration_recovers_the_parameters(standard):
+    truth, data = monitor_data(standard)
+
+    result = calibrate(*data, drake_constants, standard=standard)
+
+    assert result.absortivity == pytest.approx(truth[0], abs=1e-6)
+    assert result.emmisivity == pytest.approx(truth[1], abs=1e-6)
+    assert result.wind_factor == pytest.approx(truth[2], abs=1e-6)
+    assert np.all(result.rms_residual < 1e-4)
+    assert np.all(result.iterations < 30)
+
+
+def test_calibration_of_some_parameters():
+    truth, data = monitor_data("cigre", spans=3)
+    temperature, current, ambient, wind, angle, solar = data
+    temperature[0, :100] = np.nan
+
+    result = calibrate(
+        *data,
+        drake_constants._replace(emmisivity=truth[1]),
+        parameters=("absortivity", "wind_factor"),
+    )
+
+    assert result.emmisivity == pytest.approx(truth[1])
+    assert result.absortivity == pytest.approx(truth[0], abs=1e-6)
+    assert result.wind_factor == pytest.approx(truth[2], abs=1e-6)
+
+
+def test_per_span_conductors():
+    catalog = load_catalog()
+    ids = catalog.ids(["Drake", "Hawk", "Falcon", "Cairo"])
+    truth = (np.array([0.5, 0.6, 0.7, 0.8]), np.array([0.4, 0.5, 0.6, 0.7]))
+    conductors = catalog.conductors(ids[:, None])
+
+    rng = np.random.default_rng(1)
+    shape = (4, 200)
+    ambient = rng.uniform(-5, 30, shape)
+    wind = rng.uniform(0.2, 8, shape)
+    angle = rng.uniform(0, 360, shape)
+    solar = rng.uniform(0, 1000, shape)
+    temperature = ambient + rng.uniform(15, 60, shape)
+
+    current = cigre601.thermal_rating(
+        ambient,
+        wind,
+        angle,
+        solar,
+        conductors._replace(
+            absortivity=truth[0][:, None], emmisivity=truth[1][:, None]
+        ),
+        temperature,
+    )
+    # The noisy span needs more iterations than the others
+    current[2] *= rng.normal(1.0, 0.02, 200)
+
+    result = calibrate(
+        temperature,
+        current,
+        ambient,
+        wind,
+        angle,
+        solar,
+        conductors._replace(
+            absortivity=np.full((4, 1), 0.5), emmisivity=np.full((4, 1), 0.5)
+        ),
+    )
+
+    assert len(set(result.iterations)) > 1
+    clean = [0, 1, 3]
+    assert result.absortivity[clean] == pytest.approx(truth[0][clean], abs=1e-6)
+    assert result.emmisivity[clean] == pytest.approx(truth[1][clean], abs=1e-6)
+    assert result.wind_factor[clean] == pytest.approx(1.0, abs=1e-6)
+    assert result.rms_residual[2] > 1.0
+
+
+def test_invalid_arguments():
+    _, data = monitor_data("cigre", spans=2, samples=10)
+
+    with pytest.raises(ValueError):
+        calibrate(*data, drake_constants, standard="other")
+
+    with pytest.raises(ValueError):
+        calibrate(*data, drake_constants, parameters=("diameter",))
+
+    with pytest.raises(ValueError):
+        calibrate(*[value[0] for value in data], drake_constants)
@@ -0,0 +1,91 @@
+import pytest
+import numpy as np
+
+from pylinerating import catalog
+from pylinerating import cigre601
+from pylinerating import thermal_rating
+from pylinerating.conductor import drake_constants_ieee738, drake_resistance
+
+
+def test_catalog_is_loaded_once():
+    assert catalog.load_catalog() is catalog.load_catalog()
+
+
+def test_lookup_by_code_and_id():
+    conductors = catalog.load_catalog()
+
+    assert "Drake" in conductors
+    assert conductors.ids(["Hawk", "Drake"]).tolist() == [3, 0]
+
+    by_code = conductors["Drake"]
+    by_id = conductors[0]
+
+    assert by_code.diameter == by_id.diameter == pytest.approx(28.14e-3)
+
+    with pytest.raises(ValueError):
+        conductors["Unobtainium"]
+
+    with pytest.raises(ValueError):
+        conductors[len(conductors)]
+
+
+def test_drake_matches_the_example_constants():
+    drake = catalog.load_catalog()["Drake"]
+
+    temperatures = np.array([25.0, 75.0, 100.0])
+    assert drake.resistance(temperatures) == pytest.approx(
+        drake_resistance(temperatures)
+    )
+    assert cigre601.specific_heat(drake, 80.0) == pytest.approx(
+        cigre601.specific_heat(drake_constants_ieee738, 80.0)
+    )
+
+    assert thermal_rating(
+        40, 0.61, 90, 1000, drake, 100, standard="ieee"
+    ) == pytest.approx(
+        thermal_rating(
+            40, 0.61, 90, 1000, drake_constants_ieee738, 100, standard="ieee"
+        )
+    )
+
+
+def test_columns_are_gathered_by_id():
+    conductors = catalog.load_catalog()
+    ids = np.array([[0, 3], [3, 7]])
+
+    columns = conductors.columns(ids)
+
+    assert columns.diameter.shape == (2, 2)
+    assert columns.code.tolist() == [["Drake", "Hawk"], ["Hawk", "Falcon"]]
+
+
+def test_per_span_conductors_match_single_conductors():
+    conductors = catalog.load_catalog()
+    ids = conductors.ids(["Drake", "Hawk", "Falcon", "Cairo"])
+
+    # 4 spans, 3 time steps
+    ambient = np.array([10.0, 20.0, 30.0])
+    wind = np.array([0.5, 1.0, 2.0])
+
+    per_span = thermal_rating(
+        ambient, wind, 45, 800, conductors.conductors(ids[:, None]), 80.0
+    )
+
+    assert per_span.shape == (4, 3)
+
+    for row, i in zip(per_span, ids):
+        assert row == pytest.approx(
+            thermal_rating(ambient, wind, 45, 800, conductors[i], 80.0)
+        )
+
+    heat = cigre601.specific_heat(conductors.conductors(ids), 20.0)
+    assert heat == pytest.approx(
+        [cigre601.specific_heat(conductors[i], 20.0) for i in ids]
+    )
+
+
+def test_mixed_surfaces_are_refused():
+    conductors = catalog.load_catalog()
+
+    with pytest.raises(ValueError):
+        conductors.conductors(conductors.ids(["Drake", "ACCC Drake"]))
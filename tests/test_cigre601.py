@@ -1,5 +1,6 @@
 from numpy.lib.function_base import angle
 from pylinerating import cigre601, conductor, nusselt
+from pylinerating.workspace import Workspace
 import numpy as np
 import pytest
 
@@ -360,3 +361,120 @@ def test_angle():
     assert A[0] < A[4]
     assert A[0] < A[5]
     assert A[0] == A[6]
+
+
+def test_radial_temperature_difference():
+    solid = cigre601.radial_temperature_difference(100.0, conductor.drake_constants)
+    assert solid == pytest.approx(100.0 / (4 * np.pi * 2.0))
+
+    # A core that carries no current lowers the difference
+    cored = cigre601.radial_temperature_difference(
+        100.0, conductor.drake_constants, core_diameter=10.4e-3
+    )
+    assert 0 < cored < solid
+
+
+def test_surface_temperature_is_consistent_with_the_core():
+    ambient_temperature = np.array([[0.0], [20.0], [40.0]])
+    wind_speed = np.array([0.0, 0.6, 2.0, 10.0])
+
+    Ts = cigre601.surface_temperature(
+        ambient_temperature,
+        wind_speed,
+        90,
+        conductor.drake_constants,
+        100.0,
+        core_diameter=10.4e-3,
+        radial_conductivity=1.0,
+        tolerance=1e-9,
+    )
+
+    assert Ts.shape == (3, 4)
+
+    cooling = cigre601.power_convective(
+        ambient_temperature, wind_speed, 90, conductor.drake_constants, Ts, 0, 500
+    ) + cigre601.power_radiation(ambient_temperature, conductor.drake_constants, Ts)
+    difference = cigre601.radial_temperature_difference(
+        cooling, conductor.drake_constants, 10.4e-3, 1.0
+    )
+
+    assert Ts + difference == pytest.approx(np.full((3, 4), 100.0))
+
+
+def test_radial_rating():
+    ambient_temperature = np.array([10.0, 30.0, 150.0])
+
+    args = (ambient_temperature, 1.0, 45, 800, conductor.drake_constants, 100.0)
+
+    isothermal = cigre601.thermal_rating(ambient_temperature[:2], *args[1:])
+    radial = cigre601.thermal_rating_radial(*args, core_diameter=10.4e-3)
+    conductive = cigre601.thermal_rating_radial(*args, radial_conductivity=1e9)
+
+    assert np.all(radial[:2] < isothermal[:2])
+    assert conductive[:2] == pytest.approx(isothermal[:2])
+
+    # The ambient above the core temperature does not converge, the rest does
+    assert np.isnan(radial[2])
+
+
+def test_surface_at_the_ambient_temperature():
+    Ts = cigre601.surface_temperature(20.0, 1.0, 90.0, conductor.drake_constants, 20.0)
+
+    assert Ts == 20.0
+
+
+def test_saturation_humidity():
+    # 2.34 kPa at 20 °C and 47.4 kPa at 80 °C
+    assert cigre601.saturation_humidity(20.0, 101325.0) == pytest.approx(
+        0.622 * 2339 / (101325 - 2339), rel=0.01
+    )
+    assert cigre601.saturation_humidity(80.0, 101325.0) == pytest.approx(
+        0.622 * 47390 / (101325 - 47390), rel=0.03
+    )
+
+
+def test_precipitation_cooling():
+    drake = conductor.drake_constants
+    rate = np.array([0.0, 0.5, 2.0, 10.0])
+
+    dry = cigre601.heat_balance(10.0, 1.0, 90, 0, drake, 80.0)
+    wet = cigre601.heat_balance(10.0, 1.0, 90, 0, drake, 80.0, precipitation_rate=rate)
+
+    assert wet[0] == dry
+    assert np.all(np.diff(wet) > 0)
+
+    # Light rain evaporates completely, the latent heat at 45 °C is 2.39 MJ/kg
+    water = 0.5 * drake.diameter / 3600
+    assert wet[1] - dry == pytest.approx(water * (4186 * 70 + 2.39e6), rel=0.01)
+
+    # Air as humid as at the surface takes no water
+    Pc = cigre601.power_convective(10.0, 1.0, 90, drake, 80.0, 0, 500)
+    assert cigre601.power_precipitation(
+        10.0, drake, 80.0, 2.0, Pc, relative_humidity=1e6
+    ) == pytest.approx(2.0 * drake.diameter / 3600 * 4186 * 70)
+
+
+def test_precipitation_rating():
+    drake = conductor.drake_constants
+    wind = np.array([[0.0], [1.0], [5.0]])
+    rate = np.array([0.0, 0.0, 1.0, 5.0])
+
+    rating = cigre601.thermal_rating(
+        15.0, wind, 45, 800, drake, 80.0, precipitation_rate=rate
+    )
+
+    assert rating.shape == (3, 4)
+    assert rating[:, 0] == pytest.approx(
+        cigre601.thermal_rating(15.0, wind[:, 0], 45, 800, drake, 80.0), rel=1e-12
+    )
+    assert np.all(rating[:, 3] > rating[:, 2]) and np.all(rating[:, 2] > rating[:, 1])
+
+    in_place = cigre601.thermal_rating(
+        15.0, wind, 45, 800, drake, 80.0, workspace=Workspace(), precipitation_rate=rate
+    )
+    assert in_place == pytest.approx(rating, rel=1e-12)
+
+    # No precipitation is the same as the dry rating
+    assert cigre601.thermal_rating(
+        15.0, wind, 45, 800, drake, 80.0, precipitation_rate=0.0
+    ) == pytest.approx(cigre601.thermal_rating(15.0, wind, 45, 800, drake, 80.0))
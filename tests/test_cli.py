@@ -0,0 +1,143 @@
+import os
+
+import pytest
+import numpy as np
+
+from pylinerating import thermal_rating
+from pylinerating.catalog import load_catalog
+from pylinerating.cli import COLUMNS, main, read_columns
+
+
+@pytest.fixture
+def weather():
+    rng = np.random.default_rng(0)
+
+    return {
+        "ambient_temperature": rng.uniform(-10, 40, 50),
+        "wind_speed": rng.uniform(0, 10, 50),
+        "angle_of_attack": rng.uniform(0, 90, 50),
+        "solar_irradiation": rng.uniform(0, 1000, 50),
+    }
+
+
+def expected(weather, conductor="Drake", standard="cigre"):
+    return thermal_rating(
+        *[weather[name] for name in COLUMNS],
+        load_catalog()[conductor],
+        80.0,
+        standard=standard
+    )
+
+
+def write_csv(path, weather, names=COLUMNS):
+    np.savetxt(
+        path,
+        np.column_stack([weather[name] for name in COLUMNS]),
+        delimiter=",",
+        header=",".join(names),
+        comments="",
+    )
+
+
+def test_rates_every_format(tmp_path, weather):
+    write_csv(tmp_path / "a.csv", weather)
+    np.save(tmp_path / "b.npy", np.column_stack([weather[name] for name in COLUMNS]))
+    np.savez(tmp_path / "c.npz", **weather)
+
+    files = [str(tmp_path / name) for name in ["a.csv", "b.npy", "c.npz"]]
+    assert main(files + ["--conductor", "Hawk", "--standard", "ieee", "-q"]) == 0
+
+    rating = expected(weather, "Hawk", "ieee")
+
+    assert read_columns(str(tmp_path / "a.rating.csv"))["rating"] == pytest.approx(
+        rating, rel=1e-9
+    )
+    assert np.load(tmp_path / "b.rating.npy") == pytest.approx(rating)
+    assert np.load(tmp_path / "c.rating.npz")["rating"] == pytest.approx(rating)
+
+
+def test_column_names_can_be_mapped(tmp_path, weather):
+    names = ["temp", "wind_speed", "angle_of_attack", "solar_irradiation"]
+    write_csv(tmp_path / "a.csv", weather, names)
+
+    assert main([str(tmp_path / "a.csv"), "-q"]) == 1
+    assert not (tmp_path / "a.rating.csv").exists()
+
+    path = str(tmp_path / "a.csv")
+    assert main([path, "--column", "ambient_temperature=temp", "-q"]) == 0
+
+    rating = read_columns(str(tmp_path / "a.rating.csv"))["rating"]
+    assert rating == pytest.approx(expected(weather), rel=1e-9)
+
+
+def test_resume_skips_the_finished_files(tmp_path, weather, capsys):
+    for name in ["a", "b", "c"]:
+        np.savez(tmp_path / (name + ".npz"), **weather)
+
+    # The output of b is complete from an earlier run
+    np.savez(tmp_path / "b.rating.npz", rating=np.zeros(1))
+    files = [str(tmp_path / (name + ".npz")) for name in ["a", "b", "c"]]
+
+    assert main(files + ["--resume", "--output-dir", str(tmp_path)]) == 0
+
+    assert np.load(tmp_path / "b.rating.npz")["rating"] == pytest.approx([0])
+    assert np.load(tmp_path / "c.rating.npz")["rating"] == pytest.approx(
+        expected(weather)
+    )
+
+    report = capsys.readouterr().err
+    assert "[2/2]" in report
+    assert "elements/s" in report
+    assert "1 skipped" in report
+
+
+def test_worker_processes(tmp_path, weather):
+    files = []
+    for i in range(3):
+        files.append(str(tmp_path / "{}.npz".format(i)))
+        np.savez(files[-1], **weather)
+
+    output = tmp_path / "out"
+    assert main(files + ["--jobs", "2", "--output-dir", str(output), "-q"]) == 0
+
+    assert sorted(os.listdir(output)) == [
+        "0.rating.npz",
+        "1.rating.npz",
+        "2.rating.npz",
+    ]
+    assert np.load(output / "2.rating.npz")["rating"] == pytest.approx(
+        expected(weather)
+    )
+
+
+def test_outputs_and_collisions(tmp_path, weather, capsys):
+    write_csv(tmp_path / "a.csv", weather)
+    assert main([str(tmp_path / "a.csv"), "-q"]) == 0
+
+    # The output of the earlier run is not rated again
+    assert main([str(tmp_path / "a.csv"), str(tmp_path / "a.rating.csv")]) == 0
+    assert not (tmp_path / "a.rating.rating.csv").exists()
+    assert "1 skipped" in capsys.readouterr().err
+
+    # An input with a column rating
+    np.savez(tmp_path / "b.npz", rating=np.zeros(50), **weather)
+    assert main([str(tmp_path / "b.npz"), "-q"]) == 1
+    assert not (tmp_path / "b.rating.npz").exists()
+
+    # The same name in two directories
+    for directory in ["x", "y"]:
+        os.makedirs(tmp_path / directory)
+        write_csv(tmp_path / directory / "c.csv", weather)
+
+    files = [str(tmp_path / directory / "c.csv") for directory in ["x", "y"]]
+    with pytest.raises(SystemExit):
+        main(files + ["--output-dir", str(tmp_path / "out")])
+    assert not (tmp_path / "out").exists()
+
+
+def test_invalid_arguments(tmp_path):
+    with pytest.raises(SystemExit):
+        main(["a.csv", "--conductor", "Nothing"])
+
+    with pytest.raises(SystemExit):
+        main(["a.csv", "--column", "temperature=temp"])
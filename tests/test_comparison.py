@@ -0,0 +1,99 @@
+import pytest
+import numpy as np
+
+from pylinerating import cigre601, ieee738, conductor, comparison
+from pylinerating.catalog import load_catalog
+
+
+def weather(count=500):
+    rng = np.random.default_rng(3)
+
+    return (
+        rng.uniform(-10, 40, count),
+        rng.uniform(0, 20, count),
+        rng.uniform(-180, 360, count),
+        rng.uniform(0, 1100, count),
+    )
+
+
+@pytest.mark.parametrize(
+    "constants",
+    [
+        conductor.drake_constants,
+        conductor.drake_constants._replace(high_rs=False),
+        conductor.drake_constants._replace(stranded=False),
+    ],
+)
+def test_compare_matches_both_standards(constants):
+    args = weather()
+
+    result = comparison.compare_standards(*args, constants, 100.0, 10.0, 300.0)
+
+    cigre = cigre601.thermal_rating(*args, constants, 100.0, 10.0, 300.0)
+    ieee = ieee738.thermal_rating(*args, constants, 100.0, 10.0, 300.0)
+
+    assert result.cigre == pytest.approx(cigre, rel=1e-9, nan_ok=True)
+    assert result.ieee == pytest.approx(ieee, rel=1e-9, nan_ok=True)
+    assert np.array_equal(result.difference, result.ieee - result.cigre, equal_nan=True)
+
+
+def test_compare_examples():
+    result = comparison.compare_standards(
+        40.0, 0.61, 90, 1000, conductor.drake_constants, 85.0, 0, 0.0
+    )
+
+    assert result.cigre == pytest.approx(
+        cigre601.thermal_rating(
+            40.0, 0.61, 90, 1000, conductor.drake_constants, 85.0, 0, 0.0
+        )
+    )
+    assert result.ieee == pytest.approx(
+        ieee738.thermal_rating(
+            40.0, 0.61, 90, 1000, conductor.drake_constants, 85.0, 0, 0.0
+        )
+    )
+
+
+def test_compare_in_blocks():
+    ambient_temperature = np.linspace(0, 40, 37).reshape(-1, 1)
+    wind_speed = np.linspace(0, 10, 11)
+    elevation = np.linspace(0, 2000, 37).reshape(-1, 1)
+
+    whole = comparison.compare_standards(
+        ambient_temperature,
+        wind_speed,
+        45.0,
+        800.0,
+        conductor.drake_constants,
+        elevation=elevation,
+    )
+    blocks = comparison.compare_standards(
+        ambient_temperature,
+        wind_speed,
+        45.0,
+        800.0,
+        conductor.drake_constants,
+        elevation=elevation,
+        block_size=50,
+    )
+
+    assert blocks.cigre.shape == (37, 11)
+    assert np.array_equal(blocks.cigre, whole.cigre)
+    assert np.array_equal(blocks.ieee, whole.ieee)
+    assert np.array_equal(blocks.difference, whole.difference)
+
+
+def test_compare_per_span_conductors_in_blocks():
+    catalog = load_catalog()
+    ids = catalog.ids(["Drake", "Hawk", "Falcon", "Cairo"] * 50)
+    args = weather(200)
+    conductors = catalog.conductors(ids)
+
+    result = comparison.compare_standards(*args, conductors, 100.0, block_size=64)
+
+    assert result.cigre == pytest.approx(
+        cigre601.thermal_rating(*args, conductors, 100.0), rel=1e-9, nan_ok=True
+    )
+    assert result.ieee == pytest.approx(
+        ieee738.thermal_rating(*args, conductors, 100.0), rel=1e-9, nan_ok=True
+    )
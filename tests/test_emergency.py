@@ -0,0 +1,159 @@
+import pytest
+import numpy as np
+
+from pylinerating import thermal_rating
+from pylinerating.catalog import load_catalog
+from pylinerating.conductor import drake_constants
+from pylinerating.emergency import (
+    HeatEquation,
+    heat_capacity,
+    rating_for_duration,
+    temperature_after,
+    time_to_limit,
+)
+
+weather = (
+    np.array([20.0, 30.0, 35.0, 10.0]),
+    np.array([0.6, 1.0, 2.0, 0.3]),
+    90,
+    np.array([900.0, 1000.0, 0.0, 500.0]),
+)
+
+
+def test_heat_capacity():
+    # Drake: 1.116 kg/m aluminium (897 J/(kg K)), 0.5119 kg/m steel (481 J/(kg K))
+    assert heat_capacity(drake_constants, 20.0) == pytest.approx(
+        1.116 * 897 + 0.5119 * 481, rel=0.02
+    )
+    assert heat_capacity(drake_constants, 100.0) > heat_capacity(drake_constants, 20.0)
+
+
+def test_temperature_after_reaches_the_steady_state():
+    rating = thermal_rating(*weather, drake_constants, 80.0)
+
+    T = temperature_after(*weather, drake_constants, rating, 40.0, 36000)
+
+    assert T == pytest.approx(80.0, abs=1e-3)
+
+
+def test_temperature_after_adapts_the_step(monkeypatch):
+    rating = thermal_rating(*weather, drake_constants, 80.0)
+    calls = []
+    rate = HeatEquation.rate
+
+    def counted(self, current_squared, temperature):
+        calls.append(1)
+        return rate(self, current_squared, temperature)
+
+    monkeypatch.setattr(HeatEquation, "rate", counted)
+
+    T = temperature_after(*weather, drake_constants, rating, 40.0, 36000, time_step=1)
+
+    assert T == pytest.approx(80.0, abs=1e-3)
+    assert len(calls) < 36000 * 4 / 100
+
+    # Short durations agree with small steps
+    T = temperature_after(*weather, drake_constants, 1.5 * rating, 40.0, 600)
+    reference = temperature_after(
+        *weather, drake_constants, 1.5 * rating, 40.0, 600, time_step=0.1
+    )
+
+    assert T == pytest.approx(reference, abs=1e-3)
+
+
+@pytest.mark.parametrize("standard", ["cigre", "ieee"])
+def test_time_to_limit(standard):
+    current = np.array([1400.0, 1500.0, 2500.0, 1000.0])
+    initial = np.array([50.0, 60.0, 40.0, 70.0])
+
+    t = time_to_limit(
+        *weather, drake_constants, current, initial, 100.0, standard=standard
+    )
+
+    steady = thermal_rating(*weather, drake_constants, 100.0, standard=standard)
+    assert np.array_equal(np.isfinite(t), current > steady)
+
+    reached = np.isfinite(t)
+    T = temperature_after(
+        *[np.broadcast_to(w, t.shape)[reached] for w in weather],
+        drake_constants,
+        current[reached],
+        initial[reached],
+        t[reached],
+        standard=standard,
+    )
+    assert T == pytest.approx(100.0, abs=0.01)
+
+
+def test_time_to_limit_starting_at_the_limit():
+    t = time_to_limit(20.0, 1.0, 90, 900, drake_constants, 2000.0, [80.0, 90.0])
+
+    assert t.tolist() == [0.0, 0.0]
+
+
+@pytest.mark.parametrize("standard", ["cigre", "ieee"])
+def test_rating_for_duration(standard):
+    initial = np.array([50.0, 60.0, 40.0, 100.0])
+    durations = np.array([[600.0], [1800.0], [36000.0]])
+
+    rating = rating_for_duration(
+        *weather, drake_constants, durations, initial, 100.0, standard=standard
+    )
+
+    assert rating.shape == (3, 4)
+    # Shorter emergencies allow more current, except from the limit
+    assert np.all(np.diff(rating[:, :3], axis=0) < 0)
+
+    T = temperature_after(
+        *weather, drake_constants, rating, initial, durations, standard=standard
+    )
+    assert T == pytest.approx(100.0, abs=0.01)
+
+    # A long emergency is the steady state rating
+    steady = thermal_rating(*weather, drake_constants, 100.0, standard=standard)
+    assert rating[-1] == pytest.approx(steady, rel=1e-4)
+    assert rating[:, 3] == pytest.approx(steady[3], rel=1e-4)
+
+
+def test_rating_for_duration_is_consistent_with_time_to_limit():
+    rating = rating_for_duration(*weather, drake_constants, 900.0, 50.0, 100.0)
+
+    t = time_to_limit(*weather, drake_constants, rating, 50.0, 100.0)
+
+    assert t == pytest.approx(900.0, abs=2.0)
+
+
+def test_invalid_duration():
+    with pytest.raises(ValueError):
+        rating_for_duration(*weather, drake_constants, [600.0, 0.0], 50.0)
+
+
+def test_per_span_conductors():
+    catalog = load_catalog()
+    ids = catalog.ids(["Drake", "Hawk", "Falcon", "Cairo"])
+    conductors = catalog.conductors(ids)
+
+    t = time_to_limit(
+        *weather,
+        conductors,
+        1.2 * thermal_rating(*weather, conductors, 100.0),
+        50.0,
+        100.0,
+    )
+    rating = rating_for_duration(*weather, conductors, 900.0, 50.0, 100.0)
+
+    for i, span in enumerate(ids):
+        single = [np.broadcast_to(value, 4)[i] for value in weather]
+        assert t[i] == pytest.approx(
+            time_to_limit(
+                *single,
+                catalog[span],
+                1.2 * thermal_rating(*single, catalog[span], 100.0),
+                50.0,
+                100.0,
+            ),
+            rel=1e-4,
+        )
+        assert rating[i] == pytest.approx(
+            rating_for_duration(*single, catalog[span], 900.0, 50.0, 100.0), rel=1e-4
+        )
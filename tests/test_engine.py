@@ -0,0 +1,172 @@
+import pytest
+import numpy as np
+
+from pylinerating import cigre601, ieee738, conductor, engine, thermal_rating
+from pylinerating.workspace import Workspace
+
+
+def weather():
+    rng = np.random.default_rng(1)
+
+    return (
+        rng.uniform(-10, 40, 50),
+        rng.uniform(0, 15, 50),
+        rng.uniform(-180, 360, 50),
+        rng.uniform(0, 1100, 50),
+    )
+
+
+def test_prepare_inputs():
+    prepared = engine.prepare_inputs(
+        np.array([[20.0], [30.0]]),
+        np.array([1.0, 2.0, 3.0]),
+        np.array([-15.0, 100.0, 270.0]),
+        1000.0,
+        conductor.drake_constants,
+        conductor_temperature=100.0,
+    )
+
+    assert prepared.shape == (2, 3)
+    assert list(prepared.angle_of_attack) == [15.0, 80.0, 90.0]
+    assert prepared.resistance == pytest.approx(9.390e-5, abs=0.001e-5)
+    assert prepared.solar_heating == pytest.approx(22.48)
+
+
+@pytest.mark.parametrize(
+    "standard, function",
+    [("cigre", cigre601.thermal_rating), ("ieee", ieee738.thermal_rating)],
+)
+def test_engines_match_modules(standard, function):
+    ambient_temperature, wind_speed, angle_of_attack, solar_irradiation = weather()
+
+    prepared = engine.prepare_inputs(
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor.drake_constants,
+        100.0,
+        10.0,
+        300.0,
+    )
+
+    expected = function(
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor.drake_constants,
+        100.0,
+        10.0,
+        300.0,
+    )
+
+    assert np.array_equal(
+        engine.get_engine(standard).thermal_rating(prepared), expected
+    )
+
+
+def test_evaluate_both_standards():
+    prepared = engine.prepare_inputs(*weather(), conductor.drake_constants)
+
+    ratings = engine.evaluate(prepared)
+
+    assert sorted(ratings) == ["cigre", "ieee"]
+    assert np.array_equal(
+        ratings["cigre"],
+        cigre601.thermal_rating(*weather(), conductor.drake_constants),
+        equal_nan=True,
+    )
+    assert np.array_equal(
+        ratings["ieee"],
+        ieee738.thermal_rating(*weather(), conductor.drake_constants),
+        equal_nan=True,
+    )
+
+
+def test_register_engine():
+    class NoWindEngine(engine.Cigre601Engine):
+        name = "cigre-no-wind"
+
+        def cooling(self, prepared):
+            return super().cooling(prepared._replace(wind_speed=0.0))
+
+        # Not the in-place cooling of CIGRE-601, it would ignore `cooling`
+        cooling_into = engine.RatingEngine.cooling_into
+
+    engine.register_engine(NoWindEngine())
+
+    try:
+        assert "cigre-no-wind" in engine.available_engines()
+
+        still = thermal_rating(
+            20.0, 0.0, 90.0, 1000.0, conductor.drake_constants, standard="cigre"
+        )
+        windy = thermal_rating(
+            20.0, 5.0, 90.0, 1000.0, conductor.drake_constants, standard="cigre-no-wind"
+        )
+
+        assert windy == pytest.approx(still)
+        assert (
+            thermal_rating(
+                20.0,
+                5.0,
+                90.0,
+                1000.0,
+                conductor.drake_constants,
+                standard="cigre-no-wind",
+                workspace=Workspace(),
+            )
+            == pytest.approx(still)
+        )
+    finally:
+        del engine._engines["cigre-no-wind"]
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError, match="standard must be cigre or ieee."):
+        engine.get_engine("something")
+
+    class Nameless(engine.RatingEngine):
+        def cooling(self, prepared):
+            return np.zeros(prepared.shape)
+
+    with pytest.raises(ValueError):
+        engine.register_engine(Nameless())
+
+
+def test_engine_without_cooling():
+    with pytest.raises(TypeError):
+        engine.RatingEngine()
+
+
+def test_precipitation_through_the_engine():
+    rate = np.linspace(0, 5, 50)
+    args = weather() + (conductor.drake_constants, 80.0)
+
+    expected = cigre601.thermal_rating(*args, precipitation_rate=rate)
+
+    assert thermal_rating(*args, precipitation_rate=rate) == pytest.approx(expected)
+    assert thermal_rating(
+        *args, precipitation_rate=rate, workspace=Workspace()
+    ) == pytest.approx(expected)
+
+    # A scalar rate gives the shape of the precipitation
+    dry = thermal_rating(weather()[0][0], 1.0, 90, 0, conductor.drake_constants)
+    assert thermal_rating(
+        weather()[0][0], 1.0, 90, 0, conductor.drake_constants, precipitation_rate=rate
+    ).shape == (50,)
+    assert (
+        thermal_rating(
+            weather()[0][0],
+            1.0,
+            90,
+            0,
+            conductor.drake_constants,
+            precipitation_rate=np.zeros(3),
+        )
+        == pytest.approx([dry] * 3)
+    )
+
+    with pytest.raises(ValueError):
+        thermal_rating(*args, precipitation_rate=rate, standard="ieee")
@@ -0,0 +1,129 @@
+import pytest
+import numpy as np
+
+from pylinerating import cigre601, ieee738, conductor, forecast
+from pylinerating.catalog import load_catalog
+from pylinerating.conductor import map_arrays
+
+
+def weather_cube(spans=7, horizons=12, members=5):
+    rng = np.random.default_rng(42)
+    shape = (spans, horizons, members)
+
+    ambient_temperature = rng.uniform(0, 35, shape)
+    wind_speed = rng.uniform(0.5, 10, shape)
+    angle_of_attack = rng.uniform(0, 360, shape)
+    solar_irradiation = rng.uniform(0, 1000, shape)
+
+    return ambient_temperature, wind_speed, angle_of_attack, solar_irradiation
+
+
+def test_rolling_minimum():
+    values = np.array([5.0, 3.0, 4.0, 1.0, 2.0, 6.0])
+
+    assert list(forecast.rolling_minimum(values, 1)) == list(values)
+    assert list(forecast.rolling_minimum(values, 2)) == [3, 3, 1, 1, 2, 6]
+    assert list(forecast.rolling_minimum(values, 3)) == [3, 1, 1, 1, 2, 6]
+    assert list(forecast.rolling_minimum(values, 10)) == [1, 1, 1, 1, 2, 6]
+
+    with pytest.raises(ValueError):
+        forecast.rolling_minimum(values, 0)
+
+
+@pytest.mark.parametrize(
+    "standard, function",
+    [("cigre", cigre601.thermal_rating), ("ieee", ieee738.thermal_rating)],
+)
+def test_forecast_matches_full_cube(standard, function):
+    ambient_temperature, wind_speed, angle_of_attack, solar_irradiation = weather_cube()
+    elevation = np.linspace(0, 1000, 7).reshape(-1, 1, 1)
+
+    result = forecast.forecast_rating(
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor.drake_constants,
+        conductor_temperature=100.0,
+        elevation=elevation,
+        standard=standard,
+        percentiles=(10, 50),
+        window=4,
+        chunk_size=3,
+    )
+
+    full = function(
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor.drake_constants,
+        conductor_temperature=100.0,
+        elevation=elevation,
+    )
+    expected = np.percentile(full, [10, 50], axis=2)
+
+    assert result.percentiles.shape == (2, 7, 12)
+    assert result.percentiles == pytest.approx(expected)
+
+    assert result.rolling_minimum[:, :, 0] == pytest.approx(
+        expected[:, :, :4].min(axis=2)
+    )
+    assert result.rolling_minimum[:, :, -1] == pytest.approx(expected[:, :, -1])
+
+
+def test_forecast_member_axis():
+    ambient_temperature, wind_speed, angle_of_attack, solar_irradiation = weather_cube()
+
+    swapped = [
+        np.swapaxes(value, 1, 2)
+        for value in (
+            ambient_temperature,
+            wind_speed,
+            angle_of_attack,
+            solar_irradiation,
+        )
+    ]
+
+    expected = forecast.forecast_rating(
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor.drake_constants,
+    )
+
+    result = forecast.forecast_rating(
+        *swapped, conductor.drake_constants, horizon_axis=2, member_axis=1
+    )
+
+    assert result.percentiles == pytest.approx(expected.percentiles)
+
+
+def test_forecast_invalid_arguments():
+    cube = weather_cube()
+
+    with pytest.raises(ValueError):
+        forecast.forecast_rating(*cube, conductor.drake_constants, standard="x")
+
+    with pytest.raises(ValueError):
+        forecast.forecast_rating(*cube, conductor.drake_constants, member_axis=1)
+
+    with pytest.raises(ValueError):
+        forecast.forecast_rating(
+            *[value[0] for value in cube], conductor.drake_constants
+        )
+
+
+def test_forecast_per_span_conductors():
+    cube = weather_cube()
+    catalog = load_catalog()
+    conductors = catalog.conductors(
+        catalog.ids(["Drake", "Hawk", "Falcon", "Cairo", "Drake", "Hawk", "Falcon"])
+    )
+    per_span = map_arrays(conductors, lambda value: value.reshape(-1, 1, 1))
+
+    result = forecast.forecast_rating(*cube, per_span, percentiles=(50,), chunk_size=3)
+
+    expected = np.percentile(cigre601.thermal_rating(*cube, per_span), 50, axis=2)
+    assert result.percentiles[0] == pytest.approx(expected)
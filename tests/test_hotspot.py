@@ -0,0 +1,100 @@
+import pytest
+import numpy as np
+
+from pylinerating import thermal_rating
+from pylinerating.catalog import load_catalog
+from pylinerating.conductor import drake_constants
+from pylinerating.hotspot import limiting_spans
+from pylinerating.wind import wind_angle
+
+
+def line_weather(spans=37, times=50):
+    rng = np.random.default_rng(3)
+    shape = (spans, times)
+
+    return (
+        rng.uniform(-10, 35, shape),
+        rng.uniform(0, 10, shape),
+        rng.uniform(0, 360, shape),
+        rng.uniform(0, 1000, (1, times)),
+    )
+
+
+@pytest.mark.parametrize("standard", ["cigre", "ieee"])
+@pytest.mark.parametrize("k", [1, 4])
+def test_limiting_spans_match_the_full_matrix(standard, k):
+    weather = line_weather()
+    elevation = np.linspace(0, 800, 37).reshape(-1, 1)
+
+    result = limiting_spans(
+        *weather,
+        drake_constants,
+        elevation=elevation,
+        standard=standard,
+        k=k,
+        span_chunk=10,
+        time_chunk=16,
+    )
+
+    full = thermal_rating(
+        *weather, drake_constants, elevation=elevation, standard=standard
+    )
+
+    assert result.spans.shape == result.ratings.shape == (k, 50)
+    assert result.ratings == pytest.approx(np.sort(full, axis=0)[:k], rel=1e-12)
+    assert np.array_equal(result.spans, np.argsort(full, axis=0)[:k])
+
+
+def test_nan_spans_are_not_limiting():
+    ambient, wind, angle, solar = line_weather(spans=5, times=3)
+    ambient[0] = 100.0  # above the conductor temperature
+
+    with np.errstate(invalid="ignore"):
+        result = limiting_spans(ambient, wind, angle, solar, drake_constants, k=10)
+
+    assert result.ratings.shape == (5, 3)
+    assert np.isfinite(result.ratings[:4]).all()
+    assert np.isnan(result.ratings[4]).all()
+    assert (result.spans[4] == 0).all()
+
+
+def test_limiting_spans_with_the_wind_direction():
+    ambient, wind, direction, solar = line_weather()
+    azimuth = np.linspace(0, 180, 37).reshape(-1, 1)
+
+    result = limiting_spans(
+        ambient,
+        wind,
+        wind_angle(direction, azimuth),
+        solar,
+        drake_constants,
+        span_chunk=8,
+    )
+    expected = limiting_spans(
+        ambient, wind, direction - azimuth, solar, drake_constants
+    )
+
+    assert np.array_equal(result.spans, expected.spans)
+    assert result.ratings == pytest.approx(expected.ratings, rel=1e-12)
+
+
+def test_invalid_arguments():
+    weather = line_weather()
+
+    with pytest.raises(ValueError):
+        limiting_spans(*weather, drake_constants, k=0)
+
+    with pytest.raises(ValueError):
+        limiting_spans(20.0, np.ones(5), 90, 0, drake_constants)
+
+
+def test_limiting_spans_with_per_span_conductors():
+    weather = line_weather()
+    catalog = load_catalog()
+    ids = catalog.ids(["Drake", "Hawk", "Falcon", "Cairo"] * 9 + ["Drake"])
+    conductors = catalog.conductors(ids[:, None])
+
+    result = limiting_spans(*weather, conductors, k=2, span_chunk=10, time_chunk=16)
+
+    full = thermal_rating(*weather, conductors)
+    assert result.ratings == pytest.approx(np.sort(full, axis=0)[:2], rel=1e-12)
@@ -0,0 +1,98 @@
+import pytest
+import numpy as np
+
+from pylinerating.interpolation import GridMapper
+
+# Descending latitudes, the usual layout of NWP output
+grid_latitudes = np.linspace(55.0, 45.0, 11)
+grid_longitudes = np.linspace(5.0, 20.0, 16)
+
+span_latitudes = np.array([50.0, 47.25, 54.9, 45.0, 60.0])
+span_longitudes = np.array([10.0, 12.4, 5.1, 19.99, 0.0])
+
+
+def linear_field(a=2.0, b=-3.0, c=7.0):
+    return a * grid_latitudes[:, None] + b * grid_longitudes[None, :] + c
+
+
+def test_bilinear_is_exact_for_linear_fields():
+    mapper = GridMapper.regular(
+        grid_latitudes, grid_longitudes, span_latitudes, span_longitudes
+    )
+
+    values = mapper.apply(linear_field())
+
+    # The last span is outside of the grid and takes the value of the corner
+    latitudes = np.clip(span_latitudes, 45.0, 55.0)
+    longitudes = np.clip(span_longitudes, 5.0, 20.0)
+
+    assert values == pytest.approx(2.0 * latitudes - 3.0 * longitudes + 7.0)
+    assert mapper.weights.sum(axis=-1) == pytest.approx(np.ones(5))
+
+
+def test_nearest():
+    mapper = GridMapper.regular(
+        grid_latitudes,
+        grid_longitudes,
+        span_latitudes,
+        span_longitudes,
+        method="nearest",
+    )
+
+    values = mapper.apply(linear_field())
+
+    assert mapper.indices.shape == (5, 1)
+    assert values[0] == pytest.approx(2.0 * 50.0 - 3.0 * 10.0 + 7.0)
+    assert values[1] == pytest.approx(2.0 * 47.0 - 3.0 * 12.0 + 7.0)
+
+    with pytest.raises(ValueError):
+        GridMapper.regular(
+            grid_latitudes, grid_longitudes, 50.0, 10.0, method="something"
+        )
+
+
+def test_stack_of_fields():
+    mapper = GridMapper.regular(
+        grid_latitudes, grid_longitudes, span_latitudes, span_longitudes
+    )
+
+    fields = np.stack([linear_field(c=c) for c in range(24)])
+    values = mapper.apply(fields)
+
+    assert values.shape == (24, 5)
+    assert values[5] == pytest.approx(mapper.apply(linear_field(c=5)))
+
+    with pytest.raises(ValueError):
+        mapper.apply(np.zeros((3, 4)))
+
+
+def test_save_and_load(tmp_path):
+    mapper = GridMapper.regular(
+        grid_latitudes, grid_longitudes, span_latitudes, span_longitudes
+    )
+
+    path = tmp_path / "mapper.npz"
+    mapper.save(path)
+    loaded = GridMapper.load(path)
+
+    assert loaded.grid_shape == mapper.grid_shape
+    assert loaded.apply(linear_field()) == pytest.approx(mapper.apply(linear_field()))
+
+
+def test_scattered():
+    pytest.importorskip("scipy")
+
+    latitudes, longitudes = np.meshgrid(grid_latitudes, grid_longitudes, indexing="ij")
+    field = linear_field()
+
+    mapper = GridMapper.scattered(latitudes, longitudes, [50.0, 47.1], [10.0, 12.4])
+    values = mapper.apply(field)
+
+    assert mapper.spans == 2
+    assert values[0] == pytest.approx(2.0 * 50.0 - 3.0 * 10.0 + 7.0)
+    assert values[1] == pytest.approx(2.0 * 47.0 - 3.0 * 12.0 + 7.0)
+
+    mapper = GridMapper.scattered(latitudes, longitudes, [47.5], [12.5], k=4)
+    assert mapper.apply(field) == pytest.approx(
+        [2.0 * 47.5 - 3.0 * 12.5 + 7.0], rel=1e-2
+    )
@@ -0,0 +1,98 @@
+import pytest
+import numpy as np
+
+xarray = pytest.importorskip("xarray")
+
+from pylinerating import labelled, thermal_rating
+from pylinerating.conductor import drake_constants
+
+rng = np.random.default_rng(5)
+
+spans = 6
+times = 20
+
+
+def weather_dataset():
+    coords = {
+        "span": np.arange(spans),
+        "time": np.arange(
+            np.datetime64("2021-07-01T00"),
+            np.datetime64("2021-07-01T20"),
+            np.timedelta64(1, "h"),
+        ),
+    }
+    dims = ("span", "time")
+
+    return xarray.Dataset(
+        {
+            "ambient_temperature": (dims, rng.uniform(0, 35, (spans, times))),
+            "wind_speed": (dims, rng.uniform(0, 10, (spans, times))),
+            "angle_of_attack": (dims, rng.uniform(0, 360, (spans, times))),
+            "solar_irradiation": (dims, rng.uniform(0, 1000, (spans, times))),
+            "mot": ("span", np.linspace(60.0, 100.0, spans)),
+        },
+        coords=coords,
+    )
+
+
+def expected(ds):
+    return thermal_rating(
+        ds.ambient_temperature.values,
+        ds.wind_speed.values,
+        ds.angle_of_attack.values,
+        ds.solar_irradiation.values,
+        drake_constants,
+        ds.mot.values[:, None],
+    )
+
+
+def test_rating_keeps_the_coordinates():
+    ds = weather_dataset()
+
+    rating = labelled.rate_dataset(
+        ds, drake_constants, variables={"conductor_temperature": "mot"}
+    )
+
+    assert rating.dims == ("span", "time")
+    assert (rating.time == ds.time).all()
+    assert rating.attrs["units"] == "A"
+    assert rating.values == pytest.approx(expected(ds))
+
+
+def test_dask_backed_rating_is_lazy():
+    dask = pytest.importorskip("dask")
+
+    ds = weather_dataset().chunk({"span": 2, "time": 5})
+
+    rating = labelled.rate_dataset(
+        ds, drake_constants, variables={"conductor_temperature": "mot"}
+    )
+
+    assert rating.chunks is not None
+
+    with dask.config.set(scheduler="threads"):
+        computed = rating.compute()
+
+    assert computed.values == pytest.approx(expected(ds.compute()))
+
+
+def test_ieee_and_scalar_inputs():
+    ds = weather_dataset()
+
+    rating = labelled.thermal_rating(
+        ds.ambient_temperature, 2.0, 90, 800, drake_constants, standard="ieee"
+    )
+
+    assert rating.values == pytest.approx(
+        thermal_rating(
+            ds.ambient_temperature.values,
+            2.0,
+            90,
+            800,
+            drake_constants,
+            standard="ieee",
+        )
+    )
+
+    with pytest.raises(ValueError):
+        labelled.rate_dataset(ds, drake_constants, variables={"wind_speed": "wind"})
@@ -0,0 +1,99 @@
+import pytest
+import numpy as np
+
+from pylinerating import thermal_rating
+from pylinerating.catalog import load_catalog
+from pylinerating.conductor import drake_constants
+from pylinerating.emergency import temperature_after
+from pylinerating.monitor import TemperatureEstimator
+
+weather = (
+    np.array([20.0, 30.0, 35.0, 10.0]),
+    np.array([0.6, 1.0, 2.0, 0.3]),
+    90,
+    np.array([900.0, 1000.0, 0.0, 500.0]),
+)
+
+
+def test_steady_state_is_kept():
+    rating = thermal_rating(*weather, drake_constants, 80.0)
+    estimator = TemperatureEstimator(drake_constants, 80.0 * np.ones(4))
+
+    for _ in range(10):
+        temperature = estimator.update(300.0, rating, *weather)
+
+    assert temperature == pytest.approx(80.0, abs=1e-6)
+    assert estimator.time.tolist() == [3000.0] * 4
+
+
+@pytest.mark.parametrize("standard", ["cigre", "ieee"])
+def test_irregular_ticks(standard):
+    rng = np.random.default_rng(0)
+    current = np.array([1400.0, 1500.0, 2500.0, 1000.0])
+    estimator = TemperatureEstimator(
+        drake_constants, 40.0 * np.ones(4), standard=standard
+    )
+
+    # Different intervals for every tick and span
+    intervals = rng.uniform(1.0, 120.0, (20, 4))
+    for interval in intervals:
+        estimator.update(interval, current, *weather)
+
+    expected = temperature_after(
+        *weather,
+        drake_constants,
+        current,
+        40.0,
+        intervals.sum(axis=0),
+        standard=standard
+    )
+
+    assert estimator.temperature == pytest.approx(expected, abs=0.01)
+    assert estimator.time == pytest.approx(intervals.sum(axis=0))
+
+
+def test_missing_values_keep_the_temperature():
+    estimator = TemperatureEstimator(drake_constants, [50.0, 50.0, 50.0, 50.0])
+
+    temperature = estimator.update(
+        [60.0, np.nan, 60.0, 60.0], [1000.0, 1000.0, np.nan, 1000.0], *weather
+    )
+
+    assert temperature[1:3].tolist() == [50.0, 50.0]
+    assert np.all(temperature[[0, 3]] != 50.0)
+    assert estimator.time.tolist() == [60.0, 0.0, 0.0, 60.0]
+
+
+def test_compact_state():
+    estimator = TemperatureEstimator(
+        drake_constants, np.full((2, 4), 50.0), dtype=np.float32
+    )
+
+    temperature = estimator.update(60.0, 1000.0, *weather)
+
+    assert estimator.temperature.dtype == np.float32
+    assert temperature.shape == (2, 4)
+    assert temperature[0] == pytest.approx(temperature[1])
+
+
+def test_negative_interval():
+    estimator = TemperatureEstimator(drake_constants, 50.0 * np.ones(4))
+
+    with pytest.raises(ValueError):
+        estimator.update([60.0, -1.0, 60.0, 60.0], 1000.0, *weather)
+
+
+def test_per_span_conductors():
+    catalog = load_catalog()
+    ids = catalog.ids(["Drake", "Hawk", "Falcon", "Cairo"])
+    estimator = TemperatureEstimator(catalog.conductors(ids), 50.0)
+
+    temperature = estimator.update(600.0, 800.0, *weather)
+
+    for i, span in enumerate(ids):
+        single = [np.broadcast_to(value, 4)[i] for value in weather]
+        assert temperature[i] == pytest.approx(
+            temperature_after(
+                *single, catalog[span], 800.0, 50.0, 600.0, time_step=60.0
+            )
+        )
@@ -0,0 +1,135 @@
+import pytest
+import numpy as np
+
+from pylinerating import thermal_rating
+from pylinerating.catalog import load_catalog
+from pylinerating.conductor import drake_constants, map_arrays
+from pylinerating.parallel import SharedArray, SharedMemoryPool
+
+rng = np.random.default_rng(11)
+
+spans = 37
+times = 5
+
+ambient = rng.uniform(0, 35, (spans, times))
+wind = rng.uniform(0, 10, (spans, 1))
+solar = rng.uniform(0, 1000, times)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with SharedMemoryPool(2, tasks=3) as pool:
+        yield pool
+
+
+def test_matches_the_serial_rating(pool):
+    expected = thermal_rating(ambient, wind, 45, solar, drake_constants, 90.0)
+
+    # The pool is reused between calls
+    for standard in ["cigre", "ieee"]:
+        rating = pool.thermal_rating(
+            ambient, wind, 45, solar, drake_constants, 90.0, standard=standard
+        )
+        assert rating == pytest.approx(
+            thermal_rating(
+                ambient, wind, 45, solar, drake_constants, 90.0, standard=standard
+            )
+        )
+
+    assert rating.shape == expected.shape
+
+
+def test_shared_inputs_and_output(pool):
+    shared_ambient = pool.empty(ambient.shape)
+    shared_ambient.array[:] = ambient
+    out = pool.empty((spans, times))
+
+    try:
+        rating = pool.thermal_rating(
+            shared_ambient, wind, 45, solar, drake_constants, out=out
+        )
+
+        assert rating is out.array
+        assert rating == pytest.approx(
+            thermal_rating(ambient, wind, 45, solar, drake_constants)
+        )
+
+        with SharedArray(3) as wrong, pytest.raises(ValueError):
+            pool.thermal_rating(shared_ambient, 1.0, 45, 0, drake_constants, out=wrong)
+
+        with pytest.raises(ValueError, match="SharedArray or a numpy array"):
+            pool.thermal_rating(ambient, 1.0, 45, 0, drake_constants, out=[0.0])
+    finally:
+        shared_ambient.close()
+        out.close()
+
+
+def test_numpy_output(pool):
+    out = np.empty((spans, times))
+
+    assert (
+        pool.thermal_rating(ambient, wind, 45, solar, drake_constants, out=out) is out
+    )
+    assert out == pytest.approx(
+        thermal_rating(ambient, wind, 45, solar, drake_constants)
+    )
+
+    with pytest.raises(ValueError, match="broadcast shape"):
+        pool.thermal_rating(ambient, wind, 45, solar, drake_constants, out=out[:3])
+
+
+def _failing_resistance(temperature):
+    raise ZeroDivisionError("no resistance")
+
+
+def test_errors_of_the_workers(pool):
+    failing = drake_constants._replace(resistance=_failing_resistance)
+
+    # The error of the rating, not of closing the blocks
+    with pytest.raises(ZeroDivisionError, match="no resistance"):
+        pool.thermal_rating(ambient, wind, 45, solar, failing)
+
+    assert pool.thermal_rating(20.0, 1.0, 90, 900, drake_constants) > 0
+
+
+def test_scalar_inputs(pool):
+    assert pool.thermal_rating(20.0, 1.0, 90, 900, drake_constants) == pytest.approx(
+        thermal_rating(20.0, 1.0, 90, 900, drake_constants)
+    )
+
+
+def test_per_span_conductors(pool):
+    catalog = load_catalog()
+    ids = catalog.ids(["Drake", "Hawk", "Falcon", "Cairo"] * 9 + ["Drake"])
+    conductors = catalog.conductors(ids[:, None])
+
+    assert pool.thermal_rating(ambient, wind, 45, solar, conductors) == pytest.approx(
+        thermal_rating(ambient, wind, 45, solar, conductors)
+    )
+
+
+def test_no_array_is_sent_to_the_workers(pool, monkeypatch):
+    catalog = load_catalog()
+    ids = catalog.ids(["Drake", "Hawk"] * 18 + ["Cairo"])
+    conductors = catalog.conductors(ids[:, None])
+
+    tasks = []
+    pool_map = pool._pool.map
+
+    def map_tasks(function, items):
+        tasks.extend(items)
+        return pool_map(function, items)
+
+    monkeypatch.setattr(pool._pool, "map", map_tasks)
+
+    rating = pool.thermal_rating(ambient, wind, 45, solar, conductors)
+
+    assert rating == pytest.approx(thermal_rating(ambient, wind, 45, solar, conductors))
+    for inputs, _, _, _, _, conductor, _ in tasks:
+        arrays = []
+        map_arrays(conductor, arrays.append)
+
+        assert arrays == []
+        assert all(
+            np.ndim(value) == 0 for value in inputs if isinstance(value, np.ndarray)
+        )
@@ -0,0 +1,102 @@
+import pytest
+import numpy as np
+
+from pylinerating import thermal_rating
+from pylinerating.conductor import drake_constants, drake_resistance
+from pylinerating.resistance import (
+    ACResistance,
+    magnetic_factor,
+    skin_effect_factor,
+    thermal_rating_ac,
+)
+
+
+def test_skin_effect_factor():
+    # IEC 60287 example values: R_dc = 7e-5 ohm/m at 60 Hz gives about 2.4 %
+    assert skin_effect_factor(7e-5, 60.0) == pytest.approx(1.0237, abs=1e-4)
+
+    # Smaller conductors have less skin effect
+    assert skin_effect_factor(2e-4) < skin_effect_factor(7e-5)
+    assert skin_effect_factor(7e-5, 50.0, 0.8) < skin_effect_factor(7e-5, 50.0)
+
+
+def test_magnetic_factor():
+    current = np.array([0.0, 500.0, 5000.0])
+
+    assert magnetic_factor(current, 400.0, 0.02, 0.05) == pytest.approx(
+        [0, 0.025, 0.05]
+    )
+
+
+def test_resistance_without_current_is_a_function_of_temperature():
+    resistance = ACResistance(
+        drake_resistance,
+        frequency=60.0,
+        aluminum_area=402.8,
+        magnetic_slope=0.02,
+        magnetic_saturation=0.05,
+    )
+    temperatures = np.array([25.0, 75.0])
+
+    assert resistance(temperatures) == pytest.approx(
+        drake_resistance(temperatures)
+        * skin_effect_factor(drake_resistance(temperatures), 60.0)
+    )
+    assert resistance(75.0, 1000.0) > resistance(75.0)
+
+    with pytest.raises(ValueError):
+        ACResistance(drake_resistance, magnetic_slope=0.02, magnetic_saturation=0.05)
+
+
+def test_rating_without_magnetic_heating_is_the_plain_rating():
+    conductor = drake_constants._replace(resistance=ACResistance(drake_resistance))
+
+    ambient = np.array([10.0, 25.0, 40.0])
+
+    assert thermal_rating_ac(ambient, 1.0, 45, 900, conductor, 80) == pytest.approx(
+        thermal_rating(ambient, 1.0, 45, 900, conductor, 80)
+    )
+
+
+def test_fixed_point_is_consistent():
+    resistance = ACResistance(
+        drake_resistance,
+        aluminum_area=402.8,
+        magnetic_slope=0.1,
+        magnetic_saturation=0.2,
+    )
+    conductor = drake_constants._replace(resistance=resistance)
+
+    ambient = np.array([[10.0, 25.0, 40.0]])
+    wind = np.array([[0.5], [2.0]])
+
+    rating = thermal_rating_ac(ambient, wind, 45, 900, conductor, 80, tolerance=1e-9)
+    plain = thermal_rating(ambient, wind, 45, 900, conductor, 80)
+
+    assert rating.shape == (2, 3)
+    assert np.all(rating < plain)
+
+    # The joule heating with the final resistance matches the heat balance
+    assert rating ** 2 * resistance(80, rating) == pytest.approx(
+        plain ** 2 * resistance(80)
+    )
+
+
+def test_per_span_magnetic_heating():
+    resistance = ACResistance(
+        drake_resistance,
+        aluminum_area=np.array([402.8, 402.8, 201.4]),
+        magnetic_slope=np.array([0.0, 0.1, 0.1]),
+        magnetic_saturation=0.5,
+    )
+    conductor = drake_constants._replace(resistance=resistance)
+
+    rating = thermal_rating_ac(25.0, 1.0, 45, 900, conductor, 80, tolerance=1e-9)
+    plain = thermal_rating(25.0, 1.0, 45, 900, conductor, 80)
+
+    assert rating.shape == (3,)
+    assert rating[0] == pytest.approx(plain)
+    assert rating[2] < rating[1] < plain
+    assert rating ** 2 * resistance(80, rating) == pytest.approx(
+        plain ** 2 * resistance(80)
+    )
@@ -0,0 +1,86 @@
+import pytest
+import numpy as np
+
+from pylinerating import sagtension, thermal_rating
+from pylinerating.conductor import drake_constants
+from pylinerating.sagtension import drake_mechanics
+
+span_length = 300.0
+reference_temperature = 15.0
+reference_tension = 28000.0
+
+
+def test_state_change_round_trip():
+    temperature = np.array([-20.0, 15.0, 50.0, 100.0, 150.0])
+
+    tension = sagtension.tension_at_temperature(
+        temperature,
+        drake_mechanics,
+        span_length,
+        reference_temperature,
+        reference_tension,
+    )
+
+    assert tension[1] == pytest.approx(reference_tension)
+    assert np.all(np.diff(tension) < 0)
+    assert sagtension.temperature_at_tension(
+        tension, drake_mechanics, span_length, reference_temperature, reference_tension
+    ) == pytest.approx(temperature)
+
+
+def test_clearance_temperature_reaches_the_sag():
+    maximum_sag = np.array([7.0, 8.0, 9.0])
+
+    temperature = sagtension.clearance_temperature(
+        maximum_sag,
+        drake_mechanics,
+        span_length,
+        reference_temperature,
+        reference_tension,
+    )
+
+    assert (
+        sagtension.sag_at_temperature(
+            temperature,
+            drake_mechanics,
+            span_length,
+            reference_temperature,
+            reference_tension,
+        )
+        == pytest.approx(maximum_sag)
+    )
+
+
+def test_clearance_limited_rating():
+    # 3 spans, 4 time steps
+    maximum_sag = np.array([[7.5], [8.5], [20.0]])
+    ambient = np.array([0.0, 10.0, 20.0, 30.0])
+
+    rating = sagtension.clearance_limited_rating(
+        ambient,
+        1.0,
+        90,
+        900,
+        drake_constants,
+        drake_mechanics,
+        span_length,
+        reference_temperature,
+        reference_tension,
+        maximum_sag,
+        maximum_temperature=80.0,
+    )
+
+    assert rating.shape == (3, 4)
+
+    limit = sagtension.clearance_temperature(
+        7.5, drake_mechanics, span_length, reference_temperature, reference_tension
+    )
+    assert rating[0] == pytest.approx(
+        thermal_rating(ambient, 1.0, 90, 900, drake_constants, limit)
+    )
+
+    # The last span is not limited by the clearance
+    assert rating[2] == pytest.approx(
+        thermal_rating(ambient, 1.0, 90, 900, drake_constants, 80.0)
+    )
+    assert np.all(rating[0] < rating[1])
@@ -0,0 +1,88 @@
+import pytest
+import numpy as np
+
+from pylinerating import cigre601, ieee738, conductor, sensitivity
+
+functions = {"cigre": cigre601.thermal_rating, "ieee": ieee738.thermal_rating}
+
+
+def finite_differences(standard, parameters, steps, **kwargs):
+    function = functions[standard]
+    columns = []
+
+    for index, step in enumerate(steps):
+        upper = list(parameters)
+        lower = list(parameters)
+        upper[index] = parameters[index] + step
+        lower[index] = parameters[index] - step
+
+        columns.append(
+            (
+                function(*upper[:4], conductor.drake_constants, **kwargs)
+                - function(*lower[:4], conductor.drake_constants, **kwargs)
+            )
+            / (2 * step)
+        )
+
+    return np.stack(columns, axis=-1)
+
+
+@pytest.mark.parametrize("standard", ["cigre", "ieee"])
+def test_jacobian_matches_finite_differences(standard):
+    # Forced convection, natural convection and several Nusselt regimes
+    ambient_temperature = np.array([40.0, 20.0, 10.0, 35.0, 0.0])
+    wind_speed = np.array([0.61, 1.66, 5.0, 0.05, 15.0])
+    angle_of_attack = np.array([60.0, 80.0, 10.0, 45.0, 130.0])
+    solar_irradiation = np.array([1000.0, 540.6, 0.0, 900.0, 200.0])
+
+    parameters = [ambient_temperature, wind_speed, angle_of_attack, solar_irradiation]
+    kwargs = dict(conductor_temperature=100.0, horizontal_angle=0, elevation=300.0)
+
+    rating, jacobian = sensitivity.thermal_rating_jacobian(
+        *parameters, conductor.drake_constants, standard=standard, **kwargs
+    )
+
+    assert rating == pytest.approx(
+        functions[standard](*parameters, conductor.drake_constants, **kwargs)
+    )
+    assert jacobian.shape == (5, 4)
+
+    expected = finite_differences(
+        standard, parameters, [1e-4, 1e-6, 1e-4, 1e-3], **kwargs
+    )
+
+    assert jacobian == pytest.approx(expected, rel=1e-4, abs=1e-6)
+
+
+def test_jacobian_natural_convection_has_no_wind_slope():
+    rating, jacobian = sensitivity.thermal_rating_jacobian(
+        25.0, 0.0, 90.0, 500.0, conductor.drake_constants, conductor_temperature=80.0
+    )
+
+    assert np.isfinite(rating)
+    assert jacobian[1] == 0.0
+    assert jacobian[2] == 0.0
+
+
+def test_jacobian_broadcasting():
+    ambient_temperature = np.array([[10.0], [20.0], [30.0]])
+    wind_speed = np.array([1.0, 2.0])
+
+    rating, jacobian = sensitivity.thermal_rating_jacobian(
+        ambient_temperature, wind_speed, 45.0, 800.0, conductor.drake_constants
+    )
+
+    assert rating.shape == (3, 2)
+    assert jacobian.shape == (3, 2, 4)
+
+    # Colder air and more wind increase the rating, the sun decreases it
+    assert np.all(jacobian[..., 0] < 0)
+    assert np.all(jacobian[..., 1] > 0)
+    assert np.all(jacobian[..., 3] < 0)
+
+
+def test_jacobian_invalid_standard():
+    with pytest.raises(ValueError):
+        sensitivity.thermal_rating_jacobian(
+            25.0, 1.0, 90.0, 500.0, conductor.drake_constants, standard="x"
+        )
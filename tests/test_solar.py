@@ -0,0 +1,117 @@
+import pytest
+import numpy as np
+
+from pylinerating import solar, cigre601, ieee738, conductor
+
+# The example of IEEE-738 annex B and CIGRE-601 example A
+latitude = 30.0
+span_azimuth = 90.0
+timestamp = np.datetime64("2021-06-10T11:00")
+
+
+def test_day_of_year_and_hour():
+    day_of_year, hour = solar.day_of_year_and_hour(timestamp)
+
+    assert day_of_year == 161
+    assert hour == 11.0
+
+    day_of_year, hour = solar.day_of_year_and_hour(
+        np.datetime64("2021-06-10T23:00"), longitude=30.0
+    )
+
+    assert day_of_year == 162
+    assert hour == pytest.approx(1.0)
+
+
+def test_solar_position_ieee():
+    position = solar.solar_position(latitude, timestamp, standard="ieee")
+
+    assert position.altitude == pytest.approx(74.8, abs=0.15)
+    assert position.azimuth == pytest.approx(114.2, abs=0.3)
+
+    incidence = solar.incidence_angle(position.altitude, position.azimuth, span_azimuth)
+
+    assert incidence == pytest.approx(76.3, abs=0.15)
+
+
+def test_effective_irradiation_ieee():
+    irradiation = solar.effective_irradiation(
+        latitude, span_azimuth, 0.0, timestamp, standard="ieee"
+    )
+
+    qs = ieee738.solar_heat_gain(irradiation, conductor.drake_constants_ieee738)
+
+    assert qs == pytest.approx(22.44, abs=0.1)
+
+
+def test_effective_irradiation_cigre():
+    irradiation = solar.effective_irradiation(latitude, span_azimuth, 0.0, timestamp)
+
+    assert irradiation == pytest.approx(1210, abs=1)
+
+    Ps = cigre601.power_solar(irradiation, conductor.drake_constants)
+    assert Ps == pytest.approx(27.2, abs=0.1)
+
+
+@pytest.mark.parametrize("standard", ["cigre", "ieee"])
+def test_night_and_broadcasting(standard):
+    timestamps = np.arange(
+        "2021-12-21T00", "2021-12-22T00", dtype="datetime64[h]"
+    ).astype("datetime64[s]")
+    latitudes = np.array([[0.0], [45.0], [60.0]])
+    azimuths = np.array([[0.0], [45.0], [90.0]])
+
+    irradiation = solar.effective_irradiation(
+        latitudes, azimuths, 300.0, timestamps, standard=standard
+    )
+
+    assert irradiation.shape == (3, 24)
+    assert np.all(irradiation[:, :5] == 0.0)
+    assert np.all(irradiation[:, 12] > 0.0)
+
+    # The same as computing every element on its own
+    for i in range(3):
+        for j in [3, 8, 12, 15]:
+            single = solar.effective_irradiation(
+                latitudes[i, 0], azimuths[i, 0], 300.0, timestamps[j], standard=standard
+            )
+            assert irradiation[i, j] == pytest.approx(single)
+
+
+def test_longitude():
+    local = solar.effective_irradiation(latitude, span_azimuth, 0.0, timestamp)
+
+    utc = solar.effective_irradiation(
+        latitude,
+        span_azimuth,
+        0.0,
+        np.datetime64("2021-06-10T09:00"),
+        longitude=30.0,
+    )
+    per_span = solar.effective_irradiation(
+        latitude,
+        span_azimuth,
+        0.0,
+        np.datetime64("2021-06-10T09:00"),
+        longitude=np.array([30.0, 30.0]),
+    )
+
+    assert utc == pytest.approx(local)
+    assert per_span == pytest.approx([local, local])
+
+
+def test_feeds_rating():
+    irradiation = solar.effective_irradiation(latitude, span_azimuth, 0.0, timestamp)
+
+    rating = cigre601.thermal_rating(
+        40.0, 0.61, 60.0, irradiation, conductor.drake_constants, 100.0, 0, 0.0
+    )
+
+    assert rating == pytest.approx(976, abs=1)
+
+
+def test_invalid_standard():
+    with pytest.raises(ValueError):
+        solar.effective_irradiation(
+            latitude, span_azimuth, 0.0, timestamp, standard="x"
+        )
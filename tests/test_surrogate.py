@@ -0,0 +1,103 @@
+import pytest
+import numpy as np
+
+from pylinerating import thermal_rating
+from pylinerating.conductor import drake_constants
+from pylinerating.surrogate import PiecewiseChebyshev, fit_surrogate
+
+
+def random_weather(size, seed=0):
+    rng = np.random.default_rng(seed)
+
+    return (
+        rng.uniform(-40, 50, size),
+        np.concatenate([np.zeros(10), rng.uniform(0, 30, size - 10)]),
+        rng.uniform(-360, 360, size),
+        rng.uniform(0, 1400, size),
+    )
+
+
+def test_piecewise_chebyshev_fits_pieces_with_jumps():
+    def function(x):
+        return np.where(x < 1, np.exp(x), np.sin(x))
+
+    fitted = PiecewiseChebyshev.fit(function, [-1.0, 1.0, 4.0], 1e-9)
+
+    x = np.linspace(-1, 4, 1001)
+    assert fitted.error <= 1e-9
+    assert fitted(x) == pytest.approx(function(x), abs=1e-9)
+
+
+@pytest.mark.parametrize("standard", ["cigre", "ieee"])
+@pytest.mark.parametrize("stranded", [True, False])
+def test_surrogate_is_within_its_bound(standard, stranded):
+    conductor = drake_constants._replace(stranded=stranded)
+    surrogate = fit_surrogate(conductor, standard=standard)
+
+    weather = random_weather(20000)
+    exact = thermal_rating(*weather, conductor, 80.0, standard=standard)
+
+    assert 0 < surrogate.max_relative_error < 1e-5
+    assert np.max(np.abs(surrogate(*weather) / exact - 1)) < (
+        surrogate.max_relative_error
+    )
+
+
+def test_surrogate_pieces_at_the_natural_regimes():
+    # Gr * Pr crosses 1e4 in the envelope of a thin conductor
+    conductor = drake_constants._replace(diameter=12e-3)
+    surrogate = fit_surrogate(
+        conductor,
+        conductor_temperature=60,
+        elevation=0,
+        ambient_temperature=(-40, 40),
+        solar_irradiation=(0, 1000),
+    )
+
+    assert np.any(np.abs(surrogate.log_natural.breaks + 2.06) < 0.01)
+
+    ambient, wind, angle, solar = random_weather(20000, seed=1)
+    ambient, solar = ambient * 0.8, solar * 0.7
+    exact = thermal_rating(ambient, wind, angle, solar, conductor, 60.0, elevation=0)
+
+    assert np.max(np.abs(surrogate(ambient, wind, angle, solar) / exact - 1)) < (
+        surrogate.max_relative_error
+    )
+
+
+def test_surrogate_broadcasts():
+    surrogate = fit_surrogate(drake_constants)
+
+    ambient = np.array([[0.0], [20.0], [40.0]])
+    wind = np.array([0.0, 0.5, 2.0, 10.0])
+
+    rating = surrogate(ambient, wind, 45, 900)
+
+    assert rating.shape == (3, 4)
+    assert rating == pytest.approx(
+        thermal_rating(ambient, wind, 45, 900, drake_constants, 80.0), rel=1e-6
+    )
+    assert np.ndim(surrogate(20.0, 1.0, 45, 900)) == 0
+
+
+def test_surrogate_is_nan_outside_the_envelope():
+    surrogate = fit_surrogate(drake_constants, wind_speed=(0.0, 10.0))
+
+    rating = surrogate(np.array([20.0, 60.0, 20.0, 20.0]), [1.0, 1.0, 11.0, -1], 90, 0)
+
+    assert np.isfinite(rating[0])
+    assert np.isnan(rating[1:]).all()
+
+
+def test_invalid_envelope():
+    with pytest.raises(ValueError):
+        fit_surrogate(drake_constants, ambient_temperature=(0.0, 90.0))
+
+    with pytest.raises(ValueError):
+        fit_surrogate(drake_constants, wind_speed=(0.0, 200.0))
+
+    with pytest.raises(ValueError):
+        fit_surrogate(drake_constants, solar_irradiation=(0.0, 1e5))
+
+    with pytest.raises(ValueError):
+        fit_surrogate(drake_constants, standard="other")
@@ -0,0 +1,96 @@
+import warnings
+
+import pytest
+import numpy as np
+
+from pylinerating import cigre601, ieee738, conductor, validation
+
+# ok, no capacity, ambient above the limit, invalid input
+ambient_temperature = np.array([20.0, 45.0, 110.0, np.nan])
+wind_speed = np.array([2.0, 0.0, 1.0, 1.0])
+angle_of_attack = np.array([90.0, 90.0, 90.0, 90.0])
+solar_irradiation = np.array([500.0, 3000.0, 0.0, 0.0])
+conductor_temperature = 50.0
+
+expected_status = [
+    validation.STATUS_OK,
+    validation.STATUS_NO_CAPACITY,
+    validation.STATUS_AMBIENT_ABOVE_LIMIT,
+    validation.STATUS_INVALID_INPUT,
+]
+
+
+def rate(standard, policy):
+    return validation.validated_thermal_rating(
+        ambient_temperature,
+        wind_speed,
+        angle_of_attack,
+        solar_irradiation,
+        conductor.drake_constants,
+        conductor_temperature,
+        standard=standard,
+        policy=policy,
+    )
+
+
+@pytest.mark.parametrize(
+    "standard, function",
+    [("cigre", cigre601.thermal_rating), ("ieee", ieee738.thermal_rating)],
+)
+def test_clip(standard, function):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        rating, status = rate(standard, "clip")
+
+    assert status.dtype == np.uint8
+    assert list(status) == expected_status
+
+    expected = function(
+        ambient_temperature[0],
+        wind_speed[0],
+        angle_of_attack[0],
+        solar_irradiation[0],
+        conductor.drake_constants,
+        conductor_temperature,
+    )
+
+    assert rating[0] == pytest.approx(expected)
+    assert list(rating[1:]) == [0.0, 0.0, 0.0]
+
+
+@pytest.mark.parametrize("standard", ["cigre", "ieee"])
+def test_mask(standard):
+    rating, status = rate(standard, "mask")
+
+    assert list(rating.mask) == [False, True, True, True]
+    assert rating.count() == 1
+
+
+@pytest.mark.parametrize("standard", ["cigre", "ieee"])
+def test_raise(standard):
+    with pytest.raises(ValueError, match="1 no capacity"):
+        rate(standard, "raise")
+
+    rating, status = validation.validated_thermal_rating(
+        20.0, 2.0, 90.0, 500.0, conductor.drake_constants, policy="raise"
+    )
+
+    assert status == validation.STATUS_OK
+
+
+def test_heat_balance_matches_rating():
+    balance = cigre601.heat_balance(
+        40.0, 0.61, 60.0, 1210.0, conductor.drake_constants, 100.0, 0, 0.0
+    )
+
+    current = np.sqrt(balance / conductor.drake_constants.resistance(100.0))
+
+    assert current == pytest.approx(976, abs=0.5)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        rate("something", "clip")
+
+    with pytest.raises(ValueError):
+        rate("cigre", "something")
@@ -0,0 +1,95 @@
+import pytest
+import numpy as np
+
+from pylinerating import cigre601, ieee738, thermal_rating
+from pylinerating.comparison import compare_standards
+from pylinerating.conductor import drake_constants
+from pylinerating.wind import fold_angle, sin_cos, wind_angle
+from pylinerating.workspace import Workspace
+
+
+def test_wind_angle():
+    angle = wind_angle([0.0, 90.0, 45.0, 350.0, 180.0], [0.0, 0.0, 90.0, 10.0, 30.0])
+
+    assert angle.angle_of_attack == pytest.approx([0.0, 90.0, 45.0, 20.0, 30.0])
+    assert angle.sin_angle == pytest.approx(np.sin(np.radians(angle.angle_of_attack)))
+    assert angle.cos_angle == pytest.approx(np.cos(np.radians(angle.angle_of_attack)))
+
+
+def test_wind_angle_broadcasts_the_spans():
+    direction = np.linspace(0, 360, 7)
+    azimuth = np.array([[0.0], [30.0], [200.0]])
+
+    angle = wind_angle(direction, azimuth)
+
+    assert angle.angle_of_attack.shape == (3, 7)
+    assert angle.angle_of_attack == pytest.approx(fold_angle(direction - azimuth))
+
+
+@pytest.mark.parametrize("bound", [90.0, 180.0, 720.0])
+def test_fold_angle(bound):
+    angle = np.random.default_rng(0).uniform(-bound, bound, 1000)
+    expected = 90 - np.abs((angle % 180) - 90)
+
+    assert fold_angle(angle) == pytest.approx(expected, abs=1e-12)
+
+    out = np.empty_like(angle)
+    assert fold_angle(angle, out=out) is out
+    assert out == pytest.approx(expected, abs=1e-12)
+
+
+def test_sin_cos_in_place():
+    angle = np.linspace(0, 90, 11)
+    out = (np.empty(11), np.empty(11))
+
+    sin_angle, cos_angle = sin_cos(angle, out=out)
+
+    assert sin_angle is out[0] and cos_angle is out[1]
+    assert sin_angle == pytest.approx(sin_cos(angle)[0], abs=0)
+    assert cos_angle == pytest.approx(np.cos(np.radians(angle)), abs=1e-12)
+
+
+@pytest.mark.parametrize("standard", ["cigre", "ieee"])
+def test_rating_from_the_wind_direction(standard):
+    rng = np.random.default_rng(1)
+    direction = rng.uniform(0, 360, 500)
+    azimuth = rng.uniform(0, 360, 500)
+    weather = (rng.uniform(-10, 40, 500), rng.uniform(0, 15, 500))
+
+    expected = thermal_rating(
+        *weather, direction - azimuth, 900, drake_constants, standard=standard
+    )
+    angle = wind_angle(direction, azimuth)
+    module = {"cigre": cigre601, "ieee": ieee738}[standard]
+
+    assert thermal_rating(
+        *weather, angle, 900, drake_constants, standard=standard
+    ) == pytest.approx(expected, rel=1e-12)
+    assert module.thermal_rating(
+        *weather, angle, 900, drake_constants
+    ) == pytest.approx(expected, rel=1e-12)
+    assert module.thermal_rating(
+        *weather, angle, 900, drake_constants, workspace=Workspace()
+    ) == pytest.approx(expected, rel=1e-12)
+    assert (
+        thermal_rating(
+            *weather,
+            angle,
+            900,
+            drake_constants,
+            standard=standard,
+            workspace=Workspace(),
+        )
+        == pytest.approx(expected, rel=1e-12)
+    )
+
+
+def test_compare_standards_from_the_wind_direction():
+    direction = np.linspace(0, 360, 200).reshape(20, 10)
+    angle = wind_angle(direction, 30.0)
+
+    result = compare_standards(20.0, 2.0, angle, 900, drake_constants, block_size=50)
+    expected = compare_standards(20.0, 2.0, direction - 30.0, 900, drake_constants)
+
+    assert result.cigre == pytest.approx(expected.cigre, rel=1e-12)
+    assert result.ieee == pytest.approx(expected.ieee, rel=1e-12)
@@ -0,0 +1,160 @@
+import tracemalloc
+
+import pytest
+import numpy as np
+
+from pylinerating import cigre601, engine, ieee738, nusselt, thermal_rating
+from pylinerating.conductor import drake_constants
+from pylinerating.workspace import Workspace, buffers
+
+rng = np.random.default_rng(3)
+
+shape = (40, 50)
+ambient = rng.uniform(-10, 40, shape)
+wind = rng.uniform(0, 15, shape)
+angle = rng.uniform(0, 360, shape)
+solar = rng.uniform(0, 1100, shape)
+elevation = np.linspace(0, 1500, shape[1])
+
+smooth = drake_constants._replace(stranded=False, high_rs=False)
+small_rs = drake_constants._replace(high_rs=False)
+
+
+@pytest.mark.parametrize("standard", ["cigre", "ieee"])
+@pytest.mark.parametrize("conductor", [drake_constants, smooth, small_rs])
+def test_workspace_gives_the_same_rating(standard, conductor):
+    args = (ambient, wind, angle, solar, conductor, 90.0, 10.0, elevation)
+    expected = thermal_rating(*args, standard=standard)
+
+    out = np.empty(shape)
+    rating = thermal_rating(*args, standard=standard, out=out, workspace=Workspace())
+
+    assert rating is out
+    assert rating == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("module", [cigre601, ieee738])
+def test_module_functions_with_out(module):
+    args = (ambient, wind, angle, solar, drake_constants, 90.0, 10.0, elevation)
+    expected = module.thermal_rating(*args)
+
+    out = np.empty(shape)
+    assert module.thermal_rating(*args, out=out) is out
+    assert out == pytest.approx(expected)
+
+    out = np.empty(shape)
+    rating = module.thermal_rating(*args, out=out, workspace=Workspace())
+    assert rating == pytest.approx(expected, rel=1e-12)
+
+
+def test_components_with_out():
+    out = np.empty(shape)
+    workspace = Workspace()
+
+    cigre601.power_radiation(
+        ambient, drake_constants, 90.0, out=out, workspace=workspace
+    )
+    assert out == pytest.approx(
+        cigre601.power_radiation(ambient, drake_constants, 90.0)
+    )
+
+    ieee738.radiated_heat_loss(
+        ambient, drake_constants, 90.0, out=out, workspace=workspace
+    )
+    assert out == pytest.approx(
+        ieee738.radiated_heat_loss(ambient, drake_constants, 90.0)
+    )
+
+    cigre601.power_solar(solar, drake_constants, out=out)
+    assert out == pytest.approx(cigre601.power_solar(solar, drake_constants))
+
+
+@pytest.mark.parametrize("function", list(nusselt.FORCED_REGIMES))
+def test_nusselt_numbers_in_place(function):
+    reynolds = np.exp(rng.uniform(np.log(100), np.log(300000), shape))
+    folded = rng.uniform(0, 90, shape[1])
+    expected = function(reynolds, folded)
+
+    out = np.empty(shape)
+    buffer = buffers(Workspace(), "nusselt.", shape)
+
+    assert function(reynolds, folded, out=out, buffer=buffer) is out
+    assert out == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("standard", ["cigre", "ieee"])
+def test_steady_state_cycle_does_not_allocate(standard):
+    large = (400, 500)
+    args = (
+        rng.uniform(-10, 40, large),
+        rng.uniform(0, 15, large),
+        rng.uniform(0, 360, large),
+        rng.uniform(0, 1100, large),
+        drake_constants,
+        90.0,
+        10.0,
+        np.linspace(0, 1500, large[1]),
+    )
+    out = np.empty(large)
+    workspace = Workspace()
+
+    thermal_rating(*args, standard=standard, out=out, workspace=workspace)
+    allocations = workspace.allocations
+
+    tracemalloc.start()
+    try:
+        thermal_rating(*args, standard=standard, out=out, workspace=workspace)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert workspace.allocations == allocations
+    # Well below the size of a single array of the shape
+    assert peak < out.nbytes / 4
+
+
+def test_engines_without_in_place_cooling():
+    class NoWindEngine(engine.RatingEngine):
+        name = "no-wind"
+
+        def cooling(self, prepared):
+            cigre = engine.get_engine("cigre")
+            return cigre.cooling(prepared._replace(wind_speed=0.0))
+
+    prepared = engine.prepare_inputs(ambient, wind, angle, solar, drake_constants)
+    rating = NoWindEngine().thermal_rating(
+        prepared, out=np.empty(shape), workspace=Workspace()
+    )
+
+    assert rating == pytest.approx(
+        thermal_rating(ambient, 0.0, angle, solar, drake_constants)
+    )
+
+
+@pytest.mark.parametrize("standard", ["cigre", "ieee"])
+def test_terms_have_the_shapes_of_their_inputs(standard):
+    spans, times = 30, 40
+    per_span = (rng.uniform(60, 100, (spans, 1)), 0.0, rng.uniform(0, 1500, (spans, 1)))
+    weather = [
+        rng.uniform(low, high, (1, times))
+        for low, high in [(-10, 40), (0, 15), (0, 360), (0, 1100)]
+    ]
+
+    workspace = Workspace()
+    rating = thermal_rating(
+        *weather, drake_constants, *per_span, standard=standard, workspace=workspace
+    )
+    expected = thermal_rating(*weather, drake_constants, *per_span, standard=standard)
+
+    assert rating == pytest.approx(expected, rel=1e-12)
+
+    # The same weather at the full shape needs more buffers
+    full = Workspace()
+    thermal_rating(
+        *[np.broadcast_to(value, (spans, times)) for value in weather],
+        drake_constants,
+        *[np.broadcast_to(value, (spans, times)) for value in per_span],
+        standard=standard,
+        workspace=full,
+    )
+    assert workspace.nbytes < 0.75 * full.nbytes